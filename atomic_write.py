@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Escrita atômica e "preguiçosa" para tudo que o bot/editor gera.
+
+- Atômica: escreve num temporário na mesma pasta, faz fsync e renomeia por
+  cima do destino. Um job morto no meio nunca deixa posts.json truncado.
+- Preguiçosa: se o conteúdo novo é igual ao que está em disco, nada é escrito
+  (mtime intacto, `git status` limpo).
+- Em lote: dentro de `with atomic_write.lote():` as escritas, appends,
+  remoções e movimentos ficam pendentes e só vão para o disco no fim do
+  bloco, todos juntos (primeiro todos os temporários são gravados e
+  sincronizados, depois os renames, os appends e por fim as remoções). Se o
+  bloco levantar exceção, nada é aplicado. Leituras feitas via
+  `ler_texto`/`existe` enxergam o que está pendente.
+
+`caminhos_alterados()` lista tudo que foi realmente escrito (ou apagado/movido
+com `remover`/`mover`, ou estendido com `acrescentar`) no processo; `marca()`
+permite pedir só o que mudou depois de um ponto (o git_publish commita só
+isso, sem varrer a árvore). Com ATOMIC_WRITE_JOURNAL apontando para um
+arquivo, cada caminho alterado também é acrescentado nele (caminho absoluto,
+um por linha), para que outro processo (o passo de commit do workflow)
+saiba o que publicar mesmo se este morrer.
+"""
+
+import json
+import os
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator
+
+_lotes: list["Lote"] = []
+# caminho -> número da última alteração (ver marca())
+_alterados: dict[str, int] = {}
+_contador = 0
+
+DIARIO_ENV = "ATOMIC_WRITE_JOURNAL"
+
+
+def _registrar(caminho: Path) -> None:
+    global _contador
+    _contador += 1
+    _alterados[caminho.as_posix()] = _contador
+    diario = os.getenv(DIARIO_ENV)
+    if diario:
+        with open(diario, "a", encoding="utf-8") as f:
+            f.write(os.path.abspath(caminho) + "\n")
+
+
+def _mesmo_conteudo(caminho: Path, dados: bytes) -> bool:
+    try:
+        if caminho.stat().st_size != len(dados):
+            return False
+    except FileNotFoundError:
+        return False
+    return caminho.read_bytes() == dados
+
+
+def _gravar_temporario(caminho: Path, dados: bytes) -> str:
+    caminho.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=caminho.parent, prefix=f".{caminho.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(dados)
+            f.flush()
+            os.fsync(f.fileno())
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+    return tmp
+
+
+def _acrescentar_em_disco(caminho: Path, dados: bytes) -> None:
+    caminho.parent.mkdir(parents=True, exist_ok=True)
+    with open(caminho, "ab") as f:
+        f.write(dados)
+    _registrar(caminho)
+
+
+class Lote:
+    """Escritas, appends e remoções pendentes aplicados juntos em `aplicar()`."""
+
+    def __init__(self) -> None:
+        self.pendentes: dict[Path, bytes] = {}
+        self.acrescimos: dict[Path, bytes] = {}
+        self.removidos: set[Path] = set()
+
+    def escrever_bytes(self, caminho: Path, dados: bytes) -> bool:
+        self.removidos.discard(caminho)
+        self.acrescimos.pop(caminho, None)
+        atual = self.pendentes.get(caminho)
+        if atual is not None and atual == dados:
+            return False
+        if atual is None and _mesmo_conteudo(caminho, dados):
+            return False
+        self.pendentes[caminho] = dados
+        return True
+
+    def acrescentar(self, caminho: Path, dados: bytes) -> None:
+        if caminho in self.pendentes:
+            self.pendentes[caminho] += dados
+        elif caminho in self.removidos:
+            self.removidos.discard(caminho)
+            self.pendentes[caminho] = dados
+        else:
+            self.acrescimos[caminho] = self.acrescimos.get(caminho, b"") + dados
+
+    def remover(self, caminho: Path) -> bool:
+        existia = (
+            self.pendentes.pop(caminho, None) is not None
+            or self.acrescimos.pop(caminho, None) is not None
+            or (caminho not in self.removidos and caminho.exists())
+        )
+        if caminho.exists():
+            self.removidos.add(caminho)
+        return existia
+
+    def aplicar(self) -> list[str]:
+        temporarios: list[tuple[str, Path]] = []
+        try:
+            for caminho, dados in self.pendentes.items():
+                if not _mesmo_conteudo(caminho, dados):
+                    temporarios.append((_gravar_temporario(caminho, dados), caminho))
+        except BaseException:
+            for tmp, _ in temporarios:
+                Path(tmp).unlink(missing_ok=True)
+            raise
+        # ponto de commit: todos os temporários já estão no disco
+        for tmp, caminho in temporarios:
+            os.replace(tmp, caminho)
+            _registrar(caminho)
+        for caminho, dados in self.acrescimos.items():
+            _acrescentar_em_disco(caminho, dados)
+        removidos = []
+        for caminho in sorted(self.removidos):
+            try:
+                caminho.unlink()
+            except FileNotFoundError:
+                continue
+            _registrar(caminho)
+            removidos.append(caminho)
+        acrescidos = list(self.acrescimos)
+        self.pendentes.clear()
+        self.acrescimos.clear()
+        self.removidos.clear()
+        return [caminho.as_posix() for caminho in [*(c for _, c in temporarios), *acrescidos, *removidos]]
+
+
+@contextmanager
+def lote() -> Iterator[Lote]:
+    """Agrupa as escritas do bloco num único ponto de commit (blocos aninhados usam o lote de fora)."""
+    if _lotes:
+        yield _lotes[-1]
+        return
+    atual = Lote()
+    _lotes.append(atual)
+    try:
+        yield atual
+    except BaseException:
+        _lotes.pop()
+        raise
+    _lotes.pop()
+    atual.aplicar()
+
+
+def escrever_bytes(caminho: str | Path, dados: bytes) -> bool:
+    """Escreve `dados` em `caminho` se mudou. Retorna True se houve (ou haverá, em lote) escrita."""
+    caminho = Path(caminho)
+    if _lotes:
+        return _lotes[-1].escrever_bytes(caminho, dados)
+    if _mesmo_conteudo(caminho, dados):
+        return False
+    os.replace(_gravar_temporario(caminho, dados), caminho)
+    _registrar(caminho)
+    return True
+
+
+def escrever_texto(caminho: str | Path, texto: str) -> bool:
+    return escrever_bytes(caminho, texto.encode("utf-8"))
+
+
+def escrever_json(caminho: str | Path, obj: Any, **kwargs: Any) -> bool:
+    return escrever_texto(caminho, json.dumps(obj, **kwargs))
+
+
+def acrescentar(caminho: str | Path, texto: str) -> None:
+    """Acrescenta `texto` ao fim de `caminho` (logs .jsonl) e registra o caminho como alterado.
+
+    É um append comum, sem reescrever o arquivo; em lote, fica pendente e é
+    feito depois dos renames do fim do bloco.
+    """
+    caminho = Path(caminho)
+    if _lotes:
+        _lotes[-1].acrescentar(caminho, texto.encode("utf-8"))
+        return
+    _acrescentar_em_disco(caminho, texto.encode("utf-8"))
+
+
+def ler_bytes(caminho: str | Path) -> bytes | None:
+    """Conteúdo atual de `caminho`, considerando escritas pendentes do lote; None se não existe."""
+    caminho = Path(caminho)
+    for atual in reversed(_lotes):
+        if caminho in atual.pendentes:
+            return atual.pendentes[caminho]
+        if caminho in atual.removidos:
+            return None
+        if caminho in atual.acrescimos:
+            try:
+                return caminho.read_bytes() + atual.acrescimos[caminho]
+            except FileNotFoundError:
+                return atual.acrescimos[caminho]
+    try:
+        return caminho.read_bytes()
+    except FileNotFoundError:
+        return None
+
+
+def existe(caminho: str | Path) -> bool:
+    """True se `caminho` existe em disco (e não tem remoção pendente) ou tem escrita pendente no lote."""
+    caminho = Path(caminho)
+    for atual in reversed(_lotes):
+        if caminho in atual.pendentes or caminho in atual.acrescimos:
+            return True
+        if caminho in atual.removidos:
+            return False
+    return caminho.exists()
+
+
+def ler_texto(caminho: str | Path) -> str | None:
+    dados = ler_bytes(caminho)
+    return dados.decode("utf-8") if dados is not None else None
+
+
+def remover(caminho: str | Path) -> bool:
+    """Apaga `caminho` (em lote, só no fim do bloco, junto com as escritas). Retorna True se existia."""
+    caminho = Path(caminho)
+    if _lotes:
+        return _lotes[-1].remover(caminho)
+    try:
+        caminho.unlink()
+    except FileNotFoundError:
+        return False
+    _registrar(caminho)
+    return True
+
+
+def mover(origem: str | Path, destino: str | Path) -> None:
+    """Renomeia `origem` para `destino` (registra os dois caminhos como alterados).
+
+    Em lote vira escrita de `destino` + remoção de `origem`, aplicadas no fim do bloco.
+    """
+    origem, destino = Path(origem), Path(destino)
+    if _lotes:
+        dados = ler_bytes(origem)
+        if dados is None:
+            raise FileNotFoundError(origem)
+        _lotes[-1].escrever_bytes(destino, dados)
+        _lotes[-1].remover(origem)
+        return
+    destino.parent.mkdir(parents=True, exist_ok=True)
+    os.replace(origem, destino)
+    _registrar(origem)
+    _registrar(destino)
+
+
+def marca() -> int:
+    """Ponto de referência para `caminhos_alterados(desde=...)`."""
+    return _contador
+
+
+def caminhos_alterados(desde: int = 0) -> list[str]:
+    """Arquivos escritos, apagados ou movidos por este processo depois de `desde` (ordem alfabética)."""
+    return sorted(c for c, n in _alterados.items() if n > desde)
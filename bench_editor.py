@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Benchmark da edição de posts do editor com uma amostra de posts/.
+
+Para cada post da amostra simula a edição completa do editor_bot (ler título,
+imagem e texto, corrigir o título e trocar o conteúdo) e mede a latência por
+post:
+
+- antes: extrair_texto_post_html + substituir_conteudo_html duas vezes
+  (três parses do mesmo HTML e uma serialização intermediária);
+- depois: SessaoEdicao (um parse, uma serialização no fim).
+
+Uso: python bench_editor.py [tamanho_amostra]   (padrão: 200)
+"""
+
+import os
+import re
+import statistics
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault('GROQ_API_KEY', 'bench')
+
+from bs4 import BeautifulSoup
+
+import editor_bot
+
+
+def extrair_antigo(html):
+    """Cópia do extrator anterior (um parse só para ler)."""
+    soup = BeautifulSoup(html, 'html.parser')
+    h1 = soup.find('h1')
+    titulo = h1.get_text(' ', strip=True) if h1 else ''
+    img = soup.find('img', class_='post-principal-imagem')
+    img_src = img.get('src', '') if img else ''
+    conteudo = soup.find(class_='post-conteudo')
+    texto = conteudo.get_text('\n\n', strip=True) if conteudo else soup.get_text('\n\n', strip=True)
+    return titulo, img_src, texto
+
+
+def substituir_antigo(html, novo_titulo, novo_conteudo_html):
+    """Cópia do substituir_conteudo_html anterior (parse + serialização por chamada)."""
+    soup = BeautifulSoup(html, 'html.parser')
+    if novo_titulo:
+        h1 = soup.find('h1', class_='post-titulo') or soup.find('h1')
+        if h1:
+            h1.string = novo_titulo
+        title_tag = soup.find('title')
+        if title_tag:
+            title_tag.string = f'{novo_titulo} - Vivimundo'
+        ogt = soup.find('meta', property='og:title')
+        if ogt:
+            ogt['content'] = novo_titulo
+    if novo_conteudo_html:
+        container = soup.find(class_='post-conteudo')
+        if container:
+            container.clear()
+            frag = BeautifulSoup(novo_conteudo_html, 'html.parser')
+            for el in frag.contents:
+                container.append(el)
+    return str(soup)
+
+
+def editar_antigo(html):
+    titulo, _img, texto = extrair_antigo(html)
+    html = substituir_antigo(html, titulo + ' (editado)', None)
+    return substituir_antigo(html, None, editor_bot.formatar_em_paragrafos_html(texto))
+
+
+def editar_novo(html):
+    sessao = editor_bot.SessaoEdicao(html)
+    titulo, _img, texto = sessao.titulo, sessao.imagem, sessao.texto
+    sessao.definir_titulo(titulo + ' (editado)')
+    sessao.definir_conteudo(editor_bot.formatar_em_paragrafos_html(texto))
+    return sessao.html()
+
+
+def medir(func, htmls):
+    tempos, saidas = [], []
+    for html in htmls:
+        inicio = time.perf_counter()
+        saidas.append(func(html))
+        tempos.append((time.perf_counter() - inicio) * 1000)
+    return tempos, saidas
+
+
+def resumo(tempos):
+    ordenados = sorted(tempos)
+    p95 = ordenados[min(len(ordenados) - 1, int(len(ordenados) * 0.95))]
+    return f'média {statistics.mean(tempos):6.2f} ms | p50 {statistics.median(tempos):6.2f} ms | p95 {p95:6.2f} ms'
+
+
+def main():
+    tamanho = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    arquivos = sorted(p for p in Path('posts').glob('*.html'))
+    passo = max(1, len(arquivos) // tamanho)
+    htmls = [p.read_text(encoding='utf-8', errors='ignore') for p in arquivos[::passo][:tamanho]]
+
+    t_antigo, s_antigo = medir(editar_antigo, htmls)
+    t_novo, s_novo = medir(editar_novo, htmls)
+    # o append antigo pulava os nós de texto entre parágrafos (iterava a lista que ele mesmo esvaziava)
+    sem_espacos = lambda h: re.sub(r'>\s+<', '><', h)  # noqa: E731
+    iguais = sum(sem_espacos(a) == sem_espacos(b) for a, b in zip(s_antigo, s_novo))
+
+    print(f'Posts: {len(htmls)} (1 a cada {passo} de posts/) | saídas equivalentes: {iguais}/{len(htmls)}')
+    print(f'  antes (3 parses):   {resumo(t_antigo)}')
+    print(f'  depois (1 parse):   {resumo(t_novo)}')
+    print(f'  ganho: {statistics.mean(t_antigo) / statistics.mean(t_novo):.1f}x')
+
+
+if __name__ == '__main__':
+    main()
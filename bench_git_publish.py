@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Benchmark do passo de git: `git status` + `git add .` + commit contra o git_publish.
+
+Cria repositórios temporários com N posts sintéticos (mais um JSON grande,
+como o posts.json) já commitados e, para cada tamanho, simula a publicação
+de um post (o HTML novo + listagens + JSONs de estado) medindo:
+
+- antes: git status --porcelain, git add . e git commit (varrem a árvore);
+- depois: git_publish.publicar() com os caminhos registrados pelo atomic_write.
+
+Melhor de REPETICOES publicações por tamanho.
+
+Uso: python bench_git_publish.py [tamanhos...]   (padrão: 1000 5000 20000)
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import atomic_write
+import git_publish
+
+# melhor de N publicações por tamanho
+REPETICOES = 3
+
+HTML = '<html><body>' + '<p>Texto de matéria sintética para o benchmark do git.</p>' * 40 + '</body></html>'
+
+
+def git(*args):
+    subprocess.run(['git', *args], check=True, capture_output=True)
+
+
+def acervo(n):
+    git('init', '-q')
+    git('config', 'user.name', 'Bench')
+    git('config', 'user.email', 'bench@vivimundo.com')
+    Path('posts').mkdir()
+    for i in range(n):
+        Path(f'posts/post-{i:06d}.html').write_text(HTML, encoding='utf-8')
+    Path('posts.json').write_text(json.dumps([{'url': f'posts/post-{i:06d}.html', 'titulo': 'x' * 80} for i in range(n)]))
+    git('add', '.')
+    git('commit', '-q', '-m', 'acervo')
+
+
+def escrever_post(k):
+    """O que uma execução do publicador escreve: o post, capa, categoria e estado."""
+    atomic_write.escrever_texto(f'posts/novo-{k}.html', HTML + str(k))
+    atomic_write.escrever_texto('index.html', f'capa {k}')
+    atomic_write.escrever_texto('categoria-esportes.html', f'categoria {k}')
+    atomic_write.escrever_json('bot_state.json', {'total_posts': k})
+    atomic_write.escrever_json('articles_cache.json', {'urls': list(range(k))})
+
+
+def cronometrar(func):
+    inicio = time.perf_counter()
+    func()
+    return time.perf_counter() - inicio
+
+
+def medir(n):
+    acervo(n)
+
+    def antes():
+        subprocess.run(['git', 'status', '--porcelain'], capture_output=True)
+        git('add', '.')
+        git('commit', '-q', '-m', 'antes')
+
+    t_antes, t_depois = [], []
+    for k in range(REPETICOES):
+        escrever_post(2 * k)
+        t_antes.append(cronometrar(antes))
+        git_publish._publicado_ate = atomic_write.marca()
+        escrever_post(2 * k + 1)
+        t_depois.append(cronometrar(lambda: git_publish.publicar('depois')))
+    return min(t_antes), min(t_depois)
+
+
+def main():
+    tamanhos = [int(a) for a in sys.argv[1:]] or [1000, 5000, 20000]
+    print(f"{'posts':>7} {'status+add+commit':>18} {'git_publish':>12}")
+    for n in tamanhos:
+        cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as tmp:
+            os.chdir(tmp)
+            try:
+                t_antes, t_depois = medir(n)
+            finally:
+                os.chdir(cwd)
+        print(f'{n:>7} {t_antes * 1000:>16.0f}ms {t_depois * 1000:>10.0f}ms')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Orçamento de tempo de import de cada ponto de entrada (python -X importtime).
+
+Importa cada módulo num processo novo (sem GROQ_API_KEY, para provar que o
+import não depende dela nem sai do processo), lê o tempo acumulado do módulo
+na saída do -X importtime (melhor de N execuções, sem contar a inicialização
+do interpretador) e compara com ORCAMENTOS_MS. Também confere que os módulos
+leves não puxam dependências pesadas (requests, bs4) no import.
+
+Uso: python bench_import.py [repeticoes]
+"""
+
+import os
+import subprocess
+import sys
+
+# módulo -> orçamento (ms, tempo acumulado do import)
+ORCAMENTOS_MS = {
+    'bot': 200,
+    'editor_bot': 250,
+    'rebuild': 80,
+    'thumbnails': 30,
+    'static_output': 25,
+    'editor_report': 15,
+    'post_store': 15,
+    'site_pages': 40,
+    'post_text': 15,
+    'temas': 5,
+    'http_session': 5,
+    'tema_scheduler': 25,
+    'candidate_queue': 20,
+    'git_publish': 15,
+    'daemon': 300,
+}
+
+# módulos que não podem carregar estas dependências só por serem importados
+PROIBIDOS = {
+    'site_pages': ('requests', 'bs4', 'llm_router'),
+    'post_text': ('requests', 'bs4'),
+    'temas': ('requests', 'bs4'),
+    'thumbnails': ('requests', 'bs4'),
+    'editor_report': ('requests', 'bs4'),
+    'post_store': ('requests', 'bs4'),
+    'http_session': ('requests',),
+    'tema_scheduler': ('requests', 'bs4'),
+    'candidate_queue': ('requests', 'bs4'),
+    'git_publish': ('requests', 'bs4'),
+}
+
+
+def medir_import(modulo):
+    """(ms acumulados do import de `modulo`, nomes de todos os módulos carregados)"""
+    env = {k: v for k, v in os.environ.items() if k != 'GROQ_API_KEY'}
+    proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {modulo}'],
+                          capture_output=True, text=True, env=env)
+    if proc.returncode != 0:
+        raise RuntimeError(f'import {modulo} falhou: {proc.stderr.strip().splitlines()[-1:]}')
+    tempo = None
+    carregados = set()
+    for linha in proc.stderr.splitlines():
+        if not linha.startswith('import time:') or '|' not in linha:
+            continue
+        _, acumulado, nome = linha.split('|', 2)
+        nome = nome.strip()
+        carregados.add(nome)
+        if nome == modulo:
+            tempo = int(acumulado) / 1000
+    return tempo, carregados
+
+
+def main():
+    repeticoes = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    falhas = 0
+    print(f"{'módulo':<15} {'ms':>8} {'orçamento':>10}  (melhor de {repeticoes})")
+    for modulo, orcamento in ORCAMENTOS_MS.items():
+        melhor = float('inf')
+        for _ in range(repeticoes):
+            tempo, carregados = medir_import(modulo)
+            melhor = min(melhor, tempo)
+        indevidos = [m for m in PROIBIDOS.get(modulo, ()) if m in carregados]
+        ok = melhor <= orcamento and not indevidos
+        falhas += not ok
+        extra = f"  importa {', '.join(indevidos)}" if indevidos else ''
+        print(f"{modulo:<15} {melhor:8.1f} {orcamento:10d}  {'✅' if ok else '❌'}{extra}")
+    return 1 if falhas else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
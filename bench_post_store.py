@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Benchmark do post_store contra o posts.json monolítico.
+
+Gera acervos sintéticos (cópias dos posts reais com URLs novas e datas
+espalhadas por ~3000 posts/mês) e mede, para cada tamanho:
+
+- antes: json.load do posts.json + append + dump(indent=2) inteiro;
+- depois: abrir + todos() (leitura completa), abrir + adicionar + salvar()
+  (só o shard do mês e o índice) e uma consulta por categoria.
+
+Uso: python bench_post_store.py [tamanhos...]   (padrão: 1000 5000 20000 50000)
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import post_store
+
+POSTS_POR_MES = 3000
+
+
+def acervo(base, n):
+    inicio = datetime(2026, 4, 30) - timedelta(days=30 * n / POSTS_POR_MES)
+    passo = timedelta(days=30) / POSTS_POR_MES
+    posts = []
+    for i in range(n):
+        p = dict(base[i % len(base)])
+        p['url'] = f'posts/sintetico-{i:06d}.html'
+        p['data'] = (inicio + passo * i).strftime('%d/%m/%Y às %H:%M')
+        posts.append(p)
+    return posts
+
+
+def cronometrar(func):
+    inicio = time.perf_counter()
+    resultado = func()
+    return time.perf_counter() - inicio, resultado
+
+
+def medir(base, n):
+    posts = acervo(base, n)
+    novo = dict(posts[-1], url='posts/sintetico-novo.html')
+
+    def antes():
+        lista = json.loads(Path('posts.json').read_text(encoding='utf-8'))
+        lista.append(novo)
+        Path('posts.json').write_text(json.dumps(lista, ensure_ascii=False, indent=2), encoding='utf-8')
+
+    def adicionar():
+        store = post_store.abrir()
+        store.adicionar(dict(novo))
+        store.salvar()
+
+    Path('posts.json').write_text(json.dumps(posts, ensure_ascii=False, indent=2), encoding='utf-8')
+    t_antes, _ = cronometrar(antes)
+    post_store.migrar(posts).salvar()
+    t_todos, todos = cronometrar(lambda: post_store.abrir().todos())
+    t_adicionar, _ = cronometrar(adicionar)
+    t_consulta, achados = cronometrar(lambda: post_store.abrir().consultar(categoria='esportes', desde='2026-04-01'))
+    assert len(todos) == n
+    shard = max(Path('post_store').glob('*.jsonl'), key=lambda p: p.name).stat().st_size
+    print(f"{n:>7} | antes (load+append+dump): {t_antes * 1000:8.1f} ms ({Path('posts.json').stat().st_size / 1024:7.0f} KB reescritos)"
+          f" | store: todos {t_todos * 1000:7.1f} ms, adicionar+salvar {t_adicionar * 1000:6.1f} ms ({shard / 1024:5.0f} KB),"
+          f" esportes de abril {t_consulta * 1000:6.1f} ms ({len(achados)})")
+
+
+def main():
+    tamanhos = [int(a) for a in sys.argv[1:]] or [1000, 5000, 20000, 50000]
+    base = json.loads(Path('posts.json').read_text(encoding='utf-8'))
+    cwd = os.getcwd()
+    for n in tamanhos:
+        with tempfile.TemporaryDirectory() as tmp:
+            os.chdir(tmp)
+            try:
+                medir(base, n)
+            finally:
+                os.chdir(cwd)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Benchmark de renderização das listagens com o posts.json real.
+
+Compara o jeito antigo (f-string por card + `cards += ...`) com as templates
+pré-compiladas de site_templates (cards escritos num único stream), renderizando
+todos os posts numa página só — o pior caso, igual ao index antigo "sem limite".
+
+Uso: python bench_render.py [repeticoes]
+"""
+
+import json
+import sys
+import time
+from pathlib import Path
+
+import site_templates
+
+
+def renderizar_antigo(posts):
+    """Cópia do renderizador anterior (concatenação de strings por card)."""
+    cards = ""
+    for p in posts:
+        subcat_html = f'<span class="subcategoria">{p.get("subcategoria", "").replace("-"," ").title()}</span>' if p.get('subcategoria') else ''
+        cards += f"""<article class="post-card">
+<img src="{p['imagem']}" alt="{p['titulo']}">
+<div class="post-info">
+<span class="categoria categoria-{p['categoria']}">{p['categoria'].replace('-',' ').title()}</span>
+{subcat_html}
+<h2><a href="{p['url']}">{p['titulo']}</a></h2>
+<p class="meta">Por Kevin Ribeiro • {p['data']}</p>
+</div>
+</article>"""
+    return site_templates.LISTAGEM.render(titulo='Vivimundo - Portal de Notícias', raiz='', secao='Últimas Notícias',
+                                          cards=cards, paginacao='', carregador='')
+
+
+def renderizar_novo(posts):
+    return site_templates.LISTAGEM.render(titulo='Vivimundo - Portal de Notícias', raiz='', secao='Últimas Notícias',
+                                          cards=site_templates.cards(posts), paginacao='', carregador='')
+
+
+def medir(func, posts, repeticoes):
+    melhor = float('inf')
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        html = func(posts)
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return melhor, html
+
+
+def main():
+    repeticoes = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    posts = list(reversed(json.loads(Path('posts.json').read_text(encoding='utf-8'))))
+
+    t_antigo, html_antigo = medir(renderizar_antigo, posts, repeticoes)
+    t_novo, html_novo = medir(renderizar_novo, posts, repeticoes)
+
+    print(f"Posts: {len(posts)} | HTML: {len(html_novo.encode('utf-8')) / 1024:.0f} KB | melhor de {repeticoes}")
+    print(f"  antes (cards += f-string): {t_antigo * 1000:8.1f} ms")
+    print(f"  depois (template + stream): {t_novo * 1000:8.1f} ms")
+    print(f"  saída idêntica: {'sim' if html_antigo == html_novo else 'NÃO'}")
+    return 0 if html_antigo == html_novo else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -5,20 +5,28 @@ import os
 import sys
 import time
 import json
-import requests
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
 import subprocess
 import random
-from bs4 import BeautifulSoup
-import urllib3
 
-# Desabilitar SSL warnings
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-
-sys.stdout.reconfigure(line_buffering=True, encoding='utf-8')
-sys.stderr.reconfigure(line_buffering=True, encoding='utf-8')
-os.environ['PYTHONIOENCODING'] = 'utf-8'
+import atomic_write
+import candidate_queue
+import git_publish
+import http_session
+import llm_router
+import post_index
+import post_sources
+import post_store
+import prompt_budget
+import site_pages
+import static_output
+import tema_scheduler
+import thumbnails
+from post_text import (avaliar_qualidade_materia, corrigir_espacamento, dividir_paragrafos, eh_titulo_valido,
+                       limpar_markdown, limpar_titulo, normalizar_titulo, normalizar_url, parece_portugues,
+                       remover_mencoes_de_fonte, remover_primeiro_paragrafo_se_repetir_titulo, titulo_similar)
+from temas import TEMAS
 
 def log(msg):
     print(msg, flush=True)
@@ -27,95 +35,71 @@ def log(msg):
 GROQ_API_KEY = os.getenv('GROQ_API_KEY')
 GITHUB_TOKEN = os.getenv('GITHUB_TOKEN')
 REPO_PATH = os.getenv('GITHUB_WORKSPACE', '.')
-if not GROQ_API_KEY:
-    log("❌ GROQ_API_KEY não encontrada!")
-    sys.exit(1)
+
+def configurar():
+    """Saída UTF-8 sem buffer, avisos de SSL desligados e GROQ_API_KEY obrigatória.
+
+    Só roda quando o bot é executado (não no import), para que testes e
+    outros módulos importem o bot sem sair do processo nem mexer no stdout.
+    """
+    sys.stdout.reconfigure(line_buffering=True, encoding='utf-8')
+    sys.stderr.reconfigure(line_buffering=True, encoding='utf-8')
+    os.environ['PYTHONIOENCODING'] = 'utf-8'
+
+    # Desabilitar SSL warnings
+    import urllib3
+    urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+    if not GROQ_API_KEY:
+        log("❌ GROQ_API_KEY não encontrada!")
+        sys.exit(1)
 
 # Arquivo para salvar estado
 STATE_FILE = Path(REPO_PATH) / "bot_state.json"
 ARTICLES_CACHE = Path(REPO_PATH) / "articles_cache.json"
 
+# (mtime_ns do arquivo, urls, titulos): num processo longo (daemon) o cache fica em
+# memória e só é relido se o arquivo mudar por fora (ex.: git pull)
+_cache_artigos = None
+
+def _mtime_cache_artigos():
+    try:
+        return ARTICLES_CACHE.stat().st_mtime_ns
+    except OSError:
+        return None
+
 def carregar_cache_artigos():
     """Carrega URLs e títulos já processados"""
-    if ARTICLES_CACHE.exists():
+    global _cache_artigos
+    mtime = _mtime_cache_artigos()
+    if _cache_artigos is not None and _cache_artigos[0] == mtime:
+        return _cache_artigos[1], _cache_artigos[2]
+    urls, titulos = set(), set()
+    if mtime is not None:
         with open(ARTICLES_CACHE, 'r') as f:
             data = json.load(f)
             if isinstance(data, dict):
-                return set(data.get('urls', [])), set(data.get('titulos', []))
-            # Compatibilidade com formato antigo (apenas URLs)
-            return set(data), set()
-    return set(), set()
+                urls, titulos = set(data.get('urls', [])), set(data.get('titulos', []))
+            else:
+                # Compatibilidade com formato antigo (apenas URLs)
+                urls = set(data)
+    _cache_artigos = (mtime, urls, titulos)
+    return urls, titulos
 
 def salvar_cache_artigos(urls, titulos):
     """Salva URLs e títulos processados"""
-    with open(ARTICLES_CACHE, 'w') as f:
-        json.dump({'urls': list(urls), 'titulos': list(titulos)}, f)
+    global _cache_artigos
+    atomic_write.escrever_json(ARTICLES_CACHE, {'urls': list(urls), 'titulos': list(titulos)})
+    # dentro de um lote() o arquivo só muda no fim: a próxima leitura recarrega do disco
+    _cache_artigos = (_mtime_cache_artigos(), urls, titulos)
+
+def marcar_processada(noticia):
+    """Marca a matéria no articles_cache (chamar no mesmo lote que grava o post ou a fila)"""
+    urls, titulos = carregar_cache_artigos()
+    urls.add(normalizar_url(noticia['url']))
+    titulos.add(normalizar_titulo(noticia['title']))
+    salvar_cache_artigos(urls, titulos)
 
-def normalizar_url(url):
-    """Normaliza URL para comparação consistente no cache"""
-    from urllib.parse import urlparse, urlunparse, parse_qs, urlencode
-    
-    # Converte para lowercase
-    url = url.lower().strip()
-    
-    # Remove trailing slash
-    if url.endswith('/'):
-        url = url[:-1]
-    
-    # Parse URL
-    parsed = urlparse(url)
-    
-    # Remove parâmetros de tracking comuns (utm_, fbclid, etc)
-    query_params = parse_qs(parsed.query)
-    params_limpos = {k: v for k, v in query_params.items() 
-                     if not k.startswith(('utm_', 'fbclid', 'gclid', 'ref'))}
-    
-    # Reconstrói query string ordenada
-    nova_query = urlencode(params_limpos, doseq=True) if params_limpos else ''
-    
-    # Reconstrói URL normalizada
-    return urlunparse((
-        parsed.scheme,
-        parsed.netloc,
-        parsed.path,
-        parsed.params,
-        nova_query,
-        ''  # Remove fragmento (#)
-    ))
-
-def normalizar_titulo(titulo):
-    """Normaliza título para detecção de duplicatas"""
-    import re
-    # Remove espaços extras, converte para lowercase
-    titulo = titulo.lower().strip()
-    # Remove pontuação
-    titulo = re.sub(r'[^\w\s]', '', titulo)
-    # Remove espaços múltiplos
-    titulo = re.sub(r'\s+', ' ', titulo)
-    return titulo
-
-def titulo_similar(titulo_novo, titulos_existentes, limiar=0.65):
-    """Verifica se um título é similar a algum já existente usando comparação de palavras.
-    Retorna True se encontrar um título com similaridade >= limiar (0.65 = 65%)."""
-    palavras_novo = set(normalizar_titulo(titulo_novo).split())
-    if len(palavras_novo) < 3:
-        return False
-    
-    for titulo_existente in titulos_existentes:
-        palavras_existente = set(titulo_existente.split())
-        if len(palavras_existente) < 3:
-            continue
-        
-        # Calcula similaridade de Jaccard (interseção / união)
-        intersecao = palavras_novo & palavras_existente
-        uniao = palavras_novo | palavras_existente
-        similaridade = len(intersecao) / len(uniao) if uniao else 0
-        
-        if similaridade >= limiar:
-            log(f"  🔄 Título similar ({similaridade:.0%}): {titulo_novo[:50]}...")
-            return True
-    
-    return False
 
 def eh_imagem_valida(img_url):
     """Verifica se a URL da imagem é real (não é placeholder, logo, etc)"""
@@ -170,65 +154,25 @@ def eh_imagem_valida(img_url):
 
 
 def carregar_estado():
-    """Carrega o índice do último tema executado"""
+    """Carrega o número de posts já publicados (o tema vem do tema_scheduler)"""
     if STATE_FILE.exists():
         with open(STATE_FILE, 'r') as f:
             state = json.load(f)
-            return state.get('tema_idx', 0), state.get('total_posts', 0)
-    return 0, 0
-
-def salvar_estado(tema_idx, total_posts):
-    """Salva o índice do tema para próxima execução"""
-    with open(STATE_FILE, 'w') as f:
-        json.dump({'tema_idx': tema_idx, 'total_posts': total_posts}, f)
-
-TEMAS = [
-    {"nome": "Esportes", "categoria": "esportes", "sites": [
-        "https://ge.globo.com/", "https://www.espn.com.br/", "https://www.uol.com.br/esporte/",
-        "https://www.espn.com.br/futebol/", "https://www.grandepremio.com.br/",
-        "https://www.lance.com.br/", "https://www.gazetaesportiva.com/",
-    ]},
-    {"nome": "Entretenimento", "categoria": "entretenimento", "sites": [
-        "https://www.omelete.com.br/", "https://www.tecmundo.com.br/cultura",
-        "https://noticiasdocinema.com.br/", "https://www.adorocinema.com/",
-        "https://www.papelpop.com/", "https://rollingstone.com.br/",
-    ]},
-    {"nome": "Tecnologia", "categoria": "tecnologia", "sites": [
-        "https://www.tecmundo.com.br/", "https://olhardigital.com.br/",
-        "https://www.hardware.com.br/", "https://tecnoblog.net/",
-        "https://canaltech.com.br/", "https://www.tudocelular.com/",
-    ]},
-    {"nome": "Videogames", "categoria": "videogames", "sites": [
-        "https://www.gamerant.com/", "https://br.ign.com/",
-        "https://www.thegamer.com.br/", "https://www.tecmundo.com.br/voxel",
-        "https://www.theenemy.com.br/",
-    ]},
-    {"nome": "Política Nacional", "categoria": "politica-nacional", "sites": [
-        "https://g1.globo.com/politica/", "https://noticias.uol.com.br/politica/",
-        "https://www.poder360.com.br/", "https://www.cnnbrasil.com.br/politica/",
-        "https://www.cartacapital.com.br/politica/",
-    ]},
-    {"nome": "Política Internacional", "categoria": "politica-internacional", "sites": [
-        "https://g1.globo.com/mundo/", "https://www.bbc.com/portuguese/internacional",
-        "https://noticias.uol.com.br/internacional/", "https://hojenomundomilitar.com.br/",
-        "https://www.cnnbrasil.com.br/internacional/",
-    ]},
-    {"nome": "Rio de Janeiro", "categoria": "rio-de-janeiro", "sites": [
-        "https://g1.globo.com/rj/rio-de-janeiro/", "https://odia.ig.com.br/",
-        "https://diariodorio.com/", "https://www.band.uol.com.br/band-news-fm/rio",
-        "https://extra.globo.com/noticias/rio/",
-    ]},
-    {"nome": "São Paulo", "categoria": "sao-paulo", "sites": [
-        "https://g1.globo.com/sp/sao-paulo/", "https://www.band.uol.com.br/band-news-fm/sp",
-        "https://noticias.r7.com/sao-paulo/", "https://agora.folha.uol.com.br/sao-paulo/",
-    ]},
-]
+            return state.get('total_posts', 0)
+    return 0
+
+def salvar_estado(total_posts):
+    """Salva o número de posts para a próxima execução"""
+    atomic_write.escrever_json(STATE_FILE, {'total_posts': total_posts})
 
 
 HEADERS = {
     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
 }
 
+# Tempo máximo (s) gasto abastecendo a fila de candidatos depois de publicar
+ORCAMENTO_ABASTECER_S = 90
+
 def setup_repo():
     try:
         log("📂 Configurando Git...")
@@ -238,7 +182,9 @@ def setup_repo():
             repo_url = f'https://{GITHUB_TOKEN}@github.com/Chriscodef/Vivimundo-blog.git'
             subprocess.run(['git', 'remote', 'remove', 'origin'], capture_output=True)
             subprocess.run(['git', 'remote', 'add', 'origin', repo_url], check=True, capture_output=True)
-        subprocess.run(['git', 'pull', 'origin', 'main', '--rebase'], check=False)
+        # No GitHub Actions o checkout acabou de ser feito: pull seria só uma volta a mais no remoto
+        if os.getenv('GITHUB_ACTIONS') != 'true':
+            subprocess.run(['git', 'pull', 'origin', 'main', '--rebase'], check=False)
         log("✅ Git OK")
         return True
     except Exception as e:
@@ -266,142 +212,66 @@ def extrair_imagem_meta(soup, url):
         pass
     return None
 
-def limpar_titulo(titulo):
-    """Limpa títulos com palavras grudadas (ex: 'JacksonVeja' -> 'Jackson Veja')"""
-    import re
-    
-    # Padrão 1: letra minúscula seguida de maiúscula (ex: "jacksonVeja")
-    titulo = re.sub(r'([a-zà-ú])([A-ZÀ-Ú])', r'\1 \2', titulo)
-    
-    # Padrão 2: pontuação seguida de letra sem espaço (ex: "AÍ!Baldur's", "ok.Veja")
-    titulo = re.sub(r'([!?:.\)\]])([A-ZÀ-Úa-zà-ú])', r'\1 \2', titulo)
-    
-    # Padrão 3: palavra completamente maiúscula seguida de palavra capitalizada (ex: "HPComo")
-    titulo = re.sub(r'([A-ZÀ-Ú]{2,})([A-ZÀ-Ú][a-zà-ú])', r'\1 \2', titulo)
-    
-    # Padrão 4: dígito seguido de letra maiúscula sem espaço (ex: "9Ganha")
-    titulo = re.sub(r'(\d)([A-ZÀ-Ú])', r'\1 \2', titulo)
-    
-    # Padrão 5: letra seguida de dígito colado em contexto estranho (ex: "veja3motivos")
-    titulo = re.sub(r'([a-zà-ú])(\d+)([A-ZÀ-Ú])', r'\1 \2 \3', titulo)
-    
-    # Padrão 6: fecha aspas/parênteses colado em próxima palavra
-    titulo = re.sub(r'(["\'»])([A-ZÀ-Úa-zà-ú])', r'\1 \2', titulo)
-    
-    # Remove espaços múltiplos
-    titulo = re.sub(r'\s+', ' ', titulo)
-    
-    return titulo.strip()
-
-def eh_titulo_valido(titulo):
-    """Valida se o título é real (não é número de telefone, sequência, etc)"""
-    import re
-    # Remove espaços extras
-    titulo = titulo.strip()
-    
-    # Muito curto ou longo
-    if len(titulo) < 20 or len(titulo) > 250:
-        log(f"  🚫 Título rejeitado (tamanho {len(titulo)}): {titulo[:60]}...")
-        return False
-    
-    # Parece número de telefone ou ID
-    if titulo.replace('-', '').replace('(', '').replace(')', '').isdigit():
-        return False
-    
-    # Muitos números (telefone, CEP, etc)
-    num_count = sum(1 for c in titulo if c.isdigit())
-    if num_count > len(titulo) * 0.3:  # Mais de 30% números
-        return False
-    
-    # Palavras válidas mínimas (não é só números e símbolos)
-    palavras = [p for p in titulo.split() if len(p) > 2 and not p.isdigit()]
-    if len(palavras) < 3:  # Menos de 3 palavras válidas
-        log(f"  🚫 Título rejeitado (poucas palavras): {titulo[:60]}...")
-        return False
-    
-    # Rejeita títulos genéricos de seção (não são notícias reais)
-    titulo_lower = titulo.lower()
-    palavras_secao = [
-        'advance', 'latest', 'more', 'daily', 'special', 'featured',
-        'esportes a motor', 'game rant', 'puzzles and games',
-        'trending', 'popular', 'recommended', 'breaking',
-        'read more', 'see more', 'leia mais', 'veja mais', 'saiba mais',
-        'menu principal', 'navegação', 'buscar', 'pesquisar',
-        'home', 'início', 'voltar', 'anterior', 'próximo',
-        'cookies', 'privacidade', 'termos de uso',
-        'sign in', 'sign up', 'subscribe', 'follow us',
-        'all rights reserved', 'todos os direitos',
-        'notícias recentes', 'mais lidas', 'mais populares',
-        'editor picks', 'top stories', 'highlights',
-        'the gamer', 'ign brasil', 'tecmundo', 'olhar digital',
-        'game reviews', 'movie reviews', 'tv reviews',
-        'about us', 'contact us', 'advertise',
-    ]
-    for palavra in palavras_secao:
-        if titulo_lower == palavra or titulo_lower.startswith(palavra + ' ') or titulo_lower.endswith(' ' + palavra):
-            log(f"  🚫 Título rejeitado (seção genérica): {titulo[:60]}...")
-            return False
-        # Rejeita se o título inteiro é basicamente a palavra de seção
-        if palavra in titulo_lower and len(titulo) < len(palavra) + 15:
-            log(f"  🚫 Título rejeitado (seção genérica curta): {titulo[:60]}...")
-            return False
-    
-    # Rejeita títulos que são apenas nomes de categorias/seções do site
-    titulos_exatos_bloqueados = [
-        'esportes', 'entretenimento', 'tecnologia', 'videogames', 'games',
-        'política', 'economia', 'mundo', 'brasil', 'cultura', 'ciência',
-        'saúde', 'educação', 'opinião', 'editorial', 'colunistas',
-        'esportes a motor', 'automobilismo', 'futebol', 'basquete',
-        'game rant advance', 'ign recommends', 'editor choice',
-    ]
-    if titulo_lower in titulos_exatos_bloqueados:
-        log(f"  🚫 Título rejeitado (nome de categoria): {titulo[:60]}...")
-        return False
-    
-    # Rejeita títulos muito curtos com poucas palavras significativas (provavelmente categorias)
-    palavras_significativas = [p for p in titulo.split() if len(p) > 3 and p.isalpha()]
-    if len(palavras_significativas) < 4:
-        # Verifica se parece uma categoria (sem verbos de ação)
-        verbos_acao = ['ganha', 'lança', 'confirma', 'aprova', 'revela', 'anuncia',
-                       'chega', 'vence', 'perde', 'encontra', 'descobre', 'morre',
-                       'nasce', 'cresce', 'cai', 'sobe', 'muda', 'fica', 'vai', 'vem',
-                       'diz', 'afirma', 'declara', 'promete', 'nega', 'acusa',
-                       'mostra', 'apresenta', 'estreia', 'lança', 'recebe',
-                       'wins', 'loses', 'announces', 'reveals', 'launches', 'gets',
-                       'shows', 'confirms', 'releases', 'updates', 'adds',
-                       'pode', 'deve', 'será', 'está', 'foi', 'tem', 'faz',
-                       'volta', 'entra', 'sai', 'abre', 'fecha', 'inicia',
-                       'atinge', 'supera', 'bate', 'quebra', 'alcança']
-        tem_verbo = any(verbo in titulo_lower for verbo in verbos_acao)
-        if not tem_verbo:
-            log(f"  🚫 Título rejeitado (sem verbo de ação): {titulo[:60]}...")
-            return False
-    
-    # Rejeita títulos que parecem ser menus ou listas de navegação
-    if titulo.count('|') > 1 or titulo.count('›') > 1 or titulo.count('»') > 1:
-        log(f"  🚫 Título rejeitado (parece navegação): {titulo[:60]}...")
-        return False
-    
-    # Rejeita títulos com muitas palavras em inglês em sites BR (provavelmente UI)
-    palavras_en = ['the', 'and', 'for', 'with', 'from', 'this', 'that', 'your', 'our', 'their']
-    contagem_en = sum(1 for p in titulo_lower.split() if p in palavras_en)
-    if contagem_en >= 3 and len(titulo.split()) < 8:
-        log(f"  🚫 Título rejeitado (parece UI em inglês): {titulo[:60]}...")
-        return False
-    
-    return True
-
 
-def buscar_noticia(tema):
+def contar_candidatos(links, site_url, urls_processadas):
+    """Links da página com cara de matéria nova (sem baixar nada): o estoque do tema"""
+    from urllib.parse import urljoin
+
+    total = 0
+    for link in links:
+        href = urljoin(site_url, link.get('href', ''))
+        if href.startswith('http') and normalizar_url(href) not in urls_processadas \
+                and eh_titulo_valido(limpar_titulo(link.get_text(strip=True))):
+            total += 1
+    return total
+
+
+def buscar_noticia(tema, coleta=None):
+    """Primeira matéria nova e válida dos portais do tema (ou None)."""
+    noticia = next(buscar_candidatos(tema, coleta), None)
+    if noticia:
+        marcar_processada(noticia)
+    return noticia
+
+
+def _tempo_limite(prazo, maximo=20):
+    """Timeout de uma requisição: `maximo`, ou o que falta até `prazo` (time.monotonic())"""
+    if prazo is None:
+        return maximo
+    return max(1, min(maximo, prazo - time.monotonic()))
+
+
+def buscar_candidatos(tema, coleta=None, prazo=None):
+    """Matérias novas e válidas dos portais do tema, uma a uma, na ordem em que aparecem.
+
+    Gerador: quem só quer a primeira para no primeiro next(); continuar
+    consumindo (abastecer a fila de candidatos) segue na mesma página, sem
+    baixar a capa de novo. Links rejeitados vão para o articles_cache na hora;
+    a matéria devolvida, não: quem a consome chama marcar_processada() junto
+    com a gravação do post ou da fila. Com `prazo` (time.monotonic()), para
+    de buscar ao passar dele, checando a cada link e a cada portal; um prazo
+    novo pode ser passado com send() ao retomar. Com `coleta`
+    (tema_scheduler.Coleta), percorre os portais na ordem dela e anota o
+    resultado de cada um e o estoque da página que rendeu.
+    """
+    import requests
+    from bs4 import BeautifulSoup
+
+    # Session keep-alive no modo daemon; o módulo requests numa execução avulsa
+    http = http_session.cliente()
     time.sleep(random.uniform(1, 3))
     urls_processadas, titulos_processados = carregar_cache_artigos()
     
-    for site_url in tema['sites']:
+    for site_url in (coleta.sites if coleta else tema['sites']):
+        achou = False
+        if prazo is not None and time.monotonic() >= prazo:
+            log("  ⏱ Prazo da busca esgotado")
+            return
 
         try:
             log(f"  🔍 Tentando {site_url}...")
             
-            resp = requests.get(site_url, headers=HEADERS, timeout=20, verify=False)
+            resp = http.get(site_url, headers=HEADERS, timeout=_tempo_limite(prazo), verify=False)
             resp.encoding = 'utf-8'
             resp.raise_for_status()
             soup = BeautifulSoup(resp.text, 'html.parser')
@@ -410,7 +280,10 @@ def buscar_noticia(tema):
             links = soup.find_all('a', href=True)
             links = links[:80]  # Aumentar para buscar mais links
             
-            for link in links:
+            for pos, link in enumerate(links):
+                if prazo is not None and time.monotonic() >= prazo:
+                    log("  ⏱ Prazo da busca esgotado")
+                    return
                 href = link.get('href', '')
                 titulo = link.get_text(strip=True)
                 
@@ -471,7 +344,7 @@ def buscar_noticia(tema):
                     time.sleep(random.uniform(0.7, 1.5))
                     
                     # Acessa artigo
-                    art_resp = requests.get(href, headers=HEADERS, timeout=20, verify=False)
+                    art_resp = http.get(href, headers=HEADERS, timeout=_tempo_limite(prazo), verify=False)
                     art_resp.encoding = 'utf-8'
                     art_soup = BeautifulSoup(art_resp.text, 'html.parser')
                     
@@ -518,16 +391,21 @@ def buscar_noticia(tema):
                     # Valida conteúdo
                     if len(texto) > 500:
                         log(f"  ✅ Encontrada: {titulo[:60]}...")
-                        # Marca como processada (URL normalizada e título)
+                        # Marca como processada só em memória (quem consome grava, ver marcar_processada)
                         urls_processadas.add(href_normalizada)
                         titulos_processados.add(titulo_normalizado)
-                        salvar_cache_artigos(urls_processadas, titulos_processados)
-                        return {
+                        if coleta and not achou:
+                            coleta.site(site_url, True, contar_candidatos(links[pos + 1:], site_url, urls_processadas))
+                        achou = True
+                        novo_prazo = yield {
                             'title': titulo, 
                             'content': texto, 
                             'urlToImage': img_url, 
                             'url': href
                         }
+                        if novo_prazo is not None:
+                            prazo = novo_prazo
+                        continue
 
                     else:
                         # Marca como processada mesmo sem conteúdo suficiente
@@ -541,52 +419,13 @@ def buscar_noticia(tema):
                 except Exception as e:
                     continue
             
-            log(f"  ⚠️ Nada encontrado em {site_url}")
+            if not achou:
+                log(f"  ⚠️ Nada encontrado em {site_url}")
         except Exception as e:
             log(f"  ❌ Erro em {site_url}: {str(e)[:60]}")
-            continue
-    
-    return None
+        if coleta and not achou:
+            coleta.site(site_url, False)
 
-def limpar_markdown(texto):
-    """Remove formatação markdown do texto"""
-    import re
-    # Remove **texto** -> texto
-    texto = re.sub(r'\*\*(.*?)\*\*', r'\1', texto)
-    # Remove *texto* -> texto
-    texto = re.sub(r'\*(.*?)\*', r'\1', texto)
-    # Remove __texto__ -> texto
-    texto = re.sub(r'__(.*?)__', r'\1', texto)
-    # Remove # titulo -> titulo
-    texto = re.sub(r'^#+\s+', '', texto, flags=re.MULTILINE)
-    # Remove tags HTML malformadas
-    texto = re.sub(r'<p><h\d>(.*?)</h\d></p>', r'\1', texto)
-    texto = re.sub(r'<p><p>(.*?)</p></p>', r'\1', texto)
-    # Remove tags HTML abertas
-    texto = re.sub(r'<h\d>|</h\d>', '', texto)
-    return texto
-
-def formatar_paragrafos(texto):
-    """Formata texto em parágrafos HTML bem estruturados"""
-    import re
-    # Limpa markdown primeiro
-    texto = limpar_markdown(texto)
-    
-    # Remove tags HTML restantes
-    texto = re.sub(r'<[^>]+>', '', texto)
-    
-    # Divide em parágrafos por quebras duplas ou por pontos finais
-    blocos = texto.split('\n\n')
-    
-    html = ""
-    for bloco in blocos:
-        bloco = bloco.strip()
-        if len(bloco) > 50:  # Ignora blocos muito pequenos
-            # Remove espaços múltiplos
-            bloco = re.sub(r'\s+', ' ', bloco)
-            html += f'<p>{bloco}</p>\n'
-    
-    return html
 
 def extrair_imagem_melhorada(soup, url):
     """Extrai a melhor imagem do artigo"""
@@ -660,160 +499,15 @@ def gerar_texto_fallback(noticia):
     return texto[:3000]  # Limita a 3000 caracteres
 
 
-def parece_portugues(texto: str) -> bool:
-    """Heurística simples para detectar se o texto parece PT-BR.
-    Não é um detector perfeito; é só para bloquear casos óbvios de inglês/UI."""
-    if not texto:
-        return False
-
-    t = texto.lower()
-    # remove tags
-    import re
-    t = re.sub(r'<[^>]+>', ' ', t)
-    t = re.sub(r'\s+', ' ', t).strip()
-    if len(t) < 200:
-        return False
-
-    tokens = re.findall(r"[a-zà-ú]+", t)
-    if len(tokens) < 40:
-        return False
-
-    pt_stop = {
-        'que', 'de', 'do', 'da', 'em', 'para', 'com', 'não', 'uma', 'um', 'os', 'as',
-        'por', 'mais', 'como', 'sobre', 'após', 'antes', 'entre', 'também', 'já',
-        'foi', 'será', 'são', 'era', 'está', 'estão', 'disse', 'diz', 'ainda',
-        'ao', 'aos', 'à', 'às', 'no', 'na', 'nos', 'nas', 'se', 'sua', 'seu'
-    }
-    en_stop = {
-        'the', 'and', 'for', 'with', 'from', 'this', 'that', 'your', 'our', 'their',
-        'you', 'they', 'we', 'was', 'were', 'are', 'is', 'in', 'on', 'of', 'to'
-    }
-
-    pt_hits = sum(1 for tok in tokens if tok in pt_stop)
-    en_hits = sum(1 for tok in tokens if tok in en_stop)
-
-    # presença de acentos ajuda
-    acentos = sum(1 for ch in t if ch in 'áàâãéêíóôõúç')
-
-    # decisões simples
-    if en_hits > pt_hits * 2 and en_hits > 20:
-        return False
-    if pt_hits >= 8:
-        return True
-    if acentos >= 8:
-        return True
-    return False
-
-
-def corrigir_espacamento(texto: str) -> str:
-    """Correções leves de espaçamento/pontuação para reduzir 'palavras grudadas'."""
-    import re
-    if not texto:
-        return texto
-    # espaços após pontuação
-    texto = re.sub(r'([,;:.!?])(\S)', r'\1 \2', texto)
-    # minúscula+Maiúscula coladas
-    texto = re.sub(r'([a-zà-ú])([A-ZÀ-Ú])', r'\1 \2', texto)
-    # dígito+letra colados
-    texto = re.sub(r'(\d)([A-Za-zÀ-Úà-ú])', r'\1 \2', texto)
-    # remove espaços múltiplos
-    texto = re.sub(r'\s+', ' ', texto)
-    return texto.strip()
-
-
-def remover_mencoes_de_fonte(texto: str) -> tuple[str, bool]:
-    """Remove/neutraliza menções a veículos/fontes.
-    Retorna (texto_limpo, houve_remocao)."""
-    import re
-    if not texto:
-        return texto, False
-
-    original = texto
-    t = texto
-
-    # remove padrões do tipo "Fonte: ..." em qualquer lugar
-    t = re.sub(r'(?im)^\s*fonte\s*:\s*.*$', '', t)
-    t = re.sub(r'(?im)^\s*source\s*:\s*.*$', '', t)
-
-    # neutraliza menções explícitas a portais comuns
-    veiculos = [
-        'g1', 'uol', 'folha', 'folhapress', 'poder360', 'cnn brasil', 'bbc',
-        'ge.globo', 'globo', 'oglobo', 'estadão', 'estadao', 'r7', 'ig',
-        'omelete', 'tecmundo', 'olhar digital', 'tecnoblog', 'canaltech',
-        'ign', 'game rant', 'thegamer', 'the enemy'
-    ]
-    for v in veiculos:
-        # remove "segundo <veículo>", "de acordo com <veículo>", "conforme <veículo>"
-        t = re.sub(rf'(?i)(segundo|de acordo com|conforme|reportou|informou)\s+{re.escape(v)}\b', r'\1 informações disponíveis', t)
-        t = re.sub(rf'(?i)\b{re.escape(v)}\b', v)  # mantém a palavra se estiver no meio, mas reduz chance de apagar sentido
-
-    # remove sobras de linhas vazias
-    t = re.sub(r'\n{3,}', '\n\n', t).strip()
-
-    return t, (t != original)
-
-
-def remover_primeiro_paragrafo_se_repetir_titulo(texto: str, titulo: str) -> tuple[str, bool]:
-    """Se o 1º parágrafo for basicamente o título (ou começar repetindo), remove."""
-    import re
-    if not texto or not titulo:
-        return texto, False
-
-    # quebra por parágrafos (linhas em branco)
-    partes = [p.strip() for p in re.split(r'\n\s*\n', texto) if p.strip()]
-    if len(partes) < 2:
-        return texto, False
-
-    t_norm = normalizar_titulo(titulo)
-    p0_norm = normalizar_titulo(partes[0])
-
-    # se o primeiro parágrafo contém o título (ou grande parte dele)
-    if t_norm and (t_norm in p0_norm or p0_norm.startswith(t_norm[: max(20, len(t_norm) // 2)])):
-        partes = partes[1:]
-        return '\n\n'.join(partes).strip(), True
-
-    # Jaccard simples com palavras
-    palavras_t = set(t_norm.split())
-    palavras_p0 = set(p0_norm.split())
-    if palavras_t and palavras_p0:
-        sim = len(palavras_t & palavras_p0) / len(palavras_t | palavras_p0)
-        if sim >= 0.70:
-            partes = partes[1:]
-            return '\n\n'.join(partes).strip(), True
-
-    return texto, False
-
-
-def avaliar_qualidade_materia(titulo: str, texto: str) -> list[str]:
-    """Retorna uma lista de flags com problemas detectados."""
-    flags = []
-    if not texto or len(texto) < 800:
-        flags.append('curto')
-    if not parece_portugues(texto):
-        flags.append('nao_ptbr')
-
-    # sinais de fonte
-    tl = texto.lower()
-    if 'fonte:' in tl or 'source:' in tl or 'segundo ' in tl or 'de acordo com ' in tl or 'conforme ' in tl:
-        flags.append('menciona_fonte')
-
-    # markdown (o prompt pede HTML simples)
-    if any(x in texto for x in ['**', '__', '```']):
-        flags.append('markdown')
-
-    # título repetido no começo
-    t_norm = normalizar_titulo(titulo) if titulo else ''
-    inicio = normalizar_titulo(texto[:400])
-    if t_norm and t_norm in inicio:
-        flags.append('repete_titulo')
-
-    return flags
+# Orçamento de tokens do texto-fonte enviado nos prompts de matéria
+ORCAMENTO_TOKENS_FONTE = 700
 
 def gerar_texto(noticia):
+    conteudo = prompt_budget.selecionar_trechos(noticia.get('content', ''), noticia.get('title', ''), ORCAMENTO_TOKENS_FONTE)
     prompt = f"""Escreva uma matéria jornalística completa em português brasileiro (mínimo 450 palavras, parágrafos, tom profissional) sobre:
 
 Título: {noticia['title']}
-Conteúdo: {noticia.get('content', '')[:3000]}
+Conteúdo: {conteudo}
 
 Regras obrigatórias:
 - NÃO mencione nem cite veículos, jornais, sites, autores ou links.
@@ -824,7 +518,7 @@ Regras obrigatórias:
     prompt_strito = f"""Reescreva e melhore a matéria abaixo em português brasileiro.
 
 Título: {noticia['title']}
-Conteúdo base: {noticia.get('content', '')[:3000]}
+Conteúdo base: {conteudo}
 
 Regras obrigatórias (não quebre):
 1) Texto 100% PT-BR (sem frases em inglês).
@@ -834,23 +528,8 @@ Regras obrigatórias (não quebre):
 5) Produzir parágrafos e usar somente HTML simples (<p>, <strong>, <em>) sem markdown.
 """
     try:
-        def chamar_groq(conteudo_prompt: str, temperature: float, timeout: int):
-            r = requests.post(
-                'https://api.groq.com/openai/v1/chat/completions',
-                headers={'Authorization': f'Bearer {GROQ_API_KEY}', 'Content-Type': 'application/json'},
-                json={
-                    'model': 'llama-3.3-70b-versatile',
-                    'messages': [{'role': 'user', 'content': conteudo_prompt}],
-                    'temperature': temperature,
-                    'max_tokens': 2000
-                },
-                timeout=timeout
-            )
-            r.raise_for_status()
-            return r.json()['choices'][0]['message']['content'].strip()
-
         # 1) Primeira tentativa (mais "criativa")
-        texto = chamar_groq(prompt, temperature=0.7, timeout=60)
+        texto = llm_router.chamar('materia', prompt, temperature=0.7, max_tokens=2000, timeout=60)
         texto = limpar_markdown(texto)
         texto = corrigir_espacamento(texto)
 
@@ -867,7 +546,7 @@ Regras obrigatórias (não quebre):
         # 2) Se a qualidade estiver ruim, tenta um segundo prompt mais rígido
         if any(f in flags for f in ['nao_ptbr', 'menciona_fonte', 'repete_titulo', 'curto']):
             log(f"  ⚠️ Qualidade detectada ({', '.join(flags)}). Tentando reescrita mais rígida...")
-            texto2 = chamar_groq(prompt_strito, temperature=0.2, timeout=70)
+            texto2 = llm_router.chamar('reescrita', prompt_strito, temperature=0.2, max_tokens=2000, timeout=70)
             texto2 = limpar_markdown(texto2)
             texto2 = corrigir_espacamento(texto2)
             texto2, _ = remover_mencoes_de_fonte(texto2)
@@ -960,31 +639,29 @@ Subcategorias disponíveis: {', '.join(subcats_disponiveis)}
 
 Responda APENAS com o nome exato da subcategoria mais adequada, sem explicação. Se nenhuma se encaixar, responda "nenhuma"."""
 
-    try:
-        resp = requests.post(
-            'https://api.groq.com/openai/v1/chat/completions',
-            headers={'Authorization': f'Bearer {GROQ_API_KEY}', 'Content-Type': 'application/json'},
-            json={
-                'model': 'llama-3.3-70b-versatile',
-                'messages': [{'role': 'user', 'content': prompt}],
-                'temperature': 0.1,
-                'max_tokens': 50
-            },
-            timeout=15
-        )
-        resp.raise_for_status()
-        resultado = resp.json()['choices'][0]['message']['content'].strip().lower()
-        
+    def casar_subcategoria(resultado):
+        resultado = resultado.strip().lower()
         # Valida se a resposta é uma subcategoria válida
         if resultado in subcats_disponiveis:
-            log(f"  🤖 Subcategoria via IA: {resultado}")
             return resultado
-        
         # Tenta match parcial (ex: "cinema e séries" -> "cinema-series")
         for subcat in subcats_disponiveis:
             if subcat in resultado or resultado in subcat:
-                log(f"  🤖 Subcategoria via IA (parcial): {subcat}")
                 return subcat
+        return None
+
+    def resposta_confiavel(resultado):
+        # "nenhuma" também é uma resposta firme; qualquer outra coisa vai para o modelo grande
+        return casar_subcategoria(resultado) is not None or resultado.strip().lower() == 'nenhuma'
+
+    try:
+        resultado = llm_router.chamar('classificar', prompt, temperature=0.1, max_tokens=50, timeout=15,
+                                      validar=resposta_confiavel).lower()
+        
+        subcat = casar_subcategoria(resultado)
+        if subcat:
+            log(f"  🤖 Subcategoria via IA: {subcat}")
+            return subcat
         
         log(f"  🤖 IA não classificou subcategoria: {resultado}")
         return None
@@ -1016,244 +693,168 @@ def salvar_post(titulo, texto, img, cat, data, post_id, subcategoria=None):
     fname = f"post-{post_id:04d}-{slug}.html"
     
     # Formata parágrafos com função melhorada
-    paragrafos = formatar_paragrafos(texto)
+    paragrafos = dividir_paragrafos(texto)
 
-    
-    # HTML com styling melhorado
-    subcat_html = f'<span class="post-subcategoria">{subcategoria.replace("-"," ").title()}</span>' if subcategoria else ''
-    
-    html = f"""<!DOCTYPE html>
-<html lang="pt-BR">
-<head>
-<meta charset="UTF-8">
-<meta name="viewport" content="width=device-width, initial-scale=1.0">
-<meta property="og:title" content="{titulo}">
-<meta property="og:image" content="{img}">
-<meta property="og:type" content="article">
-<title>{titulo} - Vivimundo</title>
-<link rel="stylesheet" href="../style.css">
-</head>
-<body>
-<header><div class="container"><h1 class="logo">VIVIMUNDO</h1>
-<nav>
-<a href="../index.html">Início</a>
-<a href="../categoria-esportes.html">Esportes</a>
-<a href="../categoria-entretenimento.html">Entretenimento</a>
-<a href="../categoria-tecnologia.html">Tecnologia</a>
-<a href="../categoria-videogames.html">Videogames</a>
-<a href="../categoria-politica-nacional.html">Política Nacional</a>
-<a href="../categoria-politica-internacional.html">Política Internacional</a>
-<a href="../categoria-rio-de-janeiro.html">Rio de Janeiro</a>
-<a href="../categoria-sao-paulo.html">São Paulo</a>
-<a href="../sobre.html">Sobre</a>
-</nav>
-</div></header>
-<main class="container">
-<article class="post-completo">
-<div class="post-header">
-<span class="post-categoria">{cat.replace('-',' ').title()}</span>
-{subcat_html}
-<h1 class="post-titulo">{titulo}</h1>
-<div class="post-data">Por Kevin Ribeiro • {data}</div>
-</div>
-<img src="{img}" class="post-principal-imagem" alt="{titulo}" loading="lazy">
-<div class="post-conteudo">
-{paragrafos}
-</div>
-</article>
-</main>
-<footer><div class="container"><p>© 2026 Vivimundo</p><a href="https://x.com/Kevin_RSP0" target="_blank">Twitter</a></div></footer>
-</body></html>"""
-    
-    Path("posts").mkdir(exist_ok=True)
-    with open(Path("posts") / fname, 'w', encoding='utf-8') as f:
-        f.write(html)
+    # Fonte estruturada (post_sources/) + HTML renderizado a partir dela
+    url = f"posts/{fname}"
+    try:
+        thumbnails.garantir(img)
+    except Exception as e:
+        log(f"  ⚠️ Miniaturas: {str(e)[:60]}")
+    fonte = post_sources.montar_fonte(url, titulo, paragrafos, img, cat, data, subcategoria)
+    html = post_sources.renderizar_post(fonte)
+    
+    atomic_write.escrever_texto(url, html)
+    post_index.registrar_arquivo(url)
+    fonte['html_sha256'] = post_sources.hash_html(html)
+    post_sources.salvar_fonte(fonte)
     log(f"  💾 Post salvo: {fname}")
-    return {'titulo': titulo, 'url': f"posts/{fname}", 'imagem': img, 'categoria': cat, 'subcategoria': subcategoria, 'data': data}
-
-
-def atualizar_home(posts):
-    cards = ""
-    # Lista todas as matérias (sem limite), em ordem decrescente (mais recentes primeiro)
-    for p in reversed(posts):
-        # Verifica se o arquivo HTML do post existe
-        post_file = Path(p['url'])
-        if not post_file.exists():
-            log(f"  ⚠️ Post {p['titulo'][:40]} não tem arquivo HTML, pulando")
-            continue
-        
-        # Adiciona subcategoria se existir
-        subcat_html = f'<span class="subcategoria">{p.get("subcategoria", "").replace("-"," ").title()}</span>' if p.get('subcategoria') else ''
-        
-        cards += f"""<article class="post-card">
-<img src="{p['imagem']}" alt="{p['titulo']}">
-<div class="post-info">
-<span class="categoria categoria-{p['categoria']}">{p['categoria'].replace('-',' ').title()}</span>
-{subcat_html}
-<h2><a href="{p['url']}">{p['titulo']}</a></h2>
-<p class="meta">Por Kevin Ribeiro • {p['data']}</p>
-</div>
-</article>"""
-    
-    html = f"""<!DOCTYPE html>
-<html lang="pt-BR">
-<head><meta charset="UTF-8"><meta name="viewport" content="width=device-width, initial-scale=1.0">
-<title>Vivimundo - Portal de Notícias</title><link rel="stylesheet" href="style.css"></head>
-<body>
-<header><div class="container"><h1 class="logo">VIVIMUNDO</h1>
-<nav>
-<a href="index.html">Início</a>
-<a href="categoria-esportes.html">Esportes</a>
-<a href="categoria-entretenimento.html">Entretenimento</a>
-<a href="categoria-tecnologia.html">Tecnologia</a>
-<a href="categoria-videogames.html">Videogames</a>
-<a href="categoria-politica-nacional.html">Política Nacional</a>
-<a href="categoria-politica-internacional.html">Política Internacional</a>
-<a href="categoria-rio-de-janeiro.html">Rio de Janeiro</a>
-<a href="categoria-sao-paulo.html">São Paulo</a>
-<a href="sobre.html">Sobre</a>
-</nav>
-</div></header>
-<main class="container">
-<h2 class="secao-titulo">Últimas Notícias</h2>
-<div class="posts-grid">{cards}</div>
-</main>
-<footer><div class="container"><p>© 2026 Vivimundo</p><a href="https://x.com/Kevin_RSP0" target="_blank">Twitter</a></div></footer>
-</body></html>"""
-    with open("index.html", 'w', encoding='utf-8') as f:
-        f.write(html)
-    log("  📝 Index atualizado")
-
-
-def gerar_paginas_categorias(posts):
-    """Gera páginas para cada categoria com artigos filtrados"""
-    # Garante que todas as categorias do TEMAS tenham páginas (mesmo que vazias)
-    categorias = {tema['categoria']: [] for tema in TEMAS}
-    
-    # Preenche com posts existentes
-    for p in posts:
-        cat = p['categoria']
-        if cat in categorias:
-            categorias[cat].append(p)
-    
-    for cat, artigos in categorias.items():
-
-        cards = ""
-        # Lista todas as matérias da categoria (sem limite), mais recentes primeiro
-        for p in reversed(artigos):
-            # Verifica se o arquivo HTML do post existe
-            post_file = Path(p['url'])
-            if not post_file.exists():
-                continue
-            
-            # Adiciona subcategoria se existir
-            subcat_html = f'<span class="subcategoria">{p.get("subcategoria", "").replace("-"," ").title()}</span>' if p.get('subcategoria') else ''
-            
-            cards += f"""<article class="post-card">
-<img src="{p['imagem']}" alt="{p['titulo']}">
-<div class="post-info">
-<span class="categoria categoria-{p['categoria']}">{p['categoria'].replace('-',' ').title()}</span>
-{subcat_html}
-<h2><a href="{p['url']}">{p['titulo']}</a></h2>
-<p class="meta">Por Kevin Ribeiro • {p['data']}</p>
-</div>
-</article>"""
-        
-        # Mensagem quando não há artigos
-        if not artigos:
-            cards = '<p class="sem-artigos">Nenhuma notícia nesta categoria ainda.</p>'
-        
-        html = f"""<!DOCTYPE html>
-<html lang="pt-BR">
-<head><meta charset="UTF-8"><meta name="viewport" content="width=device-width, initial-scale=1.0">
-<title>{cat.replace('-',' ').title()} - Vivimundo</title><link rel="stylesheet" href="style.css"></head>
-<body>
-<header><div class="container"><h1 class="logo">VIVIMUNDO</h1>
-<nav>
-<a href="index.html">Início</a>
-<a href="categoria-esportes.html">Esportes</a>
-<a href="categoria-entretenimento.html">Entretenimento</a>
-<a href="categoria-tecnologia.html">Tecnologia</a>
-<a href="categoria-videogames.html">Videogames</a>
-<a href="categoria-politica-nacional.html">Política Nacional</a>
-<a href="categoria-politica-internacional.html">Política Internacional</a>
-<a href="categoria-rio-de-janeiro.html">Rio de Janeiro</a>
-<a href="categoria-sao-paulo.html">São Paulo</a>
-<a href="sobre.html">Sobre</a>
-</nav>
-</div></header>
-<main class="container">
-<h2 class="secao-titulo">{cat.replace('-',' ').title()}</h2>
-<div class="posts-grid">{cards}</div>
-</main>
-<footer><div class="container"><p>© 2026 Vivimundo</p><a href="https://x.com/Kevin_RSP0" target="_blank">Twitter</a></div></footer>
-</body></html>"""
+    return {'titulo': titulo, 'url': url, 'imagem': img, 'categoria': cat, 'subcategoria': subcategoria, 'data': data}
 
-        
-        fname = f"categoria-{cat}.html"
-        with open(fname, 'w', encoding='utf-8') as f:
-            f.write(html)
-        log(f"  📚 Categoria '{cat}' atualizada")
 
-
-def publicar():
+def publicar(mensagem='Nova matéria', push=False):
+    """Commita só o que este processo escreveu desde o último commit (git_publish, sem varrer a árvore)"""
     try:
-        result = subprocess.run(['git', 'status', '--porcelain'], capture_output=True, text=True)
-        if not result.stdout.strip():
-            log("  ⚠️ Nada para commitar")
-            return
-        subprocess.run(['git', 'add', '.'], check=True)
-        subprocess.run(['git', 'commit', '-m', f'Nova matéria - {datetime.now().strftime("%d/%m/%Y %H:%M")}'], check=True)
-        log("  ✅ Commit realizado! (Push será feito pelo GitHub Actions)")
+        git_publish.publicar(f'{mensagem} - {datetime.now().strftime("%d/%m/%Y %H:%M")}', push=push)
     except Exception as e:
         log(f"  ❌ Commit: {e}")
 
-def executar():
-    pfile = Path("posts.json")
-    posts = json.load(open(pfile)) if pfile.exists() else []
-    tema_idx, total_posts = carregar_estado()
-    tema = TEMAS[tema_idx]
+def executar(tema=None, store=None, publicar_ao_fim=True):
+    """Um ciclo do publicador: busca, escreve, regera as listagens e (por padrão) commita.
+
+    Sem `tema`, o tema_scheduler escolhe o de maior ganho esperado; com `tema`
+    (modo daemon, que agenda cada tema no seu ritmo) só o resultado é
+    registrado. `store` permite reaproveitar um post_store já aberto. Retorna
+    o registro do post publicado, ou None se nada foi publicado.
+    """
+    if store is None:
+        store = post_store.abrir()
+    posts = store.todos()
+    total_posts = carregar_estado()
+    estatisticas = tema_scheduler.carregar()
+    fila = candidate_queue.carregar()
+    expirados = candidate_queue.expirar(fila)
+    motivo = 'agendado'
+    if tema is None:
+        tema, motivo = tema_scheduler.escolher(estatisticas, TEMAS, posts, na_fila=candidate_queue.tamanhos(fila))
+    coleta = tema_scheduler.Coleta(tema['nome'], tema_scheduler.ordenar_sites(estatisticas, tema))
 
     log(f"\n{'='*60}")
-    log(f"🔄 POST #{total_posts + 1} - {tema['nome']}")
+    log(f"🔄 POST #{total_posts + 1} - {tema['nome']} ({motivo})")
     log(f"{'='*60}")
-    
-    noticia = buscar_noticia(tema)
-    if not noticia:
-        log("❌ Nenhuma notícia encontrada")
-        return
-    
-    texto = gerar_texto(noticia)
+    if expirados:
+        log(f"  🗑️ {expirados} candidato(s) vencido(s) saíram da fila")
+    
+    # Com candidato na fila, nem abre as capas dos portais
+    candidatos = None
+    noticia = candidate_queue.retirar(fila, tema['nome'])
+    if noticia:
+        log(f"  📦 Da fila de candidatos: {noticia['title'][:60]}...")
+        coleta.estoque = len(fila.get(tema['nome'], ()))
+    else:
+        candidatos = buscar_candidatos(tema, coleta)
+        noticia = next(candidatos, None)
+    texto = gerar_texto(noticia) if noticia else None
     if not texto:
-        log("⚠️ Sem conteúdo para salvar")
-        return
+        log("❌ Nenhuma notícia encontrada" if not noticia else "⚠️ Sem conteúdo para salvar")
+        # a tentativa perdida também ensina o agendador (e o cache de artigos não se perde)
+        tema_scheduler.registrar(estatisticas, coleta, publicou=False)
+        tema_scheduler.salvar(estatisticas)
+        with atomic_write.lote():
+            if noticia:
+                marcar_processada(noticia)
+            candidate_queue.salvar(fila)
+        if publicar_ao_fim:
+            publicar(f'Coleta sem matéria - {tema["nome"]}')
+        return None
 
     # Classifica subcategoria automaticamente
     subcategoria = classificar_subcategoria(noticia['title'], tema['categoria'])
     if subcategoria:
         log(f"  🏷️ Subcategoria: {subcategoria}")
     
-    info = salvar_post(noticia['title'], texto, noticia.get('urlToImage'), tema['categoria'], datetime.now().strftime('%d/%m/%Y às %H:%M'), total_posts + 1, subcategoria)
-
-    posts.append(info)
-    json.dump(posts, open(pfile, 'w'), ensure_ascii=False, indent=2)
-    atualizar_home(posts)
-    gerar_paginas_categorias(posts)
-    publicar()
+    # Tudo que este post gera vai para o disco junto, num único ponto de commit
+    with atomic_write.lote():
+        # `data` de exibição no horário local; `publicado_em` em UTC (comparado com o "agora" UTC do agendador/editor)
+        agora = datetime.now()
+        info = salvar_post(noticia['title'], texto, noticia.get('urlToImage'), tema['categoria'], agora.strftime('%d/%m/%Y às %H:%M'), total_posts + 1, subcategoria)
+        info['publicado_em'] = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+        store.adicionar(info)
+        posts = store.todos()
+        # imagens que falharam antes (fila de retentativas); os cards delas são regerados
+        thumbnails.processar_fila()
+        site_pages.regerar(posts)
+        # posts.json (formato antigo, vários MB) não é reescrito a cada post: só quando vence o intervalo
+        store.exportar_vencido()
+        store.salvar()
+
+        # Salva estado para próxima execução
+        salvar_estado(total_posts + 1)
+        tema_scheduler.registrar(estatisticas, coleta, publicou=True)
+        tema_scheduler.salvar(estatisticas)
+        # retirada da fila e marca no cache só valem junto com o post (execução interrompida não perde o candidato)
+        marcar_processada(noticia)
+        candidate_queue.salvar(fila)
+
+    # dist/ minificado + .gz/.br (opcional, para hosts que servem arquivos pré-comprimidos)
+    if os.getenv('GERAR_DIST', '0').strip() == '1':
+        try:
+            static_output.gerar_saida()
+        except Exception as e:
+            log(f"  ⚠️ dist/: {str(e)[:80]}")
+    if publicar_ao_fim:
+        publicar()
 
-    # Salva estado para próxima execução
-    tema_idx = (tema_idx + 1) % len(TEMAS)
-    salvar_estado(tema_idx, total_posts + 1)
+    # Post já commitado: o resto da página aberta abastece a fila das próximas execuções
+    if candidatos is not None:
+        abastecer_fila(tema, fila, candidatos)
     
-    # Evitar disparos excessivos em curto intervalo (proteção contra loop infinito)
-    # A cada 5 posts, espera 5 minutos antes do próximo ciclo
-    if (total_posts + 1) % 5 == 0:
+    log("\n✅ CICLO CONCLUÍDO!")
+    return info
+
+def abastecer_fila(tema, fila, candidatos, orcamento_s=ORCAMENTO_ABASTECER_S):
+    """Guarda na fila do tema as próximas matérias válidas de `candidatos` (busca já em andamento).
+
+    Cada candidato é gravado assim que verificado, junto com a marca no
+    articles_cache (mesmo lote); para ao encher a fila do tema, ao esgotar os
+    portais ou ao passar de `orcamento_s` segundos (prazo repassado à busca,
+    que o checa a cada link e a cada portal).
+    """
+    prazo = time.monotonic() + orcamento_s
+    guardados = 0
+    try:
+        # send() repassa o prazo à busca, que estava parada no candidato já publicado
+        noticia = candidatos.send(prazo)
+        while candidate_queue.vagas(fila, tema['nome']):
+            with atomic_write.lote():
+                candidate_queue.acrescentar(fila, tema['nome'], noticia)
+                candidate_queue.salvar(fila)
+                marcar_processada(noticia)
+            guardados += 1
+            if time.monotonic() >= prazo or not candidate_queue.vagas(fila, tema['nome']):
+                break
+            noticia = next(candidatos)
+    except StopIteration:
+        pass
+    candidatos.close()
+    if guardados:
+        log(f"  📦 {guardados} candidato(s) guardado(s) na fila de {tema['nome']}")
+
+def pausa_de_protecao(info):
+    """Execução avulsa: a cada 5 posts, espera 5 minutos antes do próximo ciclo.
+
+    Evita disparos excessivos em curto intervalo (proteção contra loop infinito)
+    quando o bot roda como processo novo a cada gatilho; o daemon tem agenda
+    própria e não passa por aqui.
+    """
+    if info and carregar_estado() % 5 == 0:
         log(f"  ⏳ Pausa de proteção: aguardando 5 minutos antes do próximo ciclo...")
         time.sleep(300)
-    
-    log("\n✅ CICLO CONCLUÍDO!")
 
 if __name__ == "__main__":
+    configurar()
     log("🌍 VIVIMUNDO BOT - GitHub Actions")
     setup_repo()
-    executar()
+    # --sem-commit: o passo seguinte do workflow commita tudo de uma vez (git_publish.py, pelo diário)
+    pausa_de_protecao(executar(publicar_ao_fim='--sem-commit' not in sys.argv[1:]))
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Manifesto de build incremental das páginas geradas (index, categorias...).
+
+Para cada arquivo de saída guardamos o hash das entradas usadas para gerá-lo
+(lista de cards + versão do template) e o hash do conteúdo escrito. Se as
+entradas não mudaram e o arquivo em disco ainda bate com o hash, a página nem
+é renderizada. Quando é renderizada, a escrita passa por atomic_write (só se os bytes
+mudaram) — assim o `git status` só enxerga o que realmente mudou.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any
+
+import atomic_write
+
+MANIFEST_JSON = Path("build_manifest.json")
+
+
+def carregar_manifesto() -> dict[str, Any]:
+    # ler_texto enxerga um manifesto ainda pendente no lote atual (index + categorias no mesmo run)
+    bruto = atomic_write.ler_texto(MANIFEST_JSON)
+    if bruto is not None:
+        try:
+            data = json.loads(bruto)
+            if isinstance(data, dict):
+                return data
+        except Exception:
+            pass
+    return {}
+
+
+def salvar_manifesto(manifesto: dict[str, Any]) -> None:
+    atomic_write.escrever_json(MANIFEST_JSON, manifesto, ensure_ascii=False, indent=1, sort_keys=True)
+
+
+def hash_entradas(*partes: Any) -> str:
+    """Hash estável de qualquer estrutura serializável em JSON."""
+    bruto = json.dumps(partes, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(bruto.encode("utf-8")).hexdigest()
+
+
+def hash_conteudo(dados: bytes) -> str:
+    return hashlib.sha256(dados).hexdigest()
+
+
+def precisa_gerar(manifesto: dict[str, Any], saida: str | Path, chave_entradas: str) -> bool:
+    """True se a saída não existe, as entradas mudaram ou o arquivo foi alterado fora do build."""
+    registro = manifesto.get(Path(saida).as_posix())
+    if not registro or registro.get("entradas") != chave_entradas:
+        return True
+    dados = atomic_write.ler_bytes(saida)
+    if dados is None:
+        return True
+    return hash_conteudo(dados) != registro.get("conteudo")
+
+
+def registrar(manifesto: dict[str, Any], saida: str | Path, chave_entradas: str, conteudo: str) -> None:
+    manifesto[Path(saida).as_posix()] = {
+        "entradas": chave_entradas,
+        "conteudo": hash_conteudo(conteudo.encode("utf-8")),
+    }
+
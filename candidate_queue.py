@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Fila persistida de matérias candidatas já verificadas, por tema.
+
+Cada busca do publicador baixava a capa dos portais, achava a primeira
+matéria válida e jogava fora todas as outras que viu; a execução seguinte
+baixava as mesmas capas para redescobri-las. Agora, depois de publicar, o
+publicador continua lendo a mesma página e guarda as próximas matérias
+válidas (título, URL, texto extraído, imagem e quando foram lidas) em
+fila_candidatos.json. A próxima execução daquele tema tira da fila e nem
+abre a capa; só volta aos portais quando a fila do tema esvazia.
+
+A fila é gravada a cada candidato acrescentado, no mesmo atomic_write.lote()
+que marca a matéria no articles_cache; a retirada só vai para o disco junto
+com o post publicado. Uma execução interrompida no meio não perde nem
+duplica candidatos.
+
+Candidatos valem por TTL_HORAS: os que vencem saem da fila e continuam
+marcados no articles_cache, ou seja, não são buscados de novo (de propósito:
+notícia velha não entra).
+"""
+
+import json
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+import atomic_write
+
+FILA_JSON = "fila_candidatos.json"
+
+# Notícia lida há mais tempo que isso sai da fila sem ser publicada
+TTL_HORAS = 12.0
+# Quantos candidatos cada tema guarda (o abastecimento para aí)
+MAX_POR_TEMA = 3
+
+
+def agora_utc() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def carregar(caminho: str = FILA_JSON) -> dict[str, list[dict[str, Any]]]:
+    bruto = atomic_write.ler_texto(caminho)
+    if bruto is None:
+        return {}
+    try:
+        data = json.loads(bruto)
+        return data if isinstance(data, dict) else {}
+    except Exception:
+        return {}
+
+
+def salvar(fila: dict[str, list[dict[str, Any]]], caminho: str = FILA_JSON) -> bool:
+    return atomic_write.escrever_json(caminho, fila, ensure_ascii=False, indent=1, sort_keys=True)
+
+
+def expirar(fila: dict[str, list[dict[str, Any]]], agora: datetime | None = None) -> int:
+    """Remove candidatos mais velhos que TTL_HORAS; retorna quantos saíram."""
+    limite = (agora or agora_utc()) - timedelta(hours=TTL_HORAS)
+    removidos = 0
+    for tema in list(fila):
+        validos = [c for c in fila[tema] if datetime.strptime(c["coletado_em"], "%Y-%m-%dT%H:%M:%SZ") > limite]
+        removidos += len(fila[tema]) - len(validos)
+        if validos:
+            fila[tema] = validos
+        else:
+            del fila[tema]
+    return removidos
+
+
+def tamanhos(fila: dict[str, list[dict[str, Any]]]) -> dict[str, int]:
+    return {tema: len(candidatos) for tema, candidatos in fila.items()}
+
+
+def vagas(fila: dict[str, list[dict[str, Any]]], tema: str) -> int:
+    return max(0, MAX_POR_TEMA - len(fila.get(tema, ())))
+
+
+def acrescentar(
+    fila: dict[str, list[dict[str, Any]]], tema: str, noticia: dict[str, Any], agora: datetime | None = None
+) -> None:
+    """Guarda uma notícia (no formato de bot.buscar_noticia) no fim da fila do tema."""
+    fila.setdefault(tema, []).append(
+        {
+            "titulo": noticia["title"],
+            "url": noticia["url"],
+            "texto": noticia["content"],
+            "imagem": noticia.get("urlToImage"),
+            "coletado_em": (agora or agora_utc()).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        }
+    )
+
+
+def retirar(fila: dict[str, list[dict[str, Any]]], tema: str) -> dict[str, Any] | None:
+    """Tira o candidato mais antigo do tema (na ordem da capa); None se a fila está vazia.
+
+    Só altera a fila em memória: quem publica grava a fila junto com o post.
+    """
+    candidatos = fila.get(tema)
+    if not candidatos:
+        return None
+    candidato = candidatos.pop(0)
+    if not candidatos:
+        del fila[tema]
+    return {
+        "title": candidato["titulo"],
+        "content": candidato["texto"],
+        "urlToImage": candidato.get("imagem"),
+        "url": candidato["url"],
+    }
@@ -0,0 +1,47 @@
+/* Carrega os shards JSON de cards (cards/<listagem>/k-<hash>.json) conforme o leitor rola.
+   Sem JS, ou se algo falhar, a paginação normal (page/k.html) continua funcionando. */
+(function () {
+    var ancora = document.querySelector('.carregar-mais');
+    var grade = document.querySelector('.posts-grid');
+    if (!ancora || !grade || !window.fetch || !('IntersectionObserver' in window)) return;
+
+    var shards = JSON.parse(ancora.getAttribute('data-shards') || '[]');
+    var paginacao = document.querySelector('.paginacao');
+    var proximo = 0;
+    var carregando = false;
+
+    function terminar(mostrarPaginacao) {
+        observador.disconnect();
+        if (paginacao && mostrarPaginacao) paginacao.hidden = false;
+    }
+
+    function carregar() {
+        if (carregando || proximo >= shards.length) return;
+        carregando = true;
+        fetch(shards[proximo])
+            .then(function (resp) {
+                if (!resp.ok) throw new Error(resp.status);
+                return resp.json();
+            })
+            .then(function (shard) {
+                grade.insertAdjacentHTML('beforeend', shard.cards.join(''));
+                proximo += 1;
+                carregando = false;
+                if (proximo >= shards.length) return terminar(false);
+                // reobserva: se a âncora ainda estiver visível, carrega o próximo
+                observador.unobserve(ancora);
+                observador.observe(ancora);
+            })
+            .catch(function () {
+                carregando = false;
+                terminar(true);
+            });
+    }
+
+    var observador = new IntersectionObserver(function (entradas) {
+        if (entradas[0].isIntersecting) carregar();
+    }, { rootMargin: '800px 0px' });
+
+    if (paginacao) paginacao.hidden = true;
+    observador.observe(ancora);
+})();
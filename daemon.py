@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Modo daemon: publicador e editor num processo só, com sessões e caches quentes.
+
+No GitHub Actions cada gatilho é um processo novo: interpretador, pip install,
+DNS/TLS frios e posts.json, articles_cache.json e bot_state.json relidos a
+cada execução. Numa máquina sempre ligada, o daemon abre tudo uma vez
+(post_store, índice de arquivos dos posts, índice de miniaturas, cache de
+artigos, Session HTTP com keep-alive) e agenda, num único thread:
+
+- coleta de cada tema no seu próprio intervalo (escalonadas, para não baterem juntas);
+- passadas do editor entre as coletas;
+- descarga periódica: exporta o posts.json e faz um commit só com os arquivos
+  escritos desde a última (e push, com --push).
+
+Não há pausa de proteção a cada 5 posts (a agenda já dita o ritmo).
+SIGTERM/SIGINT interrompem a espera; a tarefa em andamento termina e uma
+última descarga é feita antes de sair.
+
+Uso:
+    python daemon.py                      # roda até SIGTERM/SIGINT
+    python daemon.py --push --sem-editor
+    python daemon.py --uma-vez            # cada tarefa uma vez, sem espera, e sai
+
+Intervalos (segundos): DAEMON_COLETA_S (por tema, padrão 3600),
+DAEMON_EDITOR_S (300) e DAEMON_FLUSH_S (900).
+"""
+
+import argparse
+import heapq
+import itertools
+import os
+import signal
+import threading
+import time
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any, Callable
+
+import atomic_write
+import bot
+import editor_bot
+import http_session
+import post_store
+from temas import TEMAS
+
+INTERVALO_COLETA_S = 3600
+INTERVALO_EDITOR_S = 300
+INTERVALO_DESCARGA_S = 900
+
+# Espera máxima de uma vez (o relógio é reconsultado; SIGTERM acorda antes)
+ESPERA_MAX_S = 60.0
+
+
+def log(msg: str) -> None:
+    print(msg, flush=True)
+
+
+@dataclass(order=True)
+class Tarefa:
+    quando: float
+    seq: int
+    nome: str = field(compare=False)
+    intervalo: float = field(compare=False)
+    funcao: Callable[[], Any] = field(compare=False, repr=False)
+
+
+class Agenda:
+    """Tarefas periódicas num heap (a mais próxima primeiro), executadas em série.
+
+    `relogio` e `dormir` são injetáveis (testes usam um relógio falso; o daemon
+    dorme num threading.Event para acordar assim que pedem para parar).
+    """
+
+    def __init__(
+        self,
+        relogio: Callable[[], float] = time.monotonic,
+        dormir: Callable[[float], Any] = time.sleep,
+    ) -> None:
+        self.relogio = relogio
+        self.dormir = dormir
+        self._heap: list[Tarefa] = []
+        self._seq = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def agendar(self, nome: str, intervalo: float, funcao: Callable[[], Any], atraso: float = 0.0) -> None:
+        heapq.heappush(self._heap, Tarefa(self.relogio() + atraso, next(self._seq), nome, intervalo, funcao))
+
+    def rodar(self, parar: Callable[[], bool] = lambda: False, max_execucoes: int | None = None) -> int:
+        """Executa as tarefas no horário até `parar()` ou `max_execucoes`; retorna quantas rodaram.
+
+        Uma tarefa que falha é registrada no log e reagendada normalmente. Se
+        uma execução atrasa além do próximo horário, os horários perdidos não
+        são compensados em rajada: a tarefa volta um intervalo depois de agora.
+        """
+        execucoes = 0
+        while self._heap and not parar() and (max_execucoes is None or execucoes < max_execucoes):
+            tarefa = self._heap[0]
+            espera = tarefa.quando - self.relogio()
+            if espera > 0:
+                self.dormir(min(espera, ESPERA_MAX_S))
+                continue
+            heapq.heappop(self._heap)
+            inicio = time.perf_counter()
+            try:
+                tarefa.funcao()
+            except (Exception, SystemExit) as e:
+                log(f"  ❌ {tarefa.nome}: {str(e)[:120] or type(e).__name__}")
+            log(f"  ⏱️ {tarefa.nome}: {time.perf_counter() - inicio:.1f}s")
+            execucoes += 1
+
+            agora = self.relogio()
+            tarefa.quando += tarefa.intervalo
+            if tarefa.quando <= agora:
+                tarefa.quando = agora + tarefa.intervalo
+            tarefa.seq = next(self._seq)
+            heapq.heappush(self._heap, tarefa)
+        return execucoes
+
+
+class Daemon:
+    """Estado quente compartilhado pelas tarefas (store aberto, Session HTTP, escritas pendentes)."""
+
+    def __init__(self, push: bool = False) -> None:
+        self.push = push
+        self.parar = threading.Event()
+        self.agenda = Agenda(dormir=self.parar.wait)
+        self.store: post_store.PostStore | None = None
+        # ciclos que escreveram algo desde a última descarga
+        self.pendentes = 0
+
+    def iniciar(self) -> None:
+        bot.configurar()
+        bot.setup_repo()
+        http_session.ativar()
+        self.store = post_store.abrir()
+        log(f"🧠 {len(self.store)} post(s) em memória")
+
+    def agendar_tarefas(
+        self,
+        coleta_s: float = INTERVALO_COLETA_S,
+        editor_s: float = INTERVALO_EDITOR_S,
+        descarga_s: float = INTERVALO_DESCARGA_S,
+        editor: bool = True,
+        escalonar: bool = True,
+    ) -> None:
+        for i, tema in enumerate(TEMAS):
+            # coletas espalhadas pelo intervalo: um tema por vez, não todos juntos
+            atraso = coleta_s * i / len(TEMAS) if escalonar else 0.0
+            self.agenda.agendar(f"coleta {tema['nome']}", coleta_s, partial(self.coletar, tema), atraso)
+        if editor:
+            self.agenda.agendar("editor", editor_s, self.revisar, editor_s / 2 if escalonar else 0.0)
+        self.agenda.agendar("descarga", descarga_s, self.descarregar, descarga_s if escalonar else 0.0)
+
+    def coletar(self, tema: dict[str, Any]) -> None:
+        if bot.executar(tema=tema, store=self.store, publicar_ao_fim=False):
+            self.pendentes += 1
+
+    def revisar(self) -> None:
+        # mesmo store: o editor enxerga os posts recém-publicados sem reler o disco
+        try:
+            editor_bot.main([], store=self.store)
+        finally:
+            self.pendentes += 1
+
+    def descarregar(self) -> None:
+        """Commit (e push opcional) do que as tarefas escreveram desde a última descarga."""
+        if not self.pendentes:
+            return
+        # posts.json (formato antigo) acompanha a descarga, não cada post
+        if self.store is not None:
+            with atomic_write.lote():
+                self.store.exportar_json()
+                self.store.salvar()
+        # um commit para tudo o que mudou desde a última descarga (git_publish)
+        bot.publicar(f"Daemon: {self.pendentes} ciclo(s)", push=self.push)
+        self.pendentes = 0
+
+    def rodar(self, max_execucoes: int | None = None) -> int:
+        try:
+            return self.agenda.rodar(self.parar.is_set, max_execucoes)
+        finally:
+            self.descarregar()
+            http_session.encerrar()
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Publicador + editor como processo contínuo")
+    parser.add_argument("--push", action="store_true", help="faz git push depois de cada descarga")
+    parser.add_argument("--sem-editor", action="store_true", help="só coleta (sem passadas do editor)")
+    parser.add_argument("--uma-vez", action="store_true", help="roda cada tarefa uma vez, sem espera, e sai")
+    args = parser.parse_args(argv)
+
+    daemon = Daemon(push=args.push)
+    for sinal in (signal.SIGTERM, signal.SIGINT):
+        signal.signal(sinal, lambda *_: daemon.parar.set())
+
+    log("🌍 VIVIMUNDO BOT - daemon")
+    daemon.iniciar()
+    daemon.agendar_tarefas(
+        coleta_s=float(os.getenv("DAEMON_COLETA_S", str(INTERVALO_COLETA_S))),
+        editor_s=float(os.getenv("DAEMON_EDITOR_S", str(INTERVALO_EDITOR_S))),
+        descarga_s=float(os.getenv("DAEMON_FLUSH_S", str(INTERVALO_DESCARGA_S))),
+        editor=not args.sem_editor,
+        escalonar=not args.uma_vez,
+    )
+    execucoes = daemon.rodar(len(daemon.agenda) if args.uma_vez else None)
+    log(f"👋 Daemon encerrado ({execucoes} tarefa(s) executada(s))")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
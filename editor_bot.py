@@ -14,36 +14,69 @@ Regras (obrigatórias):
 - Corrigir título bugado (grudado) quando possível
 - Pode excluir posts irrecuperáveis
 
+Cada execução verifica só os posts novos ou alterados desde a última
+verificação, mais uma amostra rotativa dos demais (ver editor_ledger.py).
+O parse e as regras de cada post rodam num pool de processos (--workers).
+No modo apply, as correções saem de uma fila de prioridade guardada no
+ledger (severidade, recência e custo em Groq), não da ordem dos posts, em
+ondas: as reescritas da onda vão para a Groq ao mesmo tempo (até
+--concorrencia-groq, no ritmo de GROQ_RPM) e escrita dos arquivos e remoções
+acontecem depois, no processo principal, na ordem da fila.
+
+Uso:
+    python editor_bot.py [--workers N] [--completo] [--concorrencia-groq N]
+
 Este bot faz commit/push automaticamente via workflow.
 """
 
+import argparse
 import json
 import os
 import re
 import time
-from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterable, Iterator
 
-import requests
 from bs4 import BeautifulSoup
 
+import atomic_write
+import editor_ledger
+import editor_report
+import llm_router
+import post_index
+import post_store
+import prompt_budget
+
 
 def log(msg: str) -> None:
     print(msg, flush=True)
 
 
 GROQ_API_KEY = os.getenv("GROQ_API_KEY")
-if not GROQ_API_KEY:
-    log("❌ GROQ_API_KEY não encontrada! (Editor precisa para reescrita)")
-    raise SystemExit(1)
 
 
 POSTS_JSON = Path("posts.json")
 POSTS_DIR = Path("posts")
-REPORT_MD = Path("EDITOR_REPORT.md")
+REPORT_MD = editor_report.REPORT_MD
 QUARANTINE_DIR = POSTS_DIR / "_quarantine"
 
+# Orçamento de tokens do texto base enviado para reescrita
+ORCAMENTO_TOKENS_REESCRITA = 800
+
+# Reescritas simultâneas na Groq (o ritmo por minuto fica com GROQ_RPM, ver llm_router)
+CONCORRENCIA_GROQ = 4
+# Segundos desde o início da execução depois dos quais nenhuma reescrita nova começa
+PRAZO_EXECUCAO_S = 210
+# Timeout de cada tentativa de reescrita; com menos tempo que o mínimo até o prazo, não tenta
+TIMEOUT_REESCRITA_S = 70
+TIMEOUT_REESCRITA_MIN_S = 10
+
+
+class PrazoEsgotado(Exception):
+    """O prazo da execução acabou antes da primeira tentativa de reescrita."""
+
 
 @dataclass
 class EditResult:
@@ -51,6 +84,10 @@ class EditResult:
     deleted: bool = False
     quarantined: bool = False
     reasons: list[str] | None = None
+    flags: list[str] | None = None
+    # tempo do post (triagem/auditoria no pool) e da reescrita via Groq, em ms
+    ms: float | None = field(default=None, compare=False)
+    groq_ms: float | None = field(default=None, compare=False)
 
 
 def normalizar_titulo(titulo: str) -> str:
@@ -270,42 +307,86 @@ def remover_primeiro_paragrafo_se_repetir_titulo(texto: str, titulo: str) -> tup
     return texto, False
 
 
-def extrair_texto_post_html(html: str) -> tuple[str, str, str]:
-    """Retorna (titulo_h1, img_src, texto_plano)"""
-    soup = BeautifulSoup(html, "html.parser")
-    h1 = soup.find("h1")
-    titulo = h1.get_text(" ", strip=True) if h1 else ""
-
-    img = soup.find("img", class_="post-principal-imagem")
-    img_src = img.get("src", "") if img else ""
-
-    conteudo = soup.find(class_="post-conteudo")
-    texto = conteudo.get_text("\n\n", strip=True) if conteudo else soup.get_text("\n\n", strip=True)
-    return titulo, img_src, texto
+class SessaoEdicao:
+    """HTML de um post parseado uma única vez.
 
+    Leituras (título, imagem, texto) e alterações (título, conteúdo) atuam
+    sobre a mesma árvore; html() serializa no fim, e salvar() só escreve se
+    alguma alteração foi feita.
+    """
 
-def substituir_conteudo_html(html: str, novo_titulo: str | None, novo_conteudo_html: str | None) -> str:
-    soup = BeautifulSoup(html, "html.parser")
-    if novo_titulo:
-        h1 = soup.find("h1", class_="post-titulo") or soup.find("h1")
+    def __init__(self, html: str, caminho: Path | None = None):
+        self.caminho = caminho
+        self.soup = BeautifulSoup(html, "html.parser")
+        self.alterado = False
+
+    @classmethod
+    def abrir(cls, caminho: Path) -> "SessaoEdicao":
+        return cls(caminho.read_text(encoding="utf-8", errors="ignore"), caminho)
+
+    @property
+    def titulo(self) -> str:
+        h1 = self.soup.find("h1")
+        return h1.get_text(" ", strip=True) if h1 else ""
+
+    @property
+    def imagem(self) -> str:
+        img = self.soup.find("img", class_="post-principal-imagem")
+        return img.get("src", "") if img else ""
+
+    @property
+    def texto(self) -> str:
+        conteudo = self.soup.find(class_="post-conteudo")
+        return conteudo.get_text("\n\n", strip=True) if conteudo else self.soup.get_text("\n\n", strip=True)
+
+    def definir_titulo(self, novo_titulo: str) -> None:
+        """Atualiza h1, <title> e og:title."""
+        if not novo_titulo:
+            return
+        h1 = self.soup.find("h1", class_="post-titulo") or self.soup.find("h1")
         if h1:
             h1.string = novo_titulo
-        title_tag = soup.find("title")
+        title_tag = self.soup.find("title")
         if title_tag:
             title_tag.string = f"{novo_titulo} - Vivimundo"
-        ogt = soup.find("meta", property="og:title")
+        ogt = self.soup.find("meta", property="og:title")
         if ogt:
             ogt["content"] = novo_titulo
+        self.alterado = True
 
-    if novo_conteudo_html:
-        container = soup.find(class_="post-conteudo")
+    def definir_conteudo(self, novo_conteudo_html: str) -> None:
+        """Troca o conteúdo de .post-conteudo pelo fragmento HTML dado."""
+        if not novo_conteudo_html:
+            return
+        container = self.soup.find(class_="post-conteudo")
         if container:
             container.clear()
             frag = BeautifulSoup(novo_conteudo_html, "html.parser")
-            for el in frag.contents:
+            for el in list(frag.contents):
                 container.append(el)
+            self.alterado = True
+
+    def html(self) -> str:
+        return str(self.soup)
 
-    return str(soup)
+    def salvar(self) -> bool:
+        """Serializa e grava (via atomic_write) só se houve alteração."""
+        if not self.alterado or self.caminho is None:
+            return False
+        return atomic_write.escrever_texto(self.caminho, self.html())
+
+
+def extrair_texto_post_html(html: str) -> tuple[str, str, str]:
+    """Retorna (titulo_h1, img_src, texto_plano)"""
+    sessao = SessaoEdicao(html)
+    return sessao.titulo, sessao.imagem, sessao.texto
+
+
+def substituir_conteudo_html(html: str, novo_titulo: str | None, novo_conteudo_html: str | None) -> str:
+    sessao = SessaoEdicao(html)
+    sessao.definir_titulo(novo_titulo or "")
+    sessao.definir_conteudo(novo_conteudo_html or "")
+    return sessao.html()
 
 
 def formatar_em_paragrafos_html(texto_plano: str) -> str:
@@ -319,11 +400,19 @@ def formatar_em_paragrafos_html(texto_plano: str) -> str:
     return "\n".join(ps)
 
 
-def chamar_groq_reescrita(titulo: str, texto_base: str) -> str:
+def chamar_groq_reescrita(titulo: str, texto_base: str, prazo: float | None = None) -> str:
+    """Reescrita via Groq com até 3 tentativas.
+
+    Com `prazo` (time.monotonic), cada tentativa só começa se ainda houver
+    TIMEOUT_REESCRITA_MIN_S até ele (contando a pausa pendente do
+    llm_router.limitador), e o timeout dela é limitado ao tempo que falta.
+    Sem tempo para a primeira tentativa: PrazoEsgotado.
+    """
+    texto_base = prompt_budget.selecionar_trechos(texto_base, titulo, ORCAMENTO_TOKENS_REESCRITA)
     prompt = f"""Reescreva e melhore a matéria abaixo em português brasileiro.
 
 Título: {titulo}
-Conteúdo base: {texto_base[:3500]}
+Conteúdo base: {texto_base}
 
 Regras obrigatórias:
 1) Texto 100% PT-BR (sem frases em inglês).
@@ -336,22 +425,22 @@ Regras obrigatórias:
     last_err: Exception | None = None
     # retries com backoff para instabilidade momentânea
     for tentativa in range(1, 4):
+        timeout = float(TIMEOUT_REESCRITA_S)
+        if prazo is not None:
+            timeout = min(timeout, prazo - time.monotonic() - llm_router.limitador.espera_prevista())
+            if timeout < TIMEOUT_REESCRITA_MIN_S:
+                if last_err is None:
+                    raise PrazoEsgotado()
+                log(f"  ⏱ Groq: prazo da execução esgotado após {tentativa - 1} tentativa(s)")
+                break
         try:
-            resp = requests.post(
-                "https://api.groq.com/openai/v1/chat/completions",
-                headers={"Authorization": f"Bearer {GROQ_API_KEY}", "Content-Type": "application/json"},
-                json={
-                    "model": "llama-3.3-70b-versatile",
-                    "messages": [{"role": "user", "content": prompt}],
-                    "temperature": 0.2,
-                    "max_tokens": 2000,
-                },
-                timeout=70,
-            )
-            resp.raise_for_status()
-            return resp.json()["choices"][0]["message"]["content"].strip()
+            return llm_router.chamar("reescrita", prompt, temperature=0.2, max_tokens=2000, timeout=timeout)
         except Exception as e:
             last_err = e
+            if isinstance(e, llm_router.LimiteExcedido):
+                # a pausa do Retry-After vale para todas as threads (llm_router.limitador)
+                log(f"  ⏳ Groq tentativa {tentativa}/3: limite de taxa, aguardando {e.espera:.0f}s...")
+                continue
             espera = 2 * tentativa
             log(f"  ⚠️ Groq tentativa {tentativa}/3 falhou ({str(e)[:60]}). Aguardando {espera}s...")
             time.sleep(espera)
@@ -377,53 +466,192 @@ def avaliar_flags(titulo: str, texto: str) -> list[str]:
     return flags
 
 
-def editar_um_post(post: dict[str, Any]) -> EditResult:
-    url = post.get("url", "")
-    if not url:
-        return EditResult(changed=False, deleted=True, reasons=["sem_url"])
+# Flags que levam à reescrita via Groq no modo apply
+FLAGS_REESCRITA = ("nao_ptbr", "menciona_fonte", "repete_titulo", "curto", "markdown")
 
-    html_path = Path(url)
-    if not html_path.exists():
-        return EditResult(changed=False, deleted=True, reasons=["arquivo_nao_existe"])
 
-    html = html_path.read_text(encoding="utf-8", errors="ignore")
-    h1, img_src, texto = extrair_texto_post_html(html)
+def analisar_texto(post: dict[str, Any], h1: str, texto: str) -> tuple[str, str, list[str], list[str]]:
+    """Correções baratas e flags de um post, sem IA e sem alterar nada.
 
-    # 1) Corrige título (metadado + h1) se grudado
+    Retorna (titulo, texto_limpo, reasons, flags); `titulo` é o que o post
+    terá depois da correção de título (ou o atual).
+    """
     titulo_atual = post.get("titulo") or h1
     titulo_corrigido = limpar_titulo(titulo_atual)
 
-    mudou = False
     reasons: list[str] = []
+    titulo = post.get("titulo", "")
     if titulo_corrigido and titulo_corrigido != titulo_atual:
-        post["titulo"] = titulo_corrigido
-        html = substituir_conteudo_html(html, novo_titulo=titulo_corrigido, novo_conteudo_html=None)
-        mudou = True
+        titulo = titulo_corrigido
         reasons.append("titulo_corrigido")
 
-    # 2) Limpeza rápida do texto existente
     texto = limpar_boilerplate(texto)
     texto = corrigir_espacamento(texto)
     texto, rm_fonte = remover_mencoes_de_fonte(texto)
     if rm_fonte:
-        mudou = True
         reasons.append("removeu_fonte")
 
-    texto, rm_rep = remover_primeiro_paragrafo_se_repetir_titulo(texto, post.get("titulo", ""))
+    texto, rm_rep = remover_primeiro_paragrafo_se_repetir_titulo(texto, titulo)
     if rm_rep:
-        mudou = True
         reasons.append("removeu_rep_titulo")
 
-    flags = avaliar_flags(post.get("titulo", ""), texto)
-    if flags:
-        log(f"  🧷 Flags detectadas em {html_path.name}: {', '.join(flags)}")
+    return titulo, texto, reasons, avaliar_flags(titulo, texto)
+
+
+def triar_post(post: dict[str, Any]) -> EditResult:
+    """O que editar_um_post faria com o post, sem Groq e sem escrever (roda no pool).
+
+    changed=True quando há correção barata a aplicar (reasons); as flags dizem se
+    haverá reescrita. O resultado vai para a fila do editor_ledger.
+    """
+    url = post.get("url", "")
+    if not url:
+        return EditResult(changed=False, deleted=True, reasons=["sem_url"])
+    if not post_index.existe(url):
+        return EditResult(changed=False, deleted=True, reasons=["arquivo_nao_existe"])
+    inicio = time.perf_counter()
+    sessao = SessaoEdicao.abrir(Path(url))
+    _titulo, _texto, reasons, flags = analisar_texto(post, sessao.titulo, sessao.texto)
+    ms = (time.perf_counter() - inicio) * 1000
+    return EditResult(changed=bool(reasons), deleted=False, reasons=reasons or None, flags=flags, ms=ms)
+
+
+def auditar_post(post: dict[str, Any]) -> EditResult:
+    """Auditoria de um post (roda no pool): só detecta flags, não altera nada."""
+    url = post.get("url", "")
+    if not post_index.existe(url):
+        return EditResult(changed=False, deleted=True, reasons=["arquivo_nao_existe"])
+    inicio = time.perf_counter()
+    sessao = SessaoEdicao.abrir(Path(url))
+    titulo_ref = post.get("titulo") or sessao.titulo
+    flags = avaliar_flags(titulo_ref, sessao.texto)
+    if limpar_titulo(titulo_ref) != titulo_ref:
+        flags.append("titulo_grudado")
+    return EditResult(changed=False, deleted=False, flags=flags, ms=(time.perf_counter() - inicio) * 1000)
+
+
+def mapear_posts(
+    func: Callable[[dict[str, Any]], EditResult], posts: Iterable[dict[str, Any]], workers: int = 1
+) -> Iterator[EditResult]:
+    """func(post) para cada post, na mesma ordem; com workers > 1 o trabalho vai para um pool de processos.
+
+    Só a parte de CPU (parse + regras) roda nos workers: eles não escrevem nada e
+    os resultados são consumidos em ordem pelo processo principal, que aplica
+    remoções/quarentenas/edições e respeita os limites por execução.
+    """
+    posts = list(posts)
+    if workers <= 1 or len(posts) < 2:
+        yield from map(func, posts)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # cancel_futures: se o chamador parar no meio (limites), o que falta nem roda
+        try:
+            yield from pool.map(func, posts, chunksize=max(1, min(32, len(posts) // (workers * 4))))
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+
+@dataclass
+class PlanoEdicao:
+    """Um post da fila com as correções baratas já aplicadas na sessão (nada salvo ainda).
+
+    `resultado` já vem preenchido quando o post nem chega a ser editado (sem
+    URL/arquivo); senão, concluir_edicao() decide com a reescrita da Groq, se houve.
+    """
 
-    # 3) Se falhou PT-BR ou está muito ruim, reescreve via Groq
-    if any(f in flags for f in ["nao_ptbr", "menciona_fonte", "repete_titulo", "curto", "markdown"]):
+    post: dict[str, Any]
+    sessao: SessaoEdicao | None = None
+    titulo: str = ""
+    texto: str = ""
+    reasons: list[str] = field(default_factory=list)
+    flags: list[str] = field(default_factory=list)
+    resultado: EditResult | None = None
+
+    @property
+    def precisa_groq(self) -> bool:
+        return self.resultado is None and any(f in self.flags for f in FLAGS_REESCRITA)
+
+
+@dataclass
+class Reescrita:
+    """Resposta da Groq para um plano: texto novo ou erro (adiada = nem foi chamada, prazo esgotado)."""
+
+    texto: str | None = None
+    erro: Exception | None = None
+    ms: float | None = None
+    adiada: bool = False
+
+
+def preparar_edicao(post: dict[str, Any]) -> PlanoEdicao:
+    url = post.get("url", "")
+    if not url:
+        return PlanoEdicao(post, resultado=EditResult(changed=False, deleted=True, reasons=["sem_url"]))
+    if not post_index.existe(url):
+        return PlanoEdicao(post, resultado=EditResult(changed=False, deleted=True, reasons=["arquivo_nao_existe"]))
+
+    # Um único parse; todas as alterações vão para a mesma árvore
+    sessao = SessaoEdicao.abrir(Path(url))
+
+    # 1) Correções baratas: título grudado, fonte, título repetido no 1º parágrafo
+    titulo, texto, reasons, flags = analisar_texto(post, sessao.titulo, sessao.texto)
+    if "titulo_corrigido" in reasons:
+        sessao.definir_titulo(titulo)
+    if flags:
+        log(f"  🧷 Flags detectadas em {Path(url).name}: {', '.join(flags)}")
+    return PlanoEdicao(post, sessao, titulo, texto, reasons, flags)
+
+
+def reescrever(plano: PlanoEdicao, prazo: float | None = None) -> Reescrita:
+    """Chamada à Groq de um plano (pode rodar em thread). Não toca em arquivo nem no post."""
+    if prazo is not None and time.monotonic() >= prazo:
+        return Reescrita(adiada=True)
+    log(f"  ✍️ Reescrevendo via Groq: {plano.titulo[:60]}...")
+    inicio = time.perf_counter()
+    try:
+        return Reescrita(
+            texto=chamar_groq_reescrita(plano.titulo, plano.texto, prazo), ms=(time.perf_counter() - inicio) * 1000
+        )
+    except PrazoEsgotado:
+        return Reescrita(adiada=True)
+    except Exception as e:
+        return Reescrita(erro=e, ms=(time.perf_counter() - inicio) * 1000)
+
+
+def reescrever_em_paralelo(
+    planos: list[PlanoEdicao], concorrencia: int, prazo: float | None = None
+) -> list[Reescrita]:
+    """Reescritas dos planos com no máximo `concorrencia` chamadas em andamento.
+
+    O resultado sai na ordem de `planos`, independentemente de quem terminou
+    primeiro. O ritmo das requisições e os 429 ficam com llm_router.limitador;
+    depois do `prazo` (time.monotonic) nenhuma chamada nova começa.
+    """
+    if concorrencia <= 1 or len(planos) < 2:
+        return [reescrever(p, prazo) for p in planos]
+    with ThreadPoolExecutor(max_workers=concorrencia, thread_name_prefix="groq") as pool:
+        return list(pool.map(lambda p: reescrever(p, prazo), planos))
+
+
+def concluir_edicao(plano: PlanoEdicao, reescrita: Reescrita | None = None) -> EditResult:
+    """Aplica a reescrita (ou o fallback sem IA) ao plano e salva o post se algo mudou."""
+    if plano.resultado is not None:
+        return plano.resultado
+    post, sessao, texto = plano.post, plano.sessao, plano.texto
+    assert sessao is not None
+    reasons = list(plano.reasons)
+    mudou = bool(reasons)
+    if "titulo_corrigido" in reasons:
+        post["titulo"] = plano.titulo
+    # flags que valem depois das correções (vão para o editor_ledger)
+    flags_finais = plano.flags
+    groq_ms = reescrita.ms if reescrita else None
+
+    # 2) Se falhou PT-BR ou está muito ruim, usa a reescrita via Groq
+    if reescrita is not None:
         try:
-            log(f"  ✍️ Reescrevendo via Groq: {post.get('titulo','')[:60]}...")
-            novo = chamar_groq_reescrita(post.get("titulo", ""), texto)
-            novo = corrigir_espacamento(novo)
+            if reescrita.erro is not None:
+                raise reescrita.erro
+            novo = corrigir_espacamento(reescrita.texto or "")
             novo, _ = remover_mencoes_de_fonte(novo)
             novo, _ = remover_primeiro_paragrafo_se_repetir_titulo(novo, post.get("titulo", ""))
 
@@ -432,15 +660,16 @@ def editar_um_post(post: dict[str, Any]) -> EditResult:
             if "nao_ptbr" in flags2:
                 # irrecuperável -> deletar
                 log("  🗑️ Irrecuperável (não PT-BR após reescrita). Deletando post.")
-                return EditResult(changed=False, deleted=True, reasons=["nao_ptbr_irrecuperavel"])
+                return EditResult(changed=False, deleted=True, reasons=["nao_ptbr_irrecuperavel"], groq_ms=groq_ms)
 
             # aplica (se veio texto sem <p>, transforma)
             if "<p" not in novo:
                 novo = formatar_em_paragrafos_html(novo)
 
-            html = substituir_conteudo_html(html, novo_titulo=None, novo_conteudo_html=novo)
+            sessao.definir_conteudo(novo)
             mudou = True
             reasons.append("reescrito_groq")
+            flags_finais = flags2
         except Exception as e:
             log(f"  ⚠️ Groq reescrita falhou: {str(e)[:80]}")
 
@@ -454,147 +683,277 @@ def editar_um_post(post: dict[str, Any]) -> EditResult:
                 if "nao_ptbr" not in flags3 and len(candidato) >= 800:
                     if "<p" not in candidato:
                         candidato = formatar_em_paragrafos_html(candidato)
-                    html = substituir_conteudo_html(html, novo_titulo=None, novo_conteudo_html=candidato)
+                    sessao.definir_conteudo(candidato)
                     mudou = True
                     reasons.append("fallback_regra_sem_groq")
+                    flags_finais = flags3
                 else:
                     # Se ainda estiver ruim (curto/nao_ptbr), quarentena.
                     log("  🟧 Quarentenando: sem Groq e qualidade insuficiente")
-                    return EditResult(changed=False, deleted=True, quarantined=True, reasons=["quarentena_sem_groq"])
+                    return EditResult(changed=False, deleted=True, quarantined=True, reasons=["quarentena_sem_groq"], groq_ms=groq_ms)
             else:
                 # Texto não PT-BR e sem Groq -> quarentena
                 log("  🟧 Quarentenando: nao_ptbr e Groq indisponível")
-                return EditResult(changed=False, deleted=True, quarantined=True, reasons=["quarentena_nao_ptbr_sem_groq"])
+                return EditResult(changed=False, deleted=True, quarantined=True, reasons=["quarentena_nao_ptbr_sem_groq"], groq_ms=groq_ms)
 
     if mudou:
-        html_path.write_text(html, encoding="utf-8")
+        sessao.salvar()
 
-    return EditResult(changed=mudou, deleted=False, reasons=reasons or None)
+    return EditResult(changed=mudou, deleted=False, reasons=reasons or None, flags=flags_finais, groq_ms=groq_ms)
 
 
-def remover_post(posts: list[dict[str, Any]], idx: int) -> None:
-    p = posts[idx]
-    url = p.get("url")
+def editar_um_post(post: dict[str, Any]) -> EditResult:
+    """Edição completa de um post, em série (preparar + Groq se preciso + concluir)."""
+    plano = preparar_edicao(post)
+    return concluir_edicao(plano, reescrever(plano) if plano.precisa_groq else None)
+
+
+def montar_onda(
+    fila: list[dict[str, Any]],
+    inicio: int,
+    ledger: dict[str, dict[str, Any]],
+    edits: int,
+    deletes: int,
+    max_edits: int,
+    max_deletes: int,
+) -> tuple[list[dict[str, Any]], int]:
+    """Próximo trecho da fila que cabe nos limites, a partir de `inicio`.
+
+    Cada post reserva uma vaga (remoção: delete; demais: edit). A onda para no
+    primeiro post que só caberia se alguma reserva não se confirmasse: ele
+    volta na próxima onda, já com os contadores reais. Assim o conjunto e a
+    ordem dos posts tratados são os mesmos da execução em série. Retorna
+    (posts da onda, posição onde a próxima onda começa).
+    """
+    onda: list[dict[str, Any]] = []
+    reserva_edits = reserva_deletes = 0
+    i = inicio
+    while i < len(fila):
+        if edits >= max_edits and deletes >= max_deletes:
+            return onda, len(fila)
+        remocao = "arquivo_ausente" in ledger[fila[i].get("url", "")]["flags"]
+        usados, reservados, limite = (deletes, reserva_deletes, max_deletes) if remocao else (edits, reserva_edits, max_edits)
+        if usados < limite:
+            if usados + reservados >= limite:
+                break
+            onda.append(fila[i])
+            if remocao:
+                reserva_deletes += 1
+            else:
+                reserva_edits += 1
+        i += 1
+    return onda, i
+
+
+def remover_post(store: post_store.PostStore, post: dict[str, Any]) -> None:
+    url = post.get("url")
     if url:
         try:
-            Path(url).unlink(missing_ok=True)
+            atomic_write.remover(url)
+            post_index.remover_arquivo(url)
         except Exception:
             pass
-    posts.pop(idx)
+        store.remover(url)
 
 
 def quarentenar_post(arquivo: Path) -> Path:
-    QUARANTINE_DIR.mkdir(parents=True, exist_ok=True)
     destino = QUARANTINE_DIR / arquivo.name
     # evita sobrescrever
     if destino.exists():
         destino = QUARANTINE_DIR / f"{arquivo.stem}-{int(time.time())}{arquivo.suffix}"
-    arquivo.replace(destino)
+    atomic_write.mover(arquivo, destino)
+    post_index.remover_arquivo(arquivo.as_posix())
     return destino
 
 
-def escrever_relatorio(linhas: list[str]) -> None:
-    cabecalho = [
-        "# Vivimundo Editor Report",
-        "",
-        "Relatório gerado automaticamente pelo editor.",
-        "",
-    ]
-    REPORT_MD.write_text("\n".join(cabecalho + linhas) + "\n", encoding="utf-8")
-
+def main(argv: list[str] | None = None, store: post_store.PostStore | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Revisa os posts publicados (auditoria ou correções)")
+    parser.add_argument(
+        "--workers", type=int, default=int(os.getenv("EDITOR_WORKERS", "0")) or os.cpu_count() or 1,
+        help="processos para parse/regras dos posts (padrão: nº de CPUs)",
+    )
+    parser.add_argument("--completo", action="store_true", help="verifica o acervo inteiro, ignorando o editor_ledger")
+    parser.add_argument(
+        "--concorrencia-groq", type=int, default=int(os.getenv("EDITOR_GROQ_CONCURRENCY", str(CONCORRENCIA_GROQ))),
+        help="reescritas via Groq em andamento ao mesmo tempo (modo apply)",
+    )
+    args = parser.parse_args(argv)
+    # depois do prazo nenhuma reescrita nova começa (o workflow roda a cada 5 min)
+    prazo = time.monotonic() + float(os.getenv("EDITOR_DEADLINE_S", str(PRAZO_EXECUCAO_S)))
 
-def main() -> None:
-    if not POSTS_JSON.exists():
-        log("❌ posts.json não encontrado")
+    if not GROQ_API_KEY:
+        log("❌ GROQ_API_KEY não encontrada! (Editor precisa para reescrita)")
         raise SystemExit(1)
 
-    posts: list[dict[str, Any]] = json.loads(POSTS_JSON.read_text(encoding="utf-8"))
-    if not isinstance(posts, list):
-        log("❌ posts.json inválido")
+    if store is None:
+        try:
+            store = post_store.abrir(posts_json=POSTS_JSON)
+        except Exception as e:
+            log(f"❌ posts inválidos: {str(e)[:120]}")
+            raise SystemExit(1)
+    if not len(store):
+        log("❌ Nenhum post encontrado (post_store/ ou posts.json)")
         raise SystemExit(1)
+    # lista só para leitura em ordem; remoções vão para o store (sem list.pop)
+    posts = store.todos()
 
     max_edits = int(os.getenv("EDITOR_MAX_EDITS_PER_RUN", "25"))
     max_deletes = int(os.getenv("EDITOR_MAX_DELETES_PER_RUN", "10"))
+    amostra = int(os.getenv("EDITOR_SAMPLE_PER_RUN", str(editor_ledger.AMOSTRA_PADRAO)))
     apply_fixes = os.getenv("EDITOR_APPLY_FIXES", "0").strip() == "1"
 
+    # Só posts novos/alterados (pelo conteúdo) + amostra rotativa dos verificados há mais tempo
+    ledger = editor_ledger.carregar()
+    candidatos, digitais = editor_ledger.selecionar(posts, ledger, len(posts) if args.completo else amostra)
+    log(f"🔎 {len(candidatos)} de {len(posts)} post(s) para verificar (amostra rotativa={amostra}, workers={args.workers})")
+
     edits = 0
     deletes = 0
-    relatorio: list[str] = []
-    relatorio.append(f"- Modo: {'APLICANDO correções' if apply_fixes else 'AUDITORIA (sem alterar posts)'}")
-    relatorio.append(f"- Limites: max_edits={max_edits}, max_deletes={max_deletes}")
-    relatorio.append("")
-    i = len(posts) - 1
-    while i >= 0:
-        if edits >= max_edits and deletes >= max_deletes:
-            break
+    execucao = editor_report.Execucao(
+        "apply" if apply_fixes else "audit", max_edits, max_deletes, amostra, args.workers, args.concorrencia_groq
+    )
+    # 1) Parse + regras no pool (na ordem dos candidatos): só registra no ledger, sem Groq nem escrita
+    resultados = mapear_posts(triar_post if apply_fixes else auditar_post, (posts[i] for i in candidatos), args.workers)
+    for i, res in zip(candidatos, resultados):
+        url = posts[i].get("url", "")
+        if res.deleted:
+            if not apply_fixes:
+                execucao.post("ausente", posts[i])
+            editor_ledger.registrar(ledger, posts[i], ["arquivo_ausente"])
+            continue
+        execucao.triagem(res.ms or 0.0)
+        flags = res.flags or []
+        if flags and not apply_fixes:
+            execucao.post("flags", posts[i], flags=flags, ms=res.ms)
+        editor_ledger.registrar(ledger, posts[i], flags, digitais.get(url), acoes=res.reasons or [])
+    resultados.close()
+
+    # 2) Fila de correções (persistida no ledger): o orçamento da execução vai para o topo
+    fila = editor_ledger.fila(ledger, posts, FLAGS_REESCRITA)
+    log(f"📋 Fila de correções: {len(fila)} pendente(s)")
+    if apply_fixes:
+        # Em ondas: correções locais em série, reescritas da onda em paralelo na Groq,
+        # resultados aplicados na ordem da fila (mesmas decisões da execução em série)
+        cursor = 0
+        while cursor < len(fila):
+            onda, cursor = montar_onda(fila, cursor, ledger, edits, deletes, max_edits, max_deletes)
+            if not onda:
+                break
+            planos, ms_locais = [], []
+            for post in onda:
+                inicio = time.perf_counter()
+                planos.append(preparar_edicao(post))
+                ms_locais.append((time.perf_counter() - inicio) * 1000)
+            com_groq = [p for p in planos if p.precisa_groq]
+            inicio_groq = time.perf_counter()
+            reescritas = dict(zip(map(id, com_groq), reescrever_em_paralelo(com_groq, args.concorrencia_groq, prazo)))
+            if com_groq:
+                execucao.reescritas((time.perf_counter() - inicio_groq) * 1000)
+
+            for plano, ms_local in zip(planos, ms_locais):
+                post = plano.post
+                url = post.get("url", "")
+                entrada = ledger[url]
+                remocao = "arquivo_ausente" in entrada["flags"]
+                if edits >= max_edits and deletes >= max_deletes:
+                    break
+                if (remocao and deletes >= max_deletes) or (not remocao and edits >= max_edits):
+                    continue
+                reescrita = reescritas.get(id(plano))
+                if reescrita is not None and reescrita.adiada:
+                    # prazo da execução esgotado antes da chamada: fica na fila, sem contar tentativa
+                    execucao.post("adiado", post, flags=plano.flags)
+                    continue
+
+                inicio = time.perf_counter()
+                res = concluir_edicao(plano, reescrita)
+                ms = ms_local + (time.perf_counter() - inicio) * 1000 + (res.groq_ms or 0.0)
+                tempos = {"ms": ms, "groq_ms": res.groq_ms}
+                if res.deleted:
+                    if deletes < max_deletes:
+                        log(f"  🗑️ Removendo do índice: {post.get('titulo','')[:60]} | {res.reasons}")
+                        if res.quarantined and url:
+                            try:
+                                destino = quarentenar_post(Path(url))
+                                execucao.post("quarentena", post, acoes=res.reasons, destino=destino.as_posix(), **tempos)
+                            except Exception as e:
+                                execucao.post("quarentena_falhou", post, acoes=res.reasons, erro=str(e)[:60], **tempos)
+                        else:
+                            execucao.post("delete", post, acoes=res.reasons, **tempos)
+                        remover_post(store, post)
+                        editor_ledger.esquecer(ledger, url)
+                        deletes += 1
+                    else:
+                        log("  ⛔ Limite de deletions por execução atingido")
+                        execucao.post("delete_bloqueado", post, acoes=res.reasons, **tempos)
+                    continue
+
+                # flags que sobraram depois da correção contam como tentativa (sai da fila após MAX_TENTATIVAS)
+                tentativas = entrada.get("tentativas", 0) + 1 if res.flags else 0
+                if res.changed:
+                    store.atualizar(url)
+                    edits += 1
+                    execucao.post("edit", post, flags=res.flags, acoes=res.reasons, **tempos)
+                # conteúdo novo (se editado): impressão digital recalculada
+                editor_ledger.registrar(ledger, post, res.flags or [], tentativas=tentativas)
+    else:
+        for post in fila[:10]:
+            entrada = ledger[post["url"]]
+            execucao.registro["proximos_fila"].append(
+                {"url": post["url"], "titulo": post.get("titulo", "")[:80], "pendencias": entrada["flags"] + entrada.get("acoes", [])}
+            )
+
+    if deletes:
+        posts = store.todos()
+
+    # Reconciliação posts/ x posts.json (mesmo índice usado acima, sem novo scan)
+    reconciliacao = post_index.reconciliar(posts)
+
+    # Relatório, índice e páginas vão para o disco juntos (um único ponto de commit)
+    with atomic_write.lote():
+        # Sempre escreve relatório (registro da execução + resumo + markdown)
+        editor_report.salvar(
+            execucao.finalizar(
+                posts_total=len(posts),
+                verificados=len(candidatos),
+                edits=edits,
+                deletes=deletes,
+                fila=len(editor_ledger.fila(ledger, posts)),
+                flags_em_aberto=editor_ledger.resumo_flags(ledger),
+                reconciliacao={
+                    "orfaos": len(reconciliacao["orfaos"]),
+                    "pendentes": len(reconciliacao["pendentes"]),
+                    "exemplos_orfaos": reconciliacao["orfaos"][:20],
+                },
+            ),
+            REPORT_MD,
+        )
+        editor_ledger.salvar(ledger)
 
+        # Só altera índice/páginas se estiver aplicando correções
         if apply_fixes:
-            res = editar_um_post(posts[i])
-            if res.deleted:
-                if deletes < max_deletes:
-                    log(f"  🗑️ Removendo do índice: {posts[i].get('titulo','')[:60]} | {res.reasons}")
-                    url = posts[i].get('url','')
-                    if res.quarantined and url:
-                        try:
-                            destino = quarentenar_post(Path(url))
-                            relatorio.append(f"- 🟧 QUARENTENA: **{posts[i].get('titulo','')[:80]}** ({url}) -> `{destino.as_posix()}` | motivos={res.reasons}")
-                        except Exception as e:
-                            relatorio.append(f"- 🟧 QUARENTENA (falhou mover): **{posts[i].get('titulo','')[:80]}** ({url}) | err={str(e)[:60]} | motivos={res.reasons}")
-                    else:
-                        relatorio.append(f"- 🗑️ DELETE: **{posts[i].get('titulo','')[:80]}** ({url}) | motivos={res.reasons}")
-                    remover_post(posts, i)
-                    deletes += 1
-                else:
-                    log("  ⛔ Limite de deletions por execução atingido")
-                    relatorio.append(f"- ⛔ DELETE (bloqueado por limite): **{posts[i].get('titulo','')[:80]}** ({posts[i].get('url','')})")
-            elif res.changed:
-                edits += 1
-                relatorio.append(f"- ✏️ EDIT: **{posts[i].get('titulo','')[:80]}** ({posts[i].get('url','')}) | ações={res.reasons}")
-        else:
-            # Auditoria: não altera nada, só detecta flags
-            url = posts[i].get("url", "")
-            p = Path(url) if url else None
-            if not url or not p or not p.exists():
-                relatorio.append(f"- ❌ ARQUIVO AUSENTE: **{posts[i].get('titulo','')[:80]}** ({url})")
-                i -= 1
-                continue
-            html = p.read_text(encoding="utf-8", errors="ignore")
-            h1, _img, texto = extrair_texto_post_html(html)
-            titulo_ref = posts[i].get("titulo") or h1
-            flags = avaliar_flags(titulo_ref, texto)
-            titulo_limpo = limpar_titulo(titulo_ref)
-            if titulo_limpo != titulo_ref:
-                flags.append("titulo_grudado")
-            if flags:
-                relatorio.append(f"- ⚠️ FLAGS: **{titulo_ref[:80]}** ({url}) | {', '.join(flags)}")
-        i -= 1
-
-    # Sempre escreve relatório
-    relatorio.append("")
-    relatorio.append(f"- Resumo: edits={edits} deletes={deletes}")
-    escrever_relatorio(relatorio)
-
-    # Só altera índice/páginas se estiver aplicando correções
-    if apply_fixes:
-        POSTS_JSON.write_text(json.dumps(posts, ensure_ascii=False, indent=2), encoding="utf-8")
+            # post apagado sai do posts.json na hora; edições esperam a exportação periódica
+            if deletes:
+                store.exportar_json(POSTS_JSON)
+            else:
+                store.exportar_vencido(POSTS_JSON)
+            store.salvar()
 
-    # Regera home e categorias usando o mesmo gerador do projeto
-    if apply_fixes:
-        try:
-            import bot as publicador
+        # Regera home, categorias e feeds com o mesmo gerador do publicador (site_pages)
+        if apply_fixes:
+            try:
+                import site_pages
 
-            publicador.atualizar_home(posts)
-            publicador.gerar_paginas_categorias(posts)
-            log("✅ Páginas regeneradas")
-        except Exception as e:
-            log(f"⚠️ Não consegui regenerar páginas via bot.py: {str(e)[:120]}")
+                site_pages.regerar(posts)
+                log("✅ Páginas regeneradas")
+            except Exception as e:
+                log(f"⚠️ Não consegui regenerar páginas: {str(e)[:120]}")
 
     log(f"✅ Editor finalizado | modo={'apply' if apply_fixes else 'audit'} | edits={edits} deletes={deletes} | max_edits={max_edits} max_deletes={max_deletes}")
 
-    # Pausa curta para reduzir chance de execuções encavalarem em push-trigger
-    time.sleep(3)
-
 
 if __name__ == "__main__":
     main()
+    # Pausa curta para reduzir chance de execuções encavalarem em push-trigger
+    time.sleep(3)
 
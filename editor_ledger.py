@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Registro de auditoria do editor: o que já foi verificado, com que conteúdo.
+
+editor_ledger.json guarda, por URL de post, a impressão digital do conteúdo
+(sha256 do HTML + título do posts.json), as flags da última verificação e
+quando ela aconteceu. A cada execução o editor só reabre (BeautifulSoup +
+avaliar_flags) os posts:
+
+- novos ou cujo conteúdo mudou desde a última verificação;
+- verificados com outra versão das regras (VERSAO_REGRAS);
+- sem arquivo em posts/ (viram relatório/remoção, sem parse);
+- mais uma amostra rotativa dos verificados há mais tempo, para que o acervo
+  inteiro seja revisto aos poucos.
+
+O ledger também é a fila de correções do modo apply: toda entrada com flags
+ou ações pendentes está na fila, e fila() a ordena por prioridade
+(severidade das flags x recência do post / custo em Groq). O orçamento de
+edições de cada execução vai para o topo da fila; a entrada sai dela quando
+uma verificação a encontra limpa ou depois de MAX_TENTATIVAS correções que
+não resolveram.
+
+A impressão digital é por conteúdo e não por mtime: o workflow faz checkout
+novo a cada execução, o que muda o mtime de todos os arquivos. Ler e fazer o
+hash de todos os posts custa ~0,1s; o parse era o que pesava.
+"""
+
+import hashlib
+import json
+from datetime import datetime, timezone
+from typing import Any, Iterable
+
+import atomic_write
+import post_index
+import post_store
+
+LEDGER_JSON = "editor_ledger.json"
+
+# Incrementar quando avaliar_flags/limpezas do editor mudarem, para reverificar tudo
+VERSAO_REGRAS = 1
+
+AMOSTRA_PADRAO = 20
+
+# --- Prioridade da fila ---
+# Severidade por flag (auditoria/triagem) e por correção barata pendente
+PESOS_FLAGS = {
+    "arquivo_ausente": 100,
+    "nao_ptbr": 80,
+    "titulo_grudado": 40,
+    "markdown": 30,
+    "menciona_fonte": 30,
+    "repete_titulo": 20,
+    "curto": 15,
+}
+PESOS_ACOES = {"titulo_corrigido": 40, "removeu_fonte": 10, "removeu_rep_titulo": 10}
+PESO_PADRAO = 10
+# Uma reescrita via Groq custa tokens e tempo: conta como CUSTO_GROQ correções locais a mais
+CUSTO_GROQ = 4.0
+# Posts novos recebem mais visitas: até 3x de peso, caindo pela metade a cada MEIA_VIDA_DIAS
+MEIA_VIDA_DIAS = 7.0
+MAX_TENTATIVAS = 3
+
+
+def agora_iso() -> str:
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def carregar(caminho: str = LEDGER_JSON) -> dict[str, dict[str, Any]]:
+    bruto = atomic_write.ler_texto(caminho)
+    if bruto is None:
+        return {}
+    try:
+        data = json.loads(bruto)
+        return data if isinstance(data, dict) else {}
+    except Exception:
+        return {}
+
+
+def salvar(ledger: dict[str, dict[str, Any]], caminho: str = LEDGER_JSON) -> bool:
+    return atomic_write.escrever_json(caminho, ledger, ensure_ascii=False, indent=1, sort_keys=True)
+
+
+def impressao_digital(post: dict[str, Any]) -> str | None:
+    """sha256 (16 hex) do HTML do post + título; None se o arquivo não existe."""
+    url = post.get("url") or ""
+    if not post_index.existe(url):
+        return None
+    dados = atomic_write.ler_bytes(url)
+    if dados is None:
+        return None
+    h = hashlib.sha256(dados)
+    h.update((post.get("titulo") or "").encode("utf-8"))
+    return h.hexdigest()[:16]
+
+
+def selecionar(
+    posts: list[dict[str, Any]], ledger: dict[str, dict[str, Any]], amostra: int = AMOSTRA_PADRAO
+) -> tuple[list[int], dict[str, str | None]]:
+    """Índices (em `posts`, do mais novo ao mais antigo) a processar nesta execução.
+
+    Retorna também as impressões digitais calculadas, para registrar() não
+    ler os arquivos de novo. Entradas do ledger sem post correspondente são
+    descartadas.
+    """
+    urls = {p.get("url") for p in posts}
+    for url in [u for u in ledger if u not in urls]:
+        del ledger[url]
+
+    digitais: dict[str, str | None] = {}
+    alterados: list[int] = []
+    em_dia: list[int] = []
+    for i, post in enumerate(posts):
+        url = post.get("url") or ""
+        digital = impressao_digital(post)
+        digitais[url] = digital
+        entrada = ledger.get(url)
+        if (
+            digital is None
+            or entrada is None
+            or entrada.get("sha256") != digital
+            or entrada.get("regras") != VERSAO_REGRAS
+        ):
+            alterados.append(i)
+        else:
+            em_dia.append(i)
+
+    # amostra rotativa: os verificados há mais tempo
+    em_dia.sort(key=lambda i: ledger[posts[i]["url"]].get("verificado_em", ""))
+    escolhidos = set(alterados) | set(em_dia[: max(0, amostra)])
+    return sorted(escolhidos, reverse=True), digitais
+
+
+def registrar(
+    ledger: dict[str, dict[str, Any]],
+    post: dict[str, Any],
+    flags: list[str],
+    digital: str | None = None,
+    acoes: Iterable[str] = (),
+    tentativas: int | None = None,
+) -> None:
+    """Grava o resultado de uma verificação (recalcula a impressão se o post foi editado).
+
+    `acoes` são correções baratas ainda não aplicadas (triagem do modo apply).
+    `tentativas` (correções já tentadas) é mantida se o conteúdo não mudou.
+    """
+    url = post.get("url")
+    if not url:
+        return
+    digital = digital if digital is not None else impressao_digital(post)
+    if tentativas is None:
+        anterior = ledger.get(url) or {}
+        tentativas = anterior.get("tentativas", 0) if digital is not None and anterior.get("sha256") == digital else 0
+    ledger[url] = {
+        "sha256": digital,
+        "flags": sorted(flags),
+        "acoes": sorted(acoes),
+        "tentativas": tentativas,
+        "verificado_em": agora_iso(),
+        "regras": VERSAO_REGRAS,
+    }
+
+
+def esquecer(ledger: dict[str, dict[str, Any]], url: str | None) -> None:
+    if url:
+        ledger.pop(url, None)
+
+
+def pendente(entrada: dict[str, Any]) -> bool:
+    return bool(entrada.get("flags") or entrada.get("acoes")) and entrada.get("tentativas", 0) < MAX_TENTATIVAS
+
+
+def prioridade(
+    entrada: dict[str, Any], post: dict[str, Any], agora: datetime, flags_groq: Iterable[str] = ()
+) -> float:
+    """Severidade x recência / custo (maior = corrigir antes)."""
+    flags = entrada.get("flags") or []
+    severidade = sum(PESOS_FLAGS.get(f, PESO_PADRAO) for f in flags)
+    severidade += sum(PESOS_ACOES.get(a, PESO_PADRAO) for a in entrada.get("acoes") or [])
+    iso = post_store.timestamp(post)
+    idade_dias = (agora - datetime.strptime(iso, "%Y-%m-%dT%H:%M:%SZ")).total_seconds() / 86400 if iso else 365.0
+    recencia = 1 + 2 * 0.5 ** (max(0.0, idade_dias) / MEIA_VIDA_DIAS)
+    custo = 1 + (CUSTO_GROQ if set(flags) & set(flags_groq) else 0)
+    return severidade * recencia / custo / (1 + entrada.get("tentativas", 0))
+
+
+def fila(
+    ledger: dict[str, dict[str, Any]], posts: list[dict[str, Any]], flags_groq: Iterable[str] = ()
+) -> list[dict[str, Any]]:
+    """Posts com correção pendente, do mais prioritário ao menos (empate: mais novo primeiro)."""
+    agora = datetime.now(timezone.utc).replace(tzinfo=None)
+    flags_groq = tuple(flags_groq)
+    itens = []
+    for ordem, post in enumerate(posts):
+        entrada = ledger.get(post.get("url") or "")
+        if entrada and pendente(entrada):
+            itens.append((prioridade(entrada, post, agora, flags_groq), ordem, post))
+    itens.sort(key=lambda item: (item[0], item[1]), reverse=True)
+    return [post for _, _, post in itens]
+
+
+def resumo_flags(ledger: dict[str, dict[str, Any]]) -> dict[str, int]:
+    """Quantos posts estão com cada flag segundo a última verificação."""
+    contagem: dict[str, int] = {}
+    for entrada in ledger.values():
+        for flag in entrada.get("flags") or ():
+            contagem[flag] = contagem.get(flag, 0) + 1
+    return dict(sorted(contagem.items()))
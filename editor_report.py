@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Relatório estruturado do editor: um registro JSON por execução.
+
+Uso:
+    python editor_report.py   # reimprime o EDITOR_REPORT.md da última execução
+
+- editor_runs.jsonl: uma linha por execução (modo, limites, posts verificados,
+  flags/ações por post, tempos da triagem, latência do Groq, fila, flags em
+  aberto, reconciliação), acrescentada ao fim do arquivo. Só quando ele passa
+  de RUNS_MAX_BYTES o histórico é aparado: ficam as MAX_EXECUCOES mais
+  recentes (até caber na metade do limite), e só as EXECUCOES_DETALHADAS
+  mais recentes mantêm a lista de posts;
+- editor_resumo.json: o que mudou desde a execução anterior (deltas de flags
+  em aberto e da fila, edições/remoções) e os totais das últimas 24h
+  (vazão do editor, chamadas e latência do Groq);
+- EDITOR_REPORT.md: renderizado a partir do registro e do resumo.
+
+Assim contagens de flags e vazão ao longo do tempo saem desses arquivos, sem
+reauditar o acervo.
+"""
+
+import json
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+import atomic_write
+
+RUNS_JSONL = Path("editor_runs.jsonl")
+RESUMO_JSON = Path("editor_resumo.json")
+REPORT_MD = Path("EDITOR_REPORT.md")
+
+# 1 semana a cada 5 min; posts por execução só no último dia
+MAX_EXECUCOES = 2016
+EXECUCOES_DETALHADAS = 288
+JANELA_RESUMO = timedelta(hours=24)
+# Tamanho do editor_runs.jsonl a partir do qual o histórico é aparado (senão, só append)
+RUNS_MAX_BYTES = 4_000_000
+
+_FORMATO_ISO = "%Y-%m-%dT%H:%M:%SZ"
+
+
+def agora_iso() -> str:
+    return datetime.now(timezone.utc).strftime(_FORMATO_ISO)
+
+
+def _p95(valores: list[float]) -> float:
+    if not valores:
+        return 0.0
+    ordenados = sorted(valores)
+    return ordenados[min(len(ordenados) - 1, int(len(ordenados) * 0.95))]
+
+
+class Execucao:
+    """Coleta o que acontece numa execução do editor e vira uma linha de editor_runs.jsonl."""
+
+    def __init__(
+        self, modo: str, max_edits: int, max_deletes: int, amostra: int, workers: int, concorrencia_groq: int = 1
+    ):
+        self._inicio = time.perf_counter()
+        self._tempos_triagem: list[float] = []
+        self._tempos_groq: list[float] = []
+        self._groq_parede_ms = 0.0
+        self._concorrencia_groq = concorrencia_groq
+        self.registro: dict[str, Any] = {
+            "inicio": agora_iso(),
+            "modo": modo,
+            "limites": {"max_edits": max_edits, "max_deletes": max_deletes, "amostra": amostra},
+            "workers": workers,
+            "posts_total": 0,
+            "verificados": 0,
+            "edits": 0,
+            "deletes": 0,
+            "posts": [],
+            "proximos_fila": [],
+        }
+
+    def triagem(self, ms: float) -> None:
+        self._tempos_triagem.append(ms)
+
+    def reescritas(self, ms_parede: float) -> None:
+        """Tempo de relógio de uma onda de reescritas concorrentes (as chamadas se sobrepõem)."""
+        self._groq_parede_ms += ms_parede
+
+    def post(
+        self,
+        acao: str,
+        post: dict[str, Any],
+        flags: list[str] | None = None,
+        acoes: list[str] | None = None,
+        ms: float | None = None,
+        groq_ms: float | None = None,
+        **extra: Any,
+    ) -> None:
+        """Um evento por post: flags, ausente, edit, delete, quarentena, quarentena_falhou, delete_bloqueado, adiado."""
+        item: dict[str, Any] = {"acao": acao, "url": post.get("url", ""), "titulo": (post.get("titulo") or "")[:80]}
+        if flags:
+            item["flags"] = list(flags)
+        if acoes:
+            item["acoes"] = list(acoes)
+        if ms is not None:
+            item["ms"] = round(ms, 1)
+        if groq_ms is not None:
+            item["groq_ms"] = round(groq_ms, 1)
+            self._tempos_groq.append(groq_ms)
+        item.update(extra)
+        self.registro["posts"].append(item)
+
+    def finalizar(self, **campos: Any) -> dict[str, Any]:
+        self.registro.update(campos)
+        self.registro["fim"] = agora_iso()
+        self.registro["duracao_s"] = round(time.perf_counter() - self._inicio, 2)
+        self.registro["triagem"] = {
+            "posts": len(self._tempos_triagem),
+            "ms_total": round(sum(self._tempos_triagem), 1),
+            "ms_p95": round(_p95(self._tempos_triagem), 1),
+        }
+        self.registro["groq"] = {
+            "chamadas": len(self._tempos_groq),
+            "ms_total": round(sum(self._tempos_groq), 1),
+            "ms_max": round(max(self._tempos_groq, default=0.0), 1),
+            "ms_parede": round(self._groq_parede_ms, 1),
+            "concorrencia": self._concorrencia_groq,
+        }
+        return self.registro
+
+
+# --- Histórico e resumo -------------------------------------------------------
+
+
+def ler_execucoes(caminho: Path = RUNS_JSONL) -> list[dict[str, Any]]:
+    execucoes: list[dict[str, Any]] = []
+    for linha in (atomic_write.ler_texto(caminho) or "").splitlines():
+        try:
+            execucoes.append(json.loads(linha))
+        except ValueError:
+            continue  # linha truncada não derruba o histórico
+    return execucoes
+
+
+def resumir(atual: dict[str, Any], anteriores: list[dict[str, Any]]) -> dict[str, Any]:
+    """Deltas em relação à execução anterior + totais das últimas 24h (incluindo a atual)."""
+    anterior = anteriores[-1] if anteriores else None
+    flags_antes = (anterior or {}).get("flags_em_aberto", {})
+    flags_agora = atual.get("flags_em_aberto", {})
+    delta_flags = {
+        f: flags_agora.get(f, 0) - flags_antes.get(f, 0)
+        for f in sorted(set(flags_antes) | set(flags_agora))
+        if flags_agora.get(f, 0) != flags_antes.get(f, 0)
+    }
+
+    limite = (datetime.now(timezone.utc) - JANELA_RESUMO).strftime(_FORMATO_ISO)
+    janela = [e for e in anteriores if e.get("inicio", "") >= limite] + [atual]
+    verificados = sum(e.get("verificados", 0) for e in janela)
+    duracao = sum(e.get("duracao_s", 0) for e in janela)
+    groq_chamadas = sum(e.get("groq", {}).get("chamadas", 0) for e in janela)
+    groq_ms = sum(e.get("groq", {}).get("ms_total", 0) for e in janela)
+    return {
+        "execucao": atual["inicio"],
+        "execucao_anterior": anterior["inicio"] if anterior else None,
+        "desde_anterior": {
+            "flags_em_aberto": delta_flags,
+            "fila": atual.get("fila", 0) - (anterior or {}).get("fila", 0) if anterior else 0,
+            "edits": atual.get("edits", 0),
+            "deletes": atual.get("deletes", 0),
+            "posts_com_flags": sum(1 for p in atual.get("posts", []) if p["acao"] == "flags"),
+        },
+        "janela_24h": {
+            "execucoes": len(janela),
+            "verificados": verificados,
+            "edits": sum(e.get("edits", 0) for e in janela),
+            "deletes": sum(e.get("deletes", 0) for e in janela),
+            "posts_por_s": round(verificados / duracao, 1) if duracao else 0.0,
+            "duracao_media_s": round(duracao / len(janela), 2),
+            "groq_chamadas": groq_chamadas,
+            "groq_ms_medio": round(groq_ms / groq_chamadas, 1) if groq_chamadas else 0.0,
+        },
+    }
+
+
+def _compactar(execucao: dict[str, Any]) -> dict[str, Any]:
+    return {k: v for k, v in execucao.items() if k not in ("posts", "proximos_fila")}
+
+
+def _linha(execucao: dict[str, Any]) -> str:
+    return json.dumps(execucao, ensure_ascii=False, separators=(",", ":")) + "\n"
+
+
+def aparar(historico: list[dict[str, Any]]) -> str:
+    """Histórico reduzido: MAX_EXECUCOES mais recentes, antigas sem posts, até caber em RUNS_MAX_BYTES / 2."""
+    historico = historico[-MAX_EXECUCOES:]
+    corte = len(historico) - EXECUCOES_DETALHADAS
+    linhas = [_linha(_compactar(e) if i < corte else e) for i, e in enumerate(historico)]
+    tamanho = sum(len(l.encode("utf-8")) for l in linhas)
+    inicio = 0
+    while tamanho > RUNS_MAX_BYTES // 2 and inicio < len(linhas) - 1:
+        tamanho -= len(linhas[inicio].encode("utf-8"))
+        inicio += 1
+    return "".join(linhas[inicio:])
+
+
+# --- Markdown -----------------------------------------------------------------
+
+
+def _linha_post(item: dict[str, Any]) -> str:
+    titulo, url, acao = item["titulo"], item["url"], item["acao"]
+    motivos = item.get("acoes") or []
+    if acao == "ausente":
+        return f"- ❌ ARQUIVO AUSENTE: **{titulo}** ({url})"
+    if acao == "flags":
+        return f"- ⚠️ FLAGS: **{titulo}** ({url}) | {', '.join(item.get('flags', []))}"
+    if acao == "edit":
+        return f"- ✏️ EDIT: **{titulo}** ({url}) | ações={motivos}"
+    if acao == "delete":
+        return f"- 🗑️ DELETE: **{titulo}** ({url}) | motivos={motivos}"
+    if acao == "quarentena":
+        return f"- 🟧 QUARENTENA: **{titulo}** ({url}) -> `{item.get('destino', '')}` | motivos={motivos}"
+    if acao == "quarentena_falhou":
+        return f"- 🟧 QUARENTENA (falhou mover): **{titulo}** ({url}) | err={item.get('erro', '')} | motivos={motivos}"
+    if acao == "delete_bloqueado":
+        return f"- ⛔ DELETE (bloqueado por limite): **{titulo}** ({url})"
+    if acao == "adiado":
+        return f"- ⏳ ADIADO (prazo da execução): **{titulo}** ({url}) | {', '.join(item.get('flags', []))}"
+    return f"- {acao}: **{titulo}** ({url})"
+
+
+def renderizar_markdown(execucao: dict[str, Any], resumo: dict[str, Any]) -> str:
+    lim = execucao["limites"]
+    linhas = [
+        "# Vivimundo Editor Report",
+        "",
+        "Relatório gerado automaticamente pelo editor (dados em editor_runs.jsonl e editor_resumo.json).",
+        "",
+        f"- Execução: {execucao['inicio']} ({execucao.get('duracao_s', 0)}s, workers={execucao.get('workers', 1)})",
+        f"- Modo: {'APLICANDO correções' if execucao['modo'] == 'apply' else 'AUDITORIA (sem alterar posts)'}",
+        f"- Limites: max_edits={lim['max_edits']}, max_deletes={lim['max_deletes']}",
+        f"- Verificados nesta execução: {execucao['verificados']} de {execucao['posts_total']} "
+        f"(novos/alterados + amostra de {lim['amostra']})",
+        "",
+    ]
+    linhas += [_linha_post(item) for item in execucao.get("posts", [])]
+    for item in execucao.get("proximos_fila", []):
+        linhas.append(f"- 📋 Próximo na fila: **{item['titulo']}** ({item['url']}) | {', '.join(item['pendencias'])}")
+
+    rec = execucao.get("reconciliacao", {})
+    linhas += [
+        "",
+        f"- Reconciliação: órfãos={rec.get('orfaos', 0)} (arquivo sem entrada) | "
+        f"pendentes={rec.get('pendentes', 0)} (entrada sem arquivo)",
+    ]
+    linhas += [f"  - órfão: `{url}`" for url in rec.get("exemplos_orfaos", [])]
+
+    triagem, groq = execucao.get("triagem", {}), execucao.get("groq", {})
+    linhas += [
+        "",
+        f"- Resumo: edits={execucao['edits']} deletes={execucao['deletes']}",
+        f"- Fila de correções: {execucao.get('fila', 0)} pendente(s)",
+        f"- Tempos: triagem {triagem.get('posts', 0)} post(s), p95 {triagem.get('ms_p95', 0)} ms | "
+        f"Groq {groq.get('chamadas', 0)} chamada(s), máx {groq.get('ms_max', 0)} ms, "
+        f"{groq.get('ms_parede', 0)} ms de relógio (até {groq.get('concorrencia', 1)} em paralelo)",
+    ]
+    if execucao.get("flags_em_aberto"):
+        contagens = ", ".join(f"{k}={v}" for k, v in execucao["flags_em_aberto"].items())
+        linhas.append(f"- Flags em aberto (última verificação de cada post): {contagens}")
+
+    desde = resumo["desde_anterior"]
+    if resumo.get("execucao_anterior"):
+        deltas = ", ".join(f"{k} {v:+d}" for k, v in desde["flags_em_aberto"].items()) or "sem mudança"
+        linhas += [
+            "",
+            f"## Desde a execução anterior ({resumo['execucao_anterior']})",
+            "",
+            f"- Flags em aberto: {deltas}",
+            f"- Fila: {desde['fila']:+d} | edits={desde['edits']} deletes={desde['deletes']} | "
+            f"posts com flags: {desde['posts_com_flags']}",
+        ]
+    j = resumo["janela_24h"]
+    linhas += [
+        "",
+        "## Últimas 24h",
+        "",
+        f"- {j['execucoes']} execução(ões), {j['verificados']} verificação(ões) ({j['posts_por_s']} posts/s), "
+        f"edits={j['edits']} deletes={j['deletes']}",
+        f"- Groq: {j['groq_chamadas']} chamada(s), média {j['groq_ms_medio']} ms",
+    ]
+    return "\n".join(linhas) + "\n"
+
+
+def salvar(execucao: dict[str, Any], report_md: Path = REPORT_MD) -> dict[str, Any]:
+    """Acrescenta a execução ao histórico, grava o resumo e o markdown. Retorna o resumo."""
+    anteriores = ler_execucoes()
+    resumo = resumir(execucao, anteriores)
+    linha = _linha(execucao)
+    try:
+        tamanho = RUNS_JSONL.stat().st_size
+    except FileNotFoundError:
+        tamanho = 0
+    if tamanho + len(linha.encode("utf-8")) > RUNS_MAX_BYTES:
+        atomic_write.escrever_texto(RUNS_JSONL, aparar(anteriores + [execucao]))
+    else:
+        atomic_write.acrescentar(RUNS_JSONL, linha)
+    atomic_write.escrever_json(RESUMO_JSON, resumo, ensure_ascii=False, indent=2)
+    atomic_write.escrever_texto(report_md, renderizar_markdown(execucao, resumo))
+    return resumo
+
+
+def main() -> int:
+    execucoes = ler_execucoes()
+    if not execucoes:
+        print("Nenhuma execução registrada em editor_runs.jsonl")
+        return 1
+    print(renderizar_markdown(execucoes[-1], resumir(execucoes[-1], execucoes[:-1])), end="")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
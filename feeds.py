@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Feeds Atom (site e por categoria) e sitemaps mensais gerados do posts.json.
+
+Saídas:
+- feeds/atom.xml e feeds/categoria-<cat>.xml: os ITENS_POR_FEED posts mais novos;
+- sitemaps/posts-AAAA-MM.xml: um shard por mês (data do post);
+- sitemaps/paginas.xml: capa, categorias e sobre;
+- sitemap.xml: índice apontando para os shards, com lastmod de cada um.
+
+Tudo é incremental via build_manifest: cada arquivo só é renderizado quando as
+entradas dele mudam. Um post novo mexe no shard do mês corrente, nos feeds
+afetados e no índice; os shards dos meses anteriores ficam intactos.
+
+As datas vêm de `publicado_em` (ISO, via post_store.timestamp; registros sem
+o campo usam o `data` de exibição), gravado pelo bot no horário do runner do
+GitHub Actions (UTC).
+"""
+
+import os
+import re
+from pathlib import Path
+from typing import Any, Iterable
+from urllib.parse import quote
+
+import atomic_write
+import build_manifest
+import post_index
+import post_sources
+import site_templates
+from post_store import data_iso, timestamp
+
+SITE_URL = os.getenv("SITE_URL", "https://chriscodef.github.io/Vivimundo-blog/")
+FEEDS_DIR = Path("feeds")
+SITEMAPS_DIR = Path("sitemaps")
+SITEMAP_INDEX = Path("sitemap.xml")
+
+ITENS_POR_FEED = 50
+# Incrementar quando o XML gerado mudar
+VERSAO_FEEDS = 1
+
+_TAGS = re.compile(r"<[^>]+>")
+_ATRIBUTO = {'"': "&quot;"}
+
+
+def escape(texto: str, entidades: dict[str, str] | None = None) -> str:
+    """Mesmo resultado de xml.sax.saxutils.escape, sem importar urllib.request/http.client junto."""
+    texto = texto.replace("&", "&amp;").replace(">", "&gt;").replace("<", "&lt;")
+    for chave, valor in (entidades or {}).items():
+        texto = texto.replace(chave, valor)
+    return texto
+
+
+def url_absoluta(rel: str) -> str:
+    # nomes de arquivo antigos têm aspas/acentos: percent-encoding deixa a URL válida em XML e em sitemaps
+    return SITE_URL.rstrip("/") + "/" + quote(rel.lstrip("/"), safe="/-._~")
+
+
+def resumo_post(url: str, limite: int = 280) -> str:
+    """Primeiro parágrafo do post (via post_sources), sem tags."""
+    fonte = post_sources.carregar_fonte(url)
+    if not fonte or not fonte.get("paragrafos"):
+        return ""
+    texto = _TAGS.sub("", fonte["paragrafos"][0]).strip()
+    return texto if len(texto) <= limite else texto[: limite - 1].rstrip() + "…"
+
+
+# --- Renderização ------------------------------------------------------------
+
+
+def renderizar_atom(
+    titulo: str, pagina_rel: str, feed_rel: str, posts: list[dict[str, Any]], resumos: dict[str, str] | None = None
+) -> str:
+    atualizado = next((d for d in (timestamp(p) for p in posts) if d), "1970-01-01T00:00:00Z")
+    linhas = [
+        '<?xml version="1.0" encoding="utf-8"?>',
+        '<feed xmlns="http://www.w3.org/2005/Atom" xml:lang="pt-BR">',
+        f"<title>{escape(titulo)}</title>",
+        f"<id>{escape(url_absoluta(feed_rel))}</id>",
+        f'<link rel="self" href="{escape(url_absoluta(feed_rel))}"/>',
+        f'<link rel="alternate" type="text/html" href="{escape(url_absoluta(pagina_rel))}"/>',
+        f"<updated>{atualizado}</updated>",
+        "<author><name>Kevin Ribeiro</name></author>",
+    ]
+    for p in posts:
+        link = escape(url_absoluta(p["url"]))
+        linhas.append("<entry>")
+        linhas.append(f"<title>{escape(p['titulo'])}</title>")
+        linhas.append(f'<link rel="alternate" type="text/html" href="{link}"/>')
+        linhas.append(f"<id>{link}</id>")
+        linhas.append(f"<updated>{timestamp(p) or atualizado}</updated>")
+        linhas.append(f'<category term="{escape(p["categoria"], _ATRIBUTO)}" label="{escape(site_templates.nome_exibicao(p["categoria"]), _ATRIBUTO)}"/>')
+        resumo = resumos[p["url"]] if resumos and p["url"] in resumos else resumo_post(p["url"])
+        if resumo:
+            linhas.append(f"<summary>{escape(resumo)}</summary>")
+        linhas.append("</entry>")
+    linhas.append("</feed>")
+    return "\n".join(linhas) + "\n"
+
+
+def renderizar_sitemap(urls: Iterable[tuple[str, str | None]]) -> str:
+    linhas = ['<?xml version="1.0" encoding="utf-8"?>', '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">']
+    for loc, lastmod in urls:
+        mod = f"<lastmod>{lastmod}</lastmod>" if lastmod else ""
+        linhas.append(f"<url><loc>{escape(url_absoluta(loc))}</loc>{mod}</url>")
+    linhas.append("</urlset>")
+    return "\n".join(linhas) + "\n"
+
+
+def renderizar_indice_sitemaps(shards: Iterable[tuple[str, str | None]]) -> str:
+    linhas = ['<?xml version="1.0" encoding="utf-8"?>', '<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">']
+    for loc, lastmod in shards:
+        mod = f"<lastmod>{lastmod}</lastmod>" if lastmod else ""
+        linhas.append(f"<sitemap><loc>{escape(url_absoluta(loc))}</loc>{mod}</sitemap>")
+    linhas.append("</sitemapindex>")
+    return "\n".join(linhas) + "\n"
+
+
+# --- Geração incremental -----------------------------------------------------
+
+
+def _gerar(manifesto: dict[str, Any], saida: Path, entradas: Any, renderizar) -> bool:
+    chave = build_manifest.hash_entradas(saida.as_posix(), VERSAO_FEEDS, SITE_URL, entradas)
+    if not build_manifest.precisa_gerar(manifesto, saida, chave):
+        return False
+    conteudo = renderizar()
+    atomic_write.escrever_texto(saida, conteudo)
+    build_manifest.registrar(manifesto, saida, chave, conteudo)
+    return True
+
+
+def _entradas_feed(posts: list[dict[str, Any]], resumos: dict[str, str]) -> list[list[Any]]:
+    """Tudo o que renderizar_atom imprime de cada post (resumo inclusive, que muda com o editor)."""
+    for p in posts:
+        if p["url"] not in resumos:
+            resumos[p["url"]] = resumo_post(p["url"])
+    return [[p.get("url"), p.get("titulo"), p.get("categoria"), timestamp(p), resumos[p["url"]]] for p in posts]
+
+
+def atualizar_feeds(posts: list[dict[str, Any]], categorias: Iterable[str] = ()) -> int:
+    """Atualiza feeds, shards do sitemap e sitemap.xml. Retorna quantos arquivos foram regerados."""
+    visiveis = [p for p in posts if post_index.existe(p.get("url", ""))]
+    manifesto = build_manifest.carregar_manifesto()
+    gerados = 0
+
+    # Feeds: site inteiro + uma por categoria (mais novos primeiro)
+    por_categoria: dict[str, list[dict[str, Any]]] = {c: [] for c in categorias}
+    for p in visiveis:
+        por_categoria.setdefault(p["categoria"], []).append(p)
+    # resumo lido uma vez por post: os feeds de categoria repetem os posts do atom.xml
+    resumos: dict[str, str] = {}
+    lista_feeds = [(FEEDS_DIR / "atom.xml", "Vivimundo - Últimas Notícias", "index.html", visiveis)]
+    for cat, lista in sorted(por_categoria.items()):
+        lista_feeds.append((FEEDS_DIR / f"categoria-{cat}.xml", f"Vivimundo - {site_templates.nome_exibicao(cat)}", f"categoria-{cat}.html", lista))
+    for saida, titulo, pagina, lista in lista_feeds:
+        recentes = list(reversed(lista[-ITENS_POR_FEED:]))
+        gerados += _gerar(
+            manifesto, saida, _entradas_feed(recentes, resumos),
+            lambda: renderizar_atom(titulo, pagina, saida.as_posix(), recentes, resumos),
+        )
+
+    # Sitemaps: um shard por mês + páginas fixas
+    por_mes: dict[str, list[tuple[str, str | None]]] = {}
+    for p in visiveis:
+        iso = timestamp(p)
+        por_mes.setdefault(iso[:7] if iso else "sem-data", []).append((p["url"], iso))
+
+    shards: list[tuple[str, str | None]] = []
+    mais_novo_cat = {cat: timestamp(lista[-1]) if lista else None for cat, lista in por_categoria.items()}
+    paginas = [("index.html", timestamp(visiveis[-1]) if visiveis else None)]
+    paginas += [(f"categoria-{cat}.html", mod) for cat, mod in sorted(mais_novo_cat.items())]
+    paginas.append(("sobre.html", None))
+    saida = SITEMAPS_DIR / "paginas.xml"
+    gerados += _gerar(manifesto, saida, paginas, lambda: renderizar_sitemap(paginas))
+    shards.append((saida.as_posix(), max((m for _, m in paginas if m), default=None)))
+
+    for mes, urls in sorted(por_mes.items()):
+        saida = SITEMAPS_DIR / f"posts-{mes}.xml"
+        gerados += _gerar(manifesto, saida, urls, lambda: renderizar_sitemap(urls))
+        shards.append((saida.as_posix(), max((m for _, m in urls if m), default=None)))
+
+    # Shards de meses que ficaram vazios (ex.: posts removidos pelo editor)
+    atuais = {loc for loc, _ in shards}
+    if SITEMAPS_DIR.exists():
+        for p in SITEMAPS_DIR.glob("posts-*.xml"):
+            if p.as_posix() not in atuais:
+                atomic_write.remover(p)
+                manifesto.pop(p.as_posix(), None)
+
+    gerados += _gerar(manifesto, SITEMAP_INDEX, shards, lambda: renderizar_indice_sitemaps(shards))
+    build_manifest.salvar_manifesto(manifesto)
+    return gerados
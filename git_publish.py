@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Commit (e push) só dos arquivos que a execução escreveu, sem varrer a árvore.
+
+O acervo tem milhares de posts e JSONs de vários MB; `git status --porcelain`
+e `git add .` percorrem (lstat + hash) a árvore inteira a cada post, e esse
+custo cresce com o arquivo. Aqui a lista vem de quem escreve: todo arquivo
+gerado passa pelo atomic_write, que registra cada caminho escrito, apagado ou
+movido (no processo e, com ATOMIC_WRITE_JOURNAL, num diário em arquivo que o
+passo de commit do workflow lê depois). Com essa lista:
+
+- `git check-ignore -z --stdin` descarta o que está no .gitignore (dist/, ...);
+- `git update-index --add --remove --stdin` prepara só esses caminhos
+  (arquivo apagado sai do índice);
+- `git write-tree` + `git commit-tree` + `git update-ref` fazem o commit
+  sem refresh do índice inteiro; árvore igual à do HEAD = nada a commitar.
+
+Várias escritas (vários posts, no daemon) entram num commit só: cada
+publicar() leva tudo o que mudou desde o anterior.
+
+Uso:
+    python git_publish.py [--push] [--mensagem "texto do commit"]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import atomic_write
+
+# Marca do atomic_write até onde este processo já commitou
+_publicado_ate = 0
+
+
+def log(msg: str) -> None:
+    print(msg, flush=True)
+
+
+def _git(*args: str, entrada: str | None = None, cwd: Path | None = None) -> subprocess.CompletedProcess:
+    return subprocess.run(["git", *args], input=entrada, capture_output=True, text=True, cwd=cwd)
+
+
+def ler_diario(caminho: str | None = None) -> list[str]:
+    caminho = caminho or os.getenv(atomic_write.DIARIO_ENV)
+    if not caminho:
+        return []
+    try:
+        return [linha for linha in Path(caminho).read_text(encoding="utf-8").splitlines() if linha]
+    except FileNotFoundError:
+        return []
+
+
+def limpar_diario(caminho: str | None = None) -> None:
+    caminho = caminho or os.getenv(atomic_write.DIARIO_ENV)
+    if caminho:
+        Path(caminho).unlink(missing_ok=True)
+
+
+def pendentes(raiz: Path) -> list[str]:
+    """Caminhos (relativos à raiz do repositório) alterados e ainda não commitados por este processo."""
+    relativos = set()
+    for caminho in atomic_write.caminhos_alterados(_publicado_ate) + ler_diario():
+        # pasta resolvida (raiz vem do git já sem links simbólicos); o arquivo em si não
+        absoluto = os.path.abspath(caminho)
+        rel = os.path.relpath(os.path.join(os.path.realpath(os.path.dirname(absoluto)), os.path.basename(absoluto)), raiz)
+        # fora do repositório (temporários) ou dentro do .git: não é conteúdo do site
+        if rel.startswith("..") or rel.split(os.sep)[0] == ".git":
+            continue
+        relativos.add(Path(rel).as_posix())
+    if not relativos:
+        return []
+    # -z: sem ele o git devolve entre aspas (e com escapes octais) caminhos com acento, que não casariam
+    ignorados = _git("check-ignore", "-z", "--stdin", entrada="\0".join(sorted(relativos)) + "\0", cwd=raiz)
+    return sorted(relativos - set(ignorados.stdout.split("\0")))
+
+
+def publicar(mensagem: str, push: bool = False) -> bool:
+    """Commita os caminhos pendentes (e faz push, se pedido). Retorna True se criou um commit."""
+    global _publicado_ate
+    raiz = Path(_git("rev-parse", "--show-toplevel").stdout.strip() or ".")
+    marca = atomic_write.marca()
+    caminhos = pendentes(raiz)
+    if not caminhos:
+        log("  ⚠️ Nada para commitar")
+        return False
+
+    indexados = _git("update-index", "--add", "--remove", "-z", "--stdin", entrada="\0".join(caminhos) + "\0", cwd=raiz)
+    if indexados.returncode != 0:
+        raise RuntimeError(f"git update-index: {indexados.stderr.strip()[:200]}")
+    arvore = _git("write-tree").stdout.strip()
+    pai = _git("rev-parse", "--verify", "-q", "HEAD").stdout.strip()
+    criou = not (pai and arvore == _git("rev-parse", "HEAD^{tree}").stdout.strip())
+    if not criou:
+        log("  ⚠️ Nada para commitar (conteúdo igual ao do último commit)")
+    else:
+        commit = _git("commit-tree", arvore, *(["-p", pai] if pai else []), "-m", mensagem)
+        if commit.returncode != 0:
+            raise RuntimeError(f"git commit-tree: {commit.stderr.strip()[:200]}")
+        sha = commit.stdout.strip()
+        _git("update-ref", "-m", "git_publish", "HEAD", sha, *([pai] if pai else []))
+        log(f"  ✅ Commit {sha[:7]}: {len(caminhos)} arquivo(s)")
+    _publicado_ate = marca
+    limpar_diario()
+
+    if push and criou:
+        enviar()
+    return criou
+
+
+def adiantado(remoto: str = "origin", ramo: str = "main") -> bool:
+    """True se há commits locais que o remoto ainda não tem."""
+    contagem = _git("rev-list", "--count", f"{remoto}/{ramo}..HEAD").stdout.strip()
+    return contagem.isdigit() and int(contagem) > 0
+
+
+def enviar(remoto: str = "origin", ramo: str = "main") -> bool:
+    """git push; se o remoto andou (outro workflow publicou), rebase dos commits locais e nova tentativa."""
+    if _git("push", remoto, f"HEAD:{ramo}").returncode == 0:
+        log("  🚀 Push realizado")
+        return True
+    rebase = _git("pull", "--rebase", "--autostash", "--no-stat", remoto, ramo)
+    if rebase.returncode == 0 and _git("push", remoto, f"HEAD:{ramo}").returncode == 0:
+        log("  🚀 Push realizado (após rebase)")
+        return True
+    log(f"  ❌ Push: {rebase.stderr.strip()[:120]}")
+    return False
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Commita só os arquivos escritos pelo bot/editor (diário do atomic_write)")
+    parser.add_argument("--mensagem", default="🤖 Atualização automática", help="mensagem do commit")
+    parser.add_argument("--push", action="store_true", help="faz push depois do commit")
+    args = parser.parse_args(argv)
+    commitou = publicar(args.mensagem)
+    # também envia commits locais que ficaram para trás (push anterior que falhou)
+    if args.push and (commitou or adiantado()):
+        return 0 if enviar() else 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
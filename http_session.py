@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Cliente HTTP compartilhado (conexões keep-alive) para processos de longa duração.
+
+Execuções avulsas (cron do GitHub Actions) continuam usando o módulo
+`requests` direto: cliente() devolve o próprio módulo enquanto ninguém chamou
+ativar(). O daemon ativa uma requests.Session com pool de conexões uma vez, e
+a partir daí DNS, TCP e TLS dos portais, das imagens e da API da Groq são
+reaproveitados entre as coletas.
+
+Nada é importado no import deste módulo (requests só quando alguém pede).
+"""
+
+from typing import Any
+
+# Conexões mantidas por host (portais, CDN de imagens, Groq)
+CONEXOES_POR_HOST = 8
+
+_sessao: Any = None
+
+
+def cliente() -> Any:
+    """Session compartilhada se o modo daemon a ativou; senão o módulo requests (mesma API get/post)."""
+    if _sessao is not None:
+        return _sessao
+    import requests
+
+    return requests
+
+
+def ativar(conexoes: int = CONEXOES_POR_HOST) -> Any:
+    """Cria (uma vez) a Session com pool de conexões e passa a usá-la em cliente()."""
+    global _sessao
+    if _sessao is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        sessao = requests.Session()
+        adaptador = HTTPAdapter(pool_connections=conexoes, pool_maxsize=conexoes)
+        sessao.mount("https://", adaptador)
+        sessao.mount("http://", adaptador)
+        _sessao = sessao
+    return _sessao
+
+
+def encerrar() -> None:
+    """Fecha as conexões abertas e volta ao requests sem sessão."""
+    global _sessao
+    if _sessao is not None:
+        _sessao.close()
+        _sessao = None
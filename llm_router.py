@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Roteamento das chamadas à Groq por tipo de tarefa.
+
+Tarefas curtas (classificação de subcategoria) vão para um modelo pequeno e
+rápido; tarefas de escrita (reescrita, matéria completa) ficam no modelo
+grande. Cada rota pode ser trocada por variável de ambiente
+(GROQ_MODELO_<TAREFA>, ex.: GROQ_MODELO_CLASSIFICAR) e registra latência,
+tokens e custo observados em llm_metrics.json. Cada chamada também é anotada
+em llm_usage.jsonl (tokens de prompt/resposta informados pela API, ao lado da
+estimativa local do prompt_budget).
+
+Quando a resposta do modelo pequeno não passa na validação da tarefa (baixa
+confiança), a mesma chamada é refeita no modelo grande.
+
+As chamadas podem vir de várias threads (reescritas concorrentes do editor):
+o `limitador` espaça as requisições conforme GROQ_RPM e, quando a API responde
+429, segura todas as threads até o Retry-After informado.
+"""
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+import requests
+
+import atomic_write
+import http_session
+import prompt_budget
+
+
+def log(msg: str) -> None:
+    print(msg, flush=True)
+
+
+GROQ_URL = "https://api.groq.com/openai/v1/chat/completions"
+
+MODELO_GRANDE = os.getenv("GROQ_MODELO_GRANDE", "llama-3.3-70b-versatile")
+MODELO_PEQUENO = os.getenv("GROQ_MODELO_PEQUENO", "llama-3.1-8b-instant")
+
+# tarefa -> modelo padrão
+ROTAS = {
+    "classificar": MODELO_PEQUENO,
+    "reescrita": MODELO_GRANDE,
+    "materia": MODELO_GRANDE,
+}
+
+# USD por 1M de tokens (entrada, saída). Modelos fora da tabela contam custo 0.
+PRECOS = {
+    "llama-3.3-70b-versatile": (0.59, 0.79),
+    "llama-3.1-8b-instant": (0.05, 0.08),
+}
+
+METRICS_JSON = Path("llm_metrics.json")
+USAGE_JSONL = Path("llm_usage.jsonl")
+# acima disso o log por chamada é podado para a metade mais recente
+USAGE_MAX_BYTES = 1_000_000
+
+# Requisições por minuto permitidas para a chave (0 = sem espaçamento, só respeita os 429)
+REQUISICOES_POR_MINUTO = int(os.getenv("GROQ_RPM", "0"))
+# Retry-After ausente ou absurdo: espera padrão / teto da pausa após um 429
+ESPERA_429_PADRAO_S = 5.0
+ESPERA_429_MAX_S = 60.0
+
+# métricas/uso são read-modify-write em arquivo: uma thread por vez
+_trava_registro = threading.Lock()
+
+
+class LimiteExcedido(Exception):
+    """HTTP 429 da Groq; `espera` é quanto a API pediu para aguardar (s)."""
+
+    def __init__(self, espera: float) -> None:
+        super().__init__(f"429 Too Many Requests (aguardar {espera:.0f}s)")
+        self.espera = espera
+
+
+class LimitadorTaxa:
+    """Intervalo mínimo entre requisições e pausa coletiva depois de um 429 (seguro entre threads)."""
+
+    def __init__(self, por_minuto: int = 0) -> None:
+        self.intervalo = 60.0 / por_minuto if por_minuto > 0 else 0.0
+        self._trava = threading.Lock()
+        self._proxima = 0.0
+
+    def aguardar(self) -> float:
+        """Bloqueia até a vez desta requisição; retorna quanto esperou (s)."""
+        with self._trava:
+            agora = time.monotonic()
+            vez = max(agora, self._proxima)
+            self._proxima = vez + self.intervalo
+        if vez > agora:
+            time.sleep(vez - agora)
+        return vez - agora
+
+    def espera_prevista(self) -> float:
+        """Quanto uma requisição nova esperaria agora antes de sair (s)."""
+        with self._trava:
+            return max(0.0, self._proxima - time.monotonic())
+
+    def pausar(self, segundos: float) -> None:
+        """Ninguém começa requisição nova nos próximos `segundos`."""
+        with self._trava:
+            self._proxima = max(self._proxima, time.monotonic() + segundos)
+
+
+limitador = LimitadorTaxa(REQUISICOES_POR_MINUTO)
+
+
+def espera_retry_after(valor: str | None) -> float:
+    try:
+        espera = float(valor) if valor else ESPERA_429_PADRAO_S
+    except ValueError:
+        espera = ESPERA_429_PADRAO_S
+    return min(max(espera, 0.0), ESPERA_429_MAX_S)
+
+
+def modelo_da_rota(tarefa: str) -> str:
+    """Modelo configurado para a tarefa (env GROQ_MODELO_<TAREFA> tem prioridade)."""
+    return os.getenv(f"GROQ_MODELO_{tarefa.upper()}") or ROTAS.get(tarefa, MODELO_GRANDE)
+
+
+def custo_estimado(modelo: str, tokens_prompt: int, tokens_resposta: int) -> float:
+    preco_in, preco_out = PRECOS.get(modelo, (0.0, 0.0))
+    return (tokens_prompt * preco_in + tokens_resposta * preco_out) / 1_000_000
+
+
+def carregar_metricas() -> dict[str, Any]:
+    bruto = atomic_write.ler_texto(METRICS_JSON)
+    if bruto is not None:
+        try:
+            data = json.loads(bruto)
+            if isinstance(data, dict):
+                return data
+        except Exception:
+            pass
+    return {"rotas": {}}
+
+
+def registrar_metricas(
+    tarefa: str,
+    modelo: str,
+    latencia: float,
+    uso: dict[str, Any] | None,
+    erro: bool = False,
+    fallback: bool = False,
+) -> None:
+    """Acumula latência/tokens/custo por rota (tarefa + modelo)."""
+    try:
+        metricas = carregar_metricas()
+        rota = metricas.setdefault("rotas", {}).setdefault(tarefa, {}).setdefault(
+            modelo,
+            {
+                "chamadas": 0,
+                "erros": 0,
+                "fallbacks": 0,
+                "latencia_total_s": 0.0,
+                "latencia_media_s": 0.0,
+                "tokens_prompt": 0,
+                "tokens_resposta": 0,
+                "custo_usd": 0.0,
+            },
+        )
+        rota["chamadas"] += 1
+        if erro:
+            rota["erros"] += 1
+        if fallback:
+            rota["fallbacks"] += 1
+        rota["latencia_total_s"] = round(rota["latencia_total_s"] + latencia, 3)
+        rota["latencia_media_s"] = round(rota["latencia_total_s"] / rota["chamadas"], 3)
+
+        uso = uso or {}
+        tokens_prompt = int(uso.get("prompt_tokens") or 0)
+        tokens_resposta = int(uso.get("completion_tokens") or 0)
+        rota["tokens_prompt"] += tokens_prompt
+        rota["tokens_resposta"] += tokens_resposta
+        rota["custo_usd"] = round(rota["custo_usd"] + custo_estimado(modelo, tokens_prompt, tokens_resposta), 6)
+
+        atomic_write.escrever_json(METRICS_JSON, metricas, ensure_ascii=False, indent=2)
+    except Exception as e:
+        # métrica nunca pode derrubar a geração
+        log(f"  ⚠️ Não consegui registrar métricas LLM: {str(e)[:60]}")
+
+
+def registrar_uso(tarefa: str, modelo: str, prompt: str, latencia: float, uso: dict[str, Any] | None) -> None:
+    """Anota uma linha por chamada com os tokens reais (API) e a estimativa local."""
+    uso = uso or {}
+    linha = {
+        "ts": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "tarefa": tarefa,
+        "modelo": modelo,
+        "tokens_prompt": int(uso.get("prompt_tokens") or 0),
+        "tokens_resposta": int(uso.get("completion_tokens") or 0),
+        "tokens_prompt_estimados": prompt_budget.estimar_tokens(prompt),
+        "latencia_s": round(latencia, 3),
+    }
+    try:
+        atomic_write.acrescentar(USAGE_JSONL, json.dumps(linha, ensure_ascii=False) + "\n")
+        if USAGE_JSONL.stat().st_size > USAGE_MAX_BYTES:
+            linhas = USAGE_JSONL.read_text(encoding="utf-8").splitlines()
+            atomic_write.escrever_texto(USAGE_JSONL, "\n".join(linhas[len(linhas) // 2 :]) + "\n")
+    except Exception as e:
+        log(f"  ⚠️ Não consegui registrar uso LLM: {str(e)[:60]}")
+
+
+def _chamar_modelo(
+    tarefa: str,
+    modelo: str,
+    prompt: str,
+    temperature: float,
+    max_tokens: int,
+    timeout: int,
+    fallback: bool = False,
+) -> str:
+    limitador.aguardar()
+    inicio = time.perf_counter()
+    try:
+        resp = http_session.cliente().post(
+            GROQ_URL,
+            headers={"Authorization": f"Bearer {os.getenv('GROQ_API_KEY', '')}", "Content-Type": "application/json"},
+            json={
+                "model": modelo,
+                "messages": [{"role": "user", "content": prompt}],
+                "temperature": temperature,
+                "max_tokens": max_tokens,
+            },
+            timeout=timeout,
+        )
+        if resp.status_code == 429:
+            espera = espera_retry_after(resp.headers.get("retry-after"))
+            limitador.pausar(espera)
+            raise LimiteExcedido(espera)
+        resp.raise_for_status()
+        data = resp.json()
+    except Exception:
+        with _trava_registro:
+            registrar_metricas(tarefa, modelo, time.perf_counter() - inicio, None, erro=True, fallback=fallback)
+        raise
+    latencia = time.perf_counter() - inicio
+    with _trava_registro:
+        registrar_metricas(tarefa, modelo, latencia, data.get("usage"), fallback=fallback)
+        registrar_uso(tarefa, modelo, prompt, latencia, data.get("usage"))
+    return data["choices"][0]["message"]["content"].strip()
+
+
+def chamar(
+    tarefa: str,
+    prompt: str,
+    temperature: float = 0.2,
+    max_tokens: int = 2000,
+    timeout: int = 60,
+    validar: Callable[[str], bool] | None = None,
+) -> str:
+    """Executa o prompt no modelo da rota `tarefa`.
+
+    `validar` recebe a resposta e diz se ela é confiável; se não for (e a rota
+    não for o modelo grande), a chamada é refeita no modelo grande.
+    """
+    modelo = modelo_da_rota(tarefa)
+    texto = _chamar_modelo(tarefa, modelo, prompt, temperature, max_tokens, timeout)
+    if validar is not None and modelo != MODELO_GRANDE and not validar(texto):
+        log(f"  🔁 Resposta de baixa confiança em '{tarefa}' ({modelo}); refazendo com {MODELO_GRANDE}")
+        texto = _chamar_modelo(tarefa, MODELO_GRANDE, prompt, temperature, max_tokens, timeout, fallback=True)
+    return texto
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Índice em memória dos arquivos de post existentes em posts/.
+
+Os geradores de página e o editor precisam saber, para cada entrada do
+posts.json, se o HTML do post existe. Em vez de um stat por card (milhares por
+execução), fazemos um único os.scandir por execução e consultamos um set.
+Quem cria/remove/move arquivos de post avisa o índice para ele continuar
+coerente sem reescanear.
+
+Rodando direto (`python post_index.py`) imprime a reconciliação entre
+posts/ e posts.json: arquivos órfãos e entradas sem arquivo.
+"""
+
+import os
+import sys
+from pathlib import Path
+from typing import Any
+
+import post_store
+
+POSTS_DIR = Path("posts")
+
+_arquivos: set[str] | None = None
+_pasta_indexada: Path | None = None
+
+
+def _url(nome: str) -> str:
+    return f"{POSTS_DIR.as_posix()}/{nome}"
+
+
+def arquivos_existentes(recarregar: bool = False) -> set[str]:
+    """URLs ('posts/<arquivo>') de todos os arquivos diretamente em posts/."""
+    global _arquivos, _pasta_indexada
+    pasta = POSTS_DIR.resolve()
+    if recarregar or _arquivos is None or _pasta_indexada != pasta:
+        arquivos: set[str] = set()
+        try:
+            with os.scandir(POSTS_DIR) as it:
+                for entry in it:
+                    if entry.is_file():
+                        arquivos.add(_url(entry.name))
+        except FileNotFoundError:
+            pass
+        _arquivos = arquivos
+        _pasta_indexada = pasta
+    return _arquivos
+
+
+def existe(url: str | None) -> bool:
+    return bool(url) and url in arquivos_existentes()
+
+
+def registrar_arquivo(url: str) -> None:
+    """Avisa que um post foi escrito em `url`."""
+    arquivos_existentes().add(Path(url).as_posix())
+
+
+def remover_arquivo(url: str) -> None:
+    """Avisa que o post em `url` foi apagado ou movido (quarentena)."""
+    arquivos_existentes().discard(Path(url).as_posix())
+
+
+def reconciliar(posts: list[dict[str, Any]]) -> dict[str, list[str]]:
+    """Compara posts/ com o índice.
+
+    - orfaos: arquivos em posts/ que nenhuma entrada do posts.json referencia;
+    - pendentes: entradas do posts.json cujo arquivo não existe.
+    """
+    arquivos = arquivos_existentes()
+    referenciados = {p.get("url") for p in posts if p.get("url")}
+    return {
+        "orfaos": sorted(arquivos - referenciados),
+        "pendentes": sorted(p.get("url") or "" for p in posts if not existe(p.get("url"))),
+    }
+
+
+def main() -> int:
+    posts = post_store.abrir().todos()
+    rel = reconciliar(posts)
+    print(f"Arquivos em posts/: {len(arquivos_existentes())} | entradas no índice de posts: {len(posts)}")
+    print(f"Órfãos (arquivo sem entrada): {len(rel['orfaos'])}")
+    for url in rel["orfaos"]:
+        print(f"  - {url}")
+    print(f"Pendentes (entrada sem arquivo): {len(rel['pendentes'])}")
+    for url in rel["pendentes"]:
+        print(f"  - {url or '(sem url)'}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
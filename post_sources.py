@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Fontes estruturadas dos posts (post_sources/<arquivo-do-post>.json).
+
+O HTML de cada post é só uma renderização: título, parágrafos, imagem,
+categoria, subcategoria e data ficam guardados aqui, de forma que uma mudança
+no template (nav, meta tags, footer) pode ser aplicada a todo o arquivo com
+`python rebuild.py` em vez de valer só para posts novos.
+
+Cada fonte guarda também o sha256 do HTML que ela gerou (ou de onde foi
+extraída). Se o HTML mudar por fora (ex.: editor), a fonte é reextraída antes
+de renderizar de novo, para não desfazer a edição.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any
+
+import atomic_write
+import site_templates
+import thumbnails
+
+SOURCES_DIR = Path("post_sources")
+
+
+def caminho_fonte(url: str) -> Path:
+    """posts/post-0001-x.html -> post_sources/post-0001-x.json"""
+    return SOURCES_DIR / f"{Path(url).stem}.json"
+
+
+def hash_html(html: str) -> str:
+    return hashlib.sha256(html.encode("utf-8")).hexdigest()
+
+
+def carregar_fonte(url: str) -> dict[str, Any] | None:
+    caminho = caminho_fonte(url)
+    if not caminho.exists():
+        return None
+    try:
+        return json.loads(caminho.read_text(encoding="utf-8"))
+    except Exception:
+        return None
+
+
+def salvar_fonte(fonte: dict[str, Any]) -> None:
+    atomic_write.escrever_json(caminho_fonte(fonte["url"]), fonte, ensure_ascii=False, indent=1)
+
+
+def montar_fonte(
+    url: str,
+    titulo: str,
+    paragrafos: list[str],
+    imagem: str,
+    categoria: str,
+    data: str,
+    subcategoria: str | None = None,
+) -> dict[str, Any]:
+    return {
+        "url": url,
+        "titulo": titulo,
+        "paragrafos": paragrafos,
+        "imagem": imagem,
+        "categoria": categoria,
+        "subcategoria": subcategoria,
+        "data": data,
+        "html_sha256": None,
+    }
+
+
+def renderizar_post(fonte: dict[str, Any]) -> str:
+    """HTML completo do post a partir da fonte estruturada."""
+    subcat = fonte.get("subcategoria")
+    subcat_html = f'<span class="post-subcategoria">{site_templates.nome_exibicao(subcat)}</span>' if subcat else ""
+    return site_templates.POST.formatar(
+        {
+            "titulo": fonte["titulo"],
+            "imagem": fonte["imagem"],
+            "imagem_html": site_templates.imagem_post(fonte["imagem"], fonte["titulo"]),
+            "raiz": "../",
+            "categoria_nome": site_templates.nome_exibicao(fonte["categoria"]),
+            "subcat_html": subcat_html,
+            "data": fonte["data"],
+            "paragrafos": "".join(f"<p>{p}</p>\n" for p in fonte["paragrafos"]),
+        }
+    )
+
+
+def extrair_fonte_html(html: str, entrada: dict[str, Any]) -> dict[str, Any]:
+    """Monta a fonte a partir do HTML publicado; metadados vêm da entrada do posts.json."""
+    from bs4 import BeautifulSoup  # só a migração (rebuild) faz parse; renderizar não precisa
+
+    soup = BeautifulSoup(html, "html.parser")
+
+    h1 = soup.find("h1", class_="post-titulo")
+    titulo = h1.get_text(" ", strip=True) if h1 else entrada.get("titulo", "")
+
+    img = soup.find("img", class_="post-principal-imagem")
+    imagem = img.get("src", "") if img else entrada.get("imagem", "")
+    if imagem.startswith(f"../{thumbnails.THUMBS_DIR.as_posix()}/"):
+        # <picture> com miniatura: a original está no posts.json
+        imagem = entrada.get("imagem", "")
+
+    data = entrada.get("data")
+    if not data:
+        div_data = soup.find(class_="post-data")
+        data = div_data.get_text(" ", strip=True).split("•")[-1].strip() if div_data else ""
+
+    paragrafos: list[str] = []
+    conteudo = soup.find(class_="post-conteudo")
+    if conteudo:
+        for el in conteudo.children:
+            if getattr(el, "name", None) == "p":
+                interno = el.decode_contents().strip()
+            elif getattr(el, "name", None) is None:
+                interno = str(el).strip()
+            else:
+                interno = el.get_text(" ", strip=True)
+            if interno:
+                paragrafos.append(interno)
+
+    fonte = montar_fonte(
+        entrada["url"],
+        titulo,
+        paragrafos,
+        imagem,
+        entrada.get("categoria", ""),
+        data,
+        entrada.get("subcategoria"),
+    )
+    fonte["html_sha256"] = hash_html(html)
+    return fonte
@@ -0,0 +1,360 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Armazenamento dos posts em shards JSONL mensais + índice.
+
+Uso:
+    python post_store.py exportar   # regrava posts.json a partir do store
+    python post_store.py migrar     # (re)cria o store a partir do posts.json
+
+post_store/AAAA-MM.jsonl guarda um post por linha (mês da data do post) e
+post_store/indice.json guarda, por URL, o mês, a ordem de inserção e o
+timestamp, a lista de URLs já ordenada por data (`cronologia`) e as contagens
+por categoria/subcategoria de cada mês. Assim:
+
+- adicionar um post reescreve só o shard do mês corrente e o índice;
+- atualizar/remover por id (a URL do post) mexe só no shard daquele post;
+- consultas por categoria, subcategoria ou intervalo de datas só abrem os
+  meses que podem ter resultado, e janelas de tempo (cronologicos()) saem
+  direto da cronologia por busca binária, sem reler as datas.
+
+Cada post tem `publicado_em` (ISO 8601 UTC, "2026-02-03T03:04:00Z") além do
+`data` de exibição. Posts antigos ganham o campo na migração: ao importar o
+posts.json ou ao abrir um store da versão 1 (backfill a partir de `data`).
+A ordem de todos() e do posts.json exportado é a cronológica (empates na
+ordem de inserção).
+
+posts.json continua existindo para quem consome o formato antigo: é exportado
+(mesmo formato de sempre) a partir do store, mas não a cada post (são vários
+MB reescritos inteiros): o publicador só exporta quando a última exportação
+passou de EXPORTAR_A_CADA_H (exportar_vencido()), o daemon exporta na
+descarga e `python post_store.py exportar` exporta na hora. Na primeira abertura sem store,
+o conteúdo do posts.json é importado em memória; nada é escrito até salvar().
+"""
+
+import bisect
+import json
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+import atomic_write
+
+STORE_DIR = Path("post_store")
+POSTS_JSON = Path("posts.json")
+
+VERSAO_STORE = 2
+# Intervalo mínimo entre exportações automáticas do posts.json (exportar_vencido)
+EXPORTAR_A_CADA_H = 24.0
+SEM_DATA = "sem-data"
+
+_FORMATOS_DATA = ("%d/%m/%Y às %H:%M", "%d/%m/%Y %H:%M", "%d/%m/%Y")
+
+
+def data_iso(data: str | None) -> str | None:
+    """'12/04/2026 às 14:55' -> '2026-04-12T14:55:00Z' (None se não der para ler)."""
+    for fmt in _FORMATOS_DATA:
+        try:
+            return datetime.strptime((data or "").strip(), fmt).strftime("%Y-%m-%dT%H:%M:%SZ")
+        except ValueError:
+            continue
+    return None
+
+
+def timestamp(post: dict[str, Any]) -> str | None:
+    """ISO do post: `publicado_em` ou, em registros antigos, o `data` convertido."""
+    return post.get("publicado_em") or data_iso(post.get("data"))
+
+
+def mes_do_post(post: dict[str, Any]) -> str:
+    iso = timestamp(post)
+    return iso[:7] if iso else SEM_DATA
+
+
+class PostStore:
+    """Posts em shards mensais carregados sob demanda; salvar() grava só o que mudou."""
+
+    def __init__(self, pasta: str | Path = STORE_DIR, carregar: bool = True):
+        self.pasta = Path(pasta)
+        self.indice: dict[str, Any] = {"versao": VERSAO_STORE, "proximo_seq": 0, "urls": {}, "cronologia": [], "meses": {}}
+        # carregar=False: store novo que vai substituir o que houver em disco (migração)
+        self._ler_disco = carregar
+        bruto = atomic_write.ler_texto(self.caminho_indice) if carregar else None
+        if bruto is not None:
+            self.indice = json.loads(bruto)
+        self._meses: dict[str, dict[str, dict[str, Any]]] = {}
+        self._sujos: set[str] = set()
+        self._indice_sujo = False
+        if self.indice.get("versao", 1) < 2:
+            self._backfill_timestamps()
+
+    def _backfill_timestamps(self) -> None:
+        """Versão 1 -> 2: `publicado_em` em todos os posts e cronologia no índice (grava no próximo salvar())."""
+        for mes in list(self.indice["meses"]):
+            for url, post in self._carregar_mes(mes).items():
+                post.setdefault("publicado_em", data_iso(post.get("data")))
+                self.indice["urls"][url] = [mes, self.indice["urls"][url][1], post["publicado_em"]]
+            self._sujos.add(mes)
+        for local in self.indice["urls"].values():
+            if len(local) == 2:  # post perdido numa linha truncada
+                local.append(None)
+        self.indice["cronologia"] = sorted(self.indice["urls"], key=self._chave)
+        self.indice["versao"] = VERSAO_STORE
+        self._indice_sujo = True
+
+    @property
+    def caminho_indice(self) -> Path:
+        return self.pasta / "indice.json"
+
+    def caminho_mes(self, mes: str) -> Path:
+        return self.pasta / f"{mes}.jsonl"
+
+    def _carregar_mes(self, mes: str) -> dict[str, dict[str, Any]]:
+        if mes not in self._meses:
+            posts: dict[str, dict[str, Any]] = {}
+            bruto = (atomic_write.ler_texto(self.caminho_mes(mes)) if self._ler_disco else None) or ""
+            for linha in bruto.splitlines():
+                try:
+                    post = json.loads(linha)
+                except ValueError:
+                    continue  # linha truncada não derruba o resto do mês
+                posts[post["url"]] = post
+            self._meses[mes] = posts
+        return self._meses[mes]
+
+    def _chave(self, url: str) -> tuple[str, int]:
+        """Ordem cronológica: (timestamp, seq); posts sem data vêm antes de todos."""
+        _, seq, iso = self.indice["urls"][url]
+        return iso or "", seq
+
+    def _inserir_cronologia(self, url: str) -> None:
+        bisect.insort(self.indice["cronologia"], url, key=self._chave)
+
+    def _remover_cronologia(self, url: str) -> None:
+        cron = self.indice["cronologia"]
+        i = bisect.bisect_left(cron, self._chave(url), key=self._chave)
+        if i < len(cron) and cron[i] == url:
+            del cron[i]
+        else:  # índice fora de ordem (editado à mão): busca linear
+            cron.remove(url)
+
+    def __len__(self) -> int:
+        return len(self.indice["urls"])
+
+    def __contains__(self, url: str) -> bool:
+        return url in self.indice["urls"]
+
+    # --- leitura ------------------------------------------------------------
+
+    def obter(self, url: str) -> dict[str, Any] | None:
+        local = self.indice["urls"].get(url)
+        if not local:
+            return None
+        return self._carregar_mes(local[0]).get(url)
+
+    def meses(self) -> list[str]:
+        """Meses (AAAA-MM) com posts, do mais antigo ao mais novo."""
+        meses = set(self.indice["meses"]) | {mes for mes, posts in self._meses.items() if posts}
+        return sorted(meses - {SEM_DATA})
+
+    def cronologicos(
+        self,
+        desde: str | None = None,
+        ate: str | None = None,
+        limite: int | None = None,
+        recentes_primeiro: bool = False,
+    ) -> list[dict[str, Any]]:
+        """Posts numa janela de tempo (datas ISO inclusivas, qualquer prefixo de AAAA-MM-DDTHH:MM:SSZ).
+
+        Busca binária na cronologia do índice: só os meses da janela são
+        abertos e nenhuma data é convertida de novo.
+        """
+        cron = self.indice["cronologia"]
+        iso = lambda u: self._chave(u)[0]  # noqa: E731
+        ini, fim = 0, len(cron)
+        if desde or ate:  # posts sem data (chave "") nunca caem numa janela
+            ini = bisect.bisect_left(cron, desde or "\x00", key=iso)
+        if ate:
+            # "\uffff": o prefixo `ate` inteiro é inclusivo (ate="2026-03" pega o mês todo)
+            fim = bisect.bisect_right(cron, ate + "\uffff", key=iso)
+        urls = cron[ini:fim]
+        if recentes_primeiro:
+            urls = urls[::-1]
+        resultado: list[dict[str, Any]] = []
+        for url in urls:
+            if limite is not None and len(resultado) >= limite:
+                break
+            post = self.obter(url)
+            if post is not None:  # None: linha truncada no shard
+                resultado.append(post)
+        return resultado
+
+    def consultar(
+        self,
+        categoria: str | None = None,
+        subcategoria: str | None = None,
+        desde: str | None = None,
+        ate: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """Posts em ordem cronológica filtrados por categoria/subcategoria e datas ISO (AAAA-MM-DD[...]) inclusivas."""
+        resultado: list[dict[str, Any]] = []
+        for mes in sorted(set(self.indice["meses"]) | set(self._meses)):
+            # contagens do índice só valem para meses sem alterações pendentes
+            stats = None if mes in self._sujos else self.indice["meses"].get(mes)
+            if stats and categoria and not stats["categorias"].get(categoria):
+                continue
+            if stats and subcategoria and not stats["subcategorias"].get(subcategoria):
+                continue
+            if mes != SEM_DATA and ((desde and mes < desde[:7]) or (ate and mes > ate[:7])):
+                continue
+            for post in self._carregar_mes(mes).values():
+                if categoria and post.get("categoria") != categoria:
+                    continue
+                if subcategoria and post.get("subcategoria") != subcategoria:
+                    continue
+                if desde or ate:
+                    iso = self._chave(post["url"])[0]
+                    if not iso or (desde and iso[: len(desde)] < desde) or (ate and iso[: len(ate)] > ate):
+                        continue
+                resultado.append(post)
+        resultado.sort(key=lambda p: self._chave(p["url"]))
+        return resultado
+
+    def todos(self) -> list[dict[str, Any]]:
+        """Todos os posts em ordem cronológica (a mesma do posts.json)."""
+        return self.cronologicos()
+
+    # --- escrita ------------------------------------------------------------
+
+    def adicionar(self, post: dict[str, Any]) -> None:
+        url = post["url"]
+        if url in self.indice["urls"]:
+            raise ValueError(f"post já existe: {url}")
+        post.setdefault("publicado_em", data_iso(post.get("data")))
+        mes = mes_do_post(post)
+        self._carregar_mes(mes)[url] = post
+        self.indice["urls"][url] = [mes, self.indice["proximo_seq"], post["publicado_em"]]
+        self.indice["proximo_seq"] += 1
+        self._inserir_cronologia(url)
+        self._sujos.add(mes)
+        self._indice_sujo = True
+
+    def atualizar(self, url: str, **campos: Any) -> dict[str, Any]:
+        """Atualiza campos de um post (sem campos: só marca como alterado, p/ edições feitas no próprio dict)."""
+        mes_antigo = self.indice["urls"][url][0]
+        post = self._carregar_mes(mes_antigo)[url]
+        if "data" in campos and "publicado_em" not in campos:
+            campos["publicado_em"] = data_iso(campos["data"])
+        post.update(campos)
+        if timestamp(post) != self.indice["urls"][url][2]:
+            self._remover_cronologia(url)
+            self.indice["urls"][url][2] = timestamp(post)
+            self._inserir_cronologia(url)
+            self._indice_sujo = True
+        mes = mes_do_post(post)
+        if mes != mes_antigo:
+            del self._meses[mes_antigo][url]
+            self._carregar_mes(mes)[url] = post
+            self.indice["urls"][url][0] = mes
+            self._sujos.add(mes_antigo)
+            self._indice_sujo = True
+        self._sujos.add(mes)
+        return post
+
+    def remover(self, url: str) -> dict[str, Any] | None:
+        if url not in self.indice["urls"]:
+            return None
+        self._remover_cronologia(url)
+        local = self.indice["urls"].pop(url)
+        self._sujos.add(local[0])
+        self._indice_sujo = True
+        return self._carregar_mes(local[0]).pop(url, None)
+
+    def salvar(self) -> list[str]:
+        """Grava os shards alterados e o índice (via atomic_write). Retorna os meses gravados."""
+        gravados = sorted(self._sujos)
+        for mes in gravados:
+            posts = sorted(self._meses[mes].values(), key=lambda p: self._chave(p["url"]))
+            caminho = self.caminho_mes(mes)
+            if posts:
+                atomic_write.escrever_texto(
+                    caminho, "".join(json.dumps(p, ensure_ascii=False, separators=(",", ":")) + "\n" for p in posts)
+                )
+                categorias: dict[str, int] = {}
+                subcategorias: dict[str, int] = {}
+                for p in posts:
+                    categorias[p.get("categoria")] = categorias.get(p.get("categoria"), 0) + 1
+                    if p.get("subcategoria"):
+                        subcategorias[p["subcategoria"]] = subcategorias.get(p["subcategoria"], 0) + 1
+                self.indice["meses"][mes] = {"posts": len(posts), "categorias": categorias, "subcategorias": subcategorias}
+            else:
+                atomic_write.remover(caminho)
+                self.indice["meses"].pop(mes, None)
+            self._indice_sujo = True
+        if self._indice_sujo:
+            atomic_write.escrever_json(self.caminho_indice, self.indice, ensure_ascii=False, separators=(",", ":"), sort_keys=True)
+        self._sujos.clear()
+        self._indice_sujo = False
+        return gravados
+
+    def exportar_json(self, caminho: str | Path = POSTS_JSON) -> bool:
+        """Regrava posts.json (formato antigo) a partir do store. True se o arquivo mudou.
+
+        A hora da exportação fica no índice (gravada no próximo salvar()).
+        """
+        mudou = atomic_write.escrever_json(caminho, self.todos(), ensure_ascii=False, indent=2)
+        self.indice["exportado_em"] = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        self._indice_sujo = True
+        return mudou
+
+    def exportar_vencido(
+        self, caminho: str | Path = POSTS_JSON, horas: float = EXPORTAR_A_CADA_H, agora: datetime | None = None
+    ) -> bool:
+        """Exporta o posts.json só se a última exportação tem mais de `horas` (ou nunca houve). True se exportou."""
+        ultima = self.indice.get("exportado_em")
+        agora = agora or datetime.now(timezone.utc).replace(tzinfo=None)
+        if ultima and agora - datetime.strptime(ultima, "%Y-%m-%dT%H:%M:%SZ") < timedelta(hours=horas):
+            return False
+        self.exportar_json(caminho)
+        return True
+
+
+def migrar(posts: list[dict[str, Any]], pasta: str | Path = STORE_DIR) -> PostStore:
+    """Store novo (em memória, a gravar com salvar()) com os posts na ordem dada."""
+    store = PostStore(pasta, carregar=False)
+    for post in posts:
+        if post.get("url") and post["url"] not in store:
+            store.adicionar(post)
+    return store
+
+
+def abrir(pasta: str | Path = STORE_DIR, posts_json: str | Path = POSTS_JSON) -> PostStore:
+    """Abre o store; se ainda não existe, importa o posts.json (ou começa vazio)."""
+    pasta = Path(pasta)
+    if atomic_write.existe(pasta / "indice.json"):
+        return PostStore(pasta)
+    bruto = atomic_write.ler_texto(posts_json)
+    return migrar(json.loads(bruto) if bruto else [], pasta)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = sys.argv[1:] if argv is None else argv
+    acao = args[0] if args else "exportar"
+    if acao == "migrar":
+        store = migrar(json.loads(POSTS_JSON.read_text(encoding="utf-8")))
+        store.salvar()
+        print(f"✅ Store criado com {len(store)} posts em {len(store.indice['meses'])} mês(es)")
+    elif acao == "exportar":
+        store = abrir()
+        mudou = store.exportar_json()
+        store.salvar()
+        print(f"✅ posts.json {'atualizado' if mudou else 'já estava em dia'} ({len(store)} posts)")
+    else:
+        print(__doc__)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
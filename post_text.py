@@ -0,0 +1,405 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Utilitários de texto das matérias: títulos, URLs, parágrafos e checagens de qualidade.
+
+Funções puras (só `re` e `urllib.parse`), usadas pelo publicador na coleta e
+na gravação dos posts. Ficam fora do bot.py para poderem ser importadas sem
+o publicador (rede, Groq e checagem de GROQ_API_KEY).
+"""
+
+
+def log(msg):
+    print(msg, flush=True)
+
+
+def normalizar_url(url):
+    """Normaliza URL para comparação consistente no cache"""
+    from urllib.parse import urlparse, urlunparse, parse_qs, urlencode
+    
+    # Converte para lowercase
+    url = url.lower().strip()
+    
+    # Remove trailing slash
+    if url.endswith('/'):
+        url = url[:-1]
+    
+    # Parse URL
+    parsed = urlparse(url)
+    
+    # Remove parâmetros de tracking comuns (utm_, fbclid, etc)
+    query_params = parse_qs(parsed.query)
+    params_limpos = {k: v for k, v in query_params.items() 
+                     if not k.startswith(('utm_', 'fbclid', 'gclid', 'ref'))}
+    
+    # Reconstrói query string ordenada
+    nova_query = urlencode(params_limpos, doseq=True) if params_limpos else ''
+    
+    # Reconstrói URL normalizada
+    return urlunparse((
+        parsed.scheme,
+        parsed.netloc,
+        parsed.path,
+        parsed.params,
+        nova_query,
+        ''  # Remove fragmento (#)
+    ))
+
+
+def normalizar_titulo(titulo):
+    """Normaliza título para detecção de duplicatas"""
+    import re
+    # Remove espaços extras, converte para lowercase
+    titulo = titulo.lower().strip()
+    # Remove pontuação
+    titulo = re.sub(r'[^\w\s]', '', titulo)
+    # Remove espaços múltiplos
+    titulo = re.sub(r'\s+', ' ', titulo)
+    return titulo
+
+
+def titulo_similar(titulo_novo, titulos_existentes, limiar=0.65):
+    """Verifica se um título é similar a algum já existente usando comparação de palavras.
+    Retorna True se encontrar um título com similaridade >= limiar (0.65 = 65%)."""
+    palavras_novo = set(normalizar_titulo(titulo_novo).split())
+    if len(palavras_novo) < 3:
+        return False
+    
+    for titulo_existente in titulos_existentes:
+        palavras_existente = set(titulo_existente.split())
+        if len(palavras_existente) < 3:
+            continue
+        
+        # Calcula similaridade de Jaccard (interseção / união)
+        intersecao = palavras_novo & palavras_existente
+        uniao = palavras_novo | palavras_existente
+        similaridade = len(intersecao) / len(uniao) if uniao else 0
+        
+        if similaridade >= limiar:
+            log(f"  🔄 Título similar ({similaridade:.0%}): {titulo_novo[:50]}...")
+            return True
+    
+    return False
+
+
+def limpar_titulo(titulo):
+    """Limpa títulos com palavras grudadas (ex: 'JacksonVeja' -> 'Jackson Veja')"""
+    import re
+    
+    # Padrão 1: letra minúscula seguida de maiúscula (ex: "jacksonVeja")
+    titulo = re.sub(r'([a-zà-ú])([A-ZÀ-Ú])', r'\1 \2', titulo)
+    
+    # Padrão 2: pontuação seguida de letra sem espaço (ex: "AÍ!Baldur's", "ok.Veja")
+    titulo = re.sub(r'([!?:.\)\]])([A-ZÀ-Úa-zà-ú])', r'\1 \2', titulo)
+    
+    # Padrão 3: palavra completamente maiúscula seguida de palavra capitalizada (ex: "HPComo")
+    titulo = re.sub(r'([A-ZÀ-Ú]{2,})([A-ZÀ-Ú][a-zà-ú])', r'\1 \2', titulo)
+    
+    # Padrão 4: dígito seguido de letra maiúscula sem espaço (ex: "9Ganha")
+    titulo = re.sub(r'(\d)([A-ZÀ-Ú])', r'\1 \2', titulo)
+    
+    # Padrão 5: letra seguida de dígito colado em contexto estranho (ex: "veja3motivos")
+    titulo = re.sub(r'([a-zà-ú])(\d+)([A-ZÀ-Ú])', r'\1 \2 \3', titulo)
+    
+    # Padrão 6: fecha aspas/parênteses colado em próxima palavra
+    titulo = re.sub(r'(["\'»])([A-ZÀ-Úa-zà-ú])', r'\1 \2', titulo)
+    
+    # Remove espaços múltiplos
+    titulo = re.sub(r'\s+', ' ', titulo)
+    
+    return titulo.strip()
+
+
+def eh_titulo_valido(titulo):
+    """Valida se o título é real (não é número de telefone, sequência, etc)"""
+    import re
+    # Remove espaços extras
+    titulo = titulo.strip()
+    
+    # Muito curto ou longo
+    if len(titulo) < 20 or len(titulo) > 250:
+        log(f"  🚫 Título rejeitado (tamanho {len(titulo)}): {titulo[:60]}...")
+        return False
+    
+    # Parece número de telefone ou ID
+    if titulo.replace('-', '').replace('(', '').replace(')', '').isdigit():
+        return False
+    
+    # Muitos números (telefone, CEP, etc)
+    num_count = sum(1 for c in titulo if c.isdigit())
+    if num_count > len(titulo) * 0.3:  # Mais de 30% números
+        return False
+    
+    # Palavras válidas mínimas (não é só números e símbolos)
+    palavras = [p for p in titulo.split() if len(p) > 2 and not p.isdigit()]
+    if len(palavras) < 3:  # Menos de 3 palavras válidas
+        log(f"  🚫 Título rejeitado (poucas palavras): {titulo[:60]}...")
+        return False
+    
+    # Rejeita títulos genéricos de seção (não são notícias reais)
+    titulo_lower = titulo.lower()
+    palavras_secao = [
+        'advance', 'latest', 'more', 'daily', 'special', 'featured',
+        'esportes a motor', 'game rant', 'puzzles and games',
+        'trending', 'popular', 'recommended', 'breaking',
+        'read more', 'see more', 'leia mais', 'veja mais', 'saiba mais',
+        'menu principal', 'navegação', 'buscar', 'pesquisar',
+        'home', 'início', 'voltar', 'anterior', 'próximo',
+        'cookies', 'privacidade', 'termos de uso',
+        'sign in', 'sign up', 'subscribe', 'follow us',
+        'all rights reserved', 'todos os direitos',
+        'notícias recentes', 'mais lidas', 'mais populares',
+        'editor picks', 'top stories', 'highlights',
+        'the gamer', 'ign brasil', 'tecmundo', 'olhar digital',
+        'game reviews', 'movie reviews', 'tv reviews',
+        'about us', 'contact us', 'advertise',
+    ]
+    for palavra in palavras_secao:
+        if titulo_lower == palavra or titulo_lower.startswith(palavra + ' ') or titulo_lower.endswith(' ' + palavra):
+            log(f"  🚫 Título rejeitado (seção genérica): {titulo[:60]}...")
+            return False
+        # Rejeita se o título inteiro é basicamente a palavra de seção
+        if palavra in titulo_lower and len(titulo) < len(palavra) + 15:
+            log(f"  🚫 Título rejeitado (seção genérica curta): {titulo[:60]}...")
+            return False
+    
+    # Rejeita títulos que são apenas nomes de categorias/seções do site
+    titulos_exatos_bloqueados = [
+        'esportes', 'entretenimento', 'tecnologia', 'videogames', 'games',
+        'política', 'economia', 'mundo', 'brasil', 'cultura', 'ciência',
+        'saúde', 'educação', 'opinião', 'editorial', 'colunistas',
+        'esportes a motor', 'automobilismo', 'futebol', 'basquete',
+        'game rant advance', 'ign recommends', 'editor choice',
+    ]
+    if titulo_lower in titulos_exatos_bloqueados:
+        log(f"  🚫 Título rejeitado (nome de categoria): {titulo[:60]}...")
+        return False
+    
+    # Rejeita títulos muito curtos com poucas palavras significativas (provavelmente categorias)
+    palavras_significativas = [p for p in titulo.split() if len(p) > 3 and p.isalpha()]
+    if len(palavras_significativas) < 4:
+        # Verifica se parece uma categoria (sem verbos de ação)
+        verbos_acao = ['ganha', 'lança', 'confirma', 'aprova', 'revela', 'anuncia',
+                       'chega', 'vence', 'perde', 'encontra', 'descobre', 'morre',
+                       'nasce', 'cresce', 'cai', 'sobe', 'muda', 'fica', 'vai', 'vem',
+                       'diz', 'afirma', 'declara', 'promete', 'nega', 'acusa',
+                       'mostra', 'apresenta', 'estreia', 'lança', 'recebe',
+                       'wins', 'loses', 'announces', 'reveals', 'launches', 'gets',
+                       'shows', 'confirms', 'releases', 'updates', 'adds',
+                       'pode', 'deve', 'será', 'está', 'foi', 'tem', 'faz',
+                       'volta', 'entra', 'sai', 'abre', 'fecha', 'inicia',
+                       'atinge', 'supera', 'bate', 'quebra', 'alcança']
+        tem_verbo = any(verbo in titulo_lower for verbo in verbos_acao)
+        if not tem_verbo:
+            log(f"  🚫 Título rejeitado (sem verbo de ação): {titulo[:60]}...")
+            return False
+    
+    # Rejeita títulos que parecem ser menus ou listas de navegação
+    if titulo.count('|') > 1 or titulo.count('›') > 1 or titulo.count('»') > 1:
+        log(f"  🚫 Título rejeitado (parece navegação): {titulo[:60]}...")
+        return False
+    
+    # Rejeita títulos com muitas palavras em inglês em sites BR (provavelmente UI)
+    palavras_en = ['the', 'and', 'for', 'with', 'from', 'this', 'that', 'your', 'our', 'their']
+    contagem_en = sum(1 for p in titulo_lower.split() if p in palavras_en)
+    if contagem_en >= 3 and len(titulo.split()) < 8:
+        log(f"  🚫 Título rejeitado (parece UI em inglês): {titulo[:60]}...")
+        return False
+    
+    return True
+
+
+def limpar_markdown(texto):
+    """Remove formatação markdown do texto"""
+    import re
+    # Remove **texto** -> texto
+    texto = re.sub(r'\*\*(.*?)\*\*', r'\1', texto)
+    # Remove *texto* -> texto
+    texto = re.sub(r'\*(.*?)\*', r'\1', texto)
+    # Remove __texto__ -> texto
+    texto = re.sub(r'__(.*?)__', r'\1', texto)
+    # Remove # titulo -> titulo
+    texto = re.sub(r'^#+\s+', '', texto, flags=re.MULTILINE)
+    # Remove tags HTML malformadas
+    texto = re.sub(r'<p><h\d>(.*?)</h\d></p>', r'\1', texto)
+    texto = re.sub(r'<p><p>(.*?)</p></p>', r'\1', texto)
+    # Remove tags HTML abertas
+    texto = re.sub(r'<h\d>|</h\d>', '', texto)
+    return texto
+
+
+def dividir_paragrafos(texto):
+    """Limpa o texto gerado e devolve a lista de parágrafos (texto puro)"""
+    import re
+    # Limpa markdown primeiro
+    texto = limpar_markdown(texto)
+    
+    # Remove tags HTML restantes
+    texto = re.sub(r'<[^>]+>', '', texto)
+    
+    # Divide em parágrafos por quebras duplas ou por pontos finais
+    blocos = texto.split('\n\n')
+    
+    paragrafos = []
+    for bloco in blocos:
+        bloco = bloco.strip()
+        if len(bloco) > 50:  # Ignora blocos muito pequenos
+            # Remove espaços múltiplos
+            paragrafos.append(re.sub(r'\s+', ' ', bloco))
+    
+    return paragrafos
+
+
+def formatar_paragrafos(texto):
+    """Formata texto em parágrafos HTML bem estruturados"""
+    return ''.join(f'<p>{p}</p>\n' for p in dividir_paragrafos(texto))
+
+
+def parece_portugues(texto: str) -> bool:
+    """Heurística simples para detectar se o texto parece PT-BR.
+    Não é um detector perfeito; é só para bloquear casos óbvios de inglês/UI."""
+    if not texto:
+        return False
+
+    t = texto.lower()
+    # remove tags
+    import re
+    t = re.sub(r'<[^>]+>', ' ', t)
+    t = re.sub(r'\s+', ' ', t).strip()
+    if len(t) < 200:
+        return False
+
+    tokens = re.findall(r"[a-zà-ú]+", t)
+    if len(tokens) < 40:
+        return False
+
+    pt_stop = {
+        'que', 'de', 'do', 'da', 'em', 'para', 'com', 'não', 'uma', 'um', 'os', 'as',
+        'por', 'mais', 'como', 'sobre', 'após', 'antes', 'entre', 'também', 'já',
+        'foi', 'será', 'são', 'era', 'está', 'estão', 'disse', 'diz', 'ainda',
+        'ao', 'aos', 'à', 'às', 'no', 'na', 'nos', 'nas', 'se', 'sua', 'seu'
+    }
+    en_stop = {
+        'the', 'and', 'for', 'with', 'from', 'this', 'that', 'your', 'our', 'their',
+        'you', 'they', 'we', 'was', 'were', 'are', 'is', 'in', 'on', 'of', 'to'
+    }
+
+    pt_hits = sum(1 for tok in tokens if tok in pt_stop)
+    en_hits = sum(1 for tok in tokens if tok in en_stop)
+
+    # presença de acentos ajuda
+    acentos = sum(1 for ch in t if ch in 'áàâãéêíóôõúç')
+
+    # decisões simples
+    if en_hits > pt_hits * 2 and en_hits > 20:
+        return False
+    if pt_hits >= 8:
+        return True
+    if acentos >= 8:
+        return True
+    return False
+
+
+def corrigir_espacamento(texto: str) -> str:
+    """Correções leves de espaçamento/pontuação para reduzir 'palavras grudadas'."""
+    import re
+    if not texto:
+        return texto
+    # espaços após pontuação
+    texto = re.sub(r'([,;:.!?])(\S)', r'\1 \2', texto)
+    # minúscula+Maiúscula coladas
+    texto = re.sub(r'([a-zà-ú])([A-ZÀ-Ú])', r'\1 \2', texto)
+    # dígito+letra colados
+    texto = re.sub(r'(\d)([A-Za-zÀ-Úà-ú])', r'\1 \2', texto)
+    # remove espaços múltiplos
+    texto = re.sub(r'\s+', ' ', texto)
+    return texto.strip()
+
+
+def remover_mencoes_de_fonte(texto: str) -> tuple[str, bool]:
+    """Remove/neutraliza menções a veículos/fontes.
+    Retorna (texto_limpo, houve_remocao)."""
+    import re
+    if not texto:
+        return texto, False
+
+    original = texto
+    t = texto
+
+    # remove padrões do tipo "Fonte: ..." em qualquer lugar
+    t = re.sub(r'(?im)^\s*fonte\s*:\s*.*$', '', t)
+    t = re.sub(r'(?im)^\s*source\s*:\s*.*$', '', t)
+
+    # neutraliza menções explícitas a portais comuns
+    veiculos = [
+        'g1', 'uol', 'folha', 'folhapress', 'poder360', 'cnn brasil', 'bbc',
+        'ge.globo', 'globo', 'oglobo', 'estadão', 'estadao', 'r7', 'ig',
+        'omelete', 'tecmundo', 'olhar digital', 'tecnoblog', 'canaltech',
+        'ign', 'game rant', 'thegamer', 'the enemy'
+    ]
+    for v in veiculos:
+        # remove "segundo <veículo>", "de acordo com <veículo>", "conforme <veículo>"
+        t = re.sub(rf'(?i)(segundo|de acordo com|conforme|reportou|informou)\s+{re.escape(v)}\b', r'\1 informações disponíveis', t)
+        t = re.sub(rf'(?i)\b{re.escape(v)}\b', v)  # mantém a palavra se estiver no meio, mas reduz chance de apagar sentido
+
+    # remove sobras de linhas vazias
+    t = re.sub(r'\n{3,}', '\n\n', t).strip()
+
+    return t, (t != original)
+
+
+def remover_primeiro_paragrafo_se_repetir_titulo(texto: str, titulo: str) -> tuple[str, bool]:
+    """Se o 1º parágrafo for basicamente o título (ou começar repetindo), remove."""
+    import re
+    if not texto or not titulo:
+        return texto, False
+
+    # quebra por parágrafos (linhas em branco)
+    partes = [p.strip() for p in re.split(r'\n\s*\n', texto) if p.strip()]
+    if len(partes) < 2:
+        return texto, False
+
+    t_norm = normalizar_titulo(titulo)
+    p0_norm = normalizar_titulo(partes[0])
+
+    # se o primeiro parágrafo contém o título (ou grande parte dele)
+    if t_norm and (t_norm in p0_norm or p0_norm.startswith(t_norm[: max(20, len(t_norm) // 2)])):
+        partes = partes[1:]
+        return '\n\n'.join(partes).strip(), True
+
+    # Jaccard simples com palavras
+    palavras_t = set(t_norm.split())
+    palavras_p0 = set(p0_norm.split())
+    if palavras_t and palavras_p0:
+        sim = len(palavras_t & palavras_p0) / len(palavras_t | palavras_p0)
+        if sim >= 0.70:
+            partes = partes[1:]
+            return '\n\n'.join(partes).strip(), True
+
+    return texto, False
+
+
+def avaliar_qualidade_materia(titulo: str, texto: str) -> list[str]:
+    """Retorna uma lista de flags com problemas detectados."""
+    flags = []
+    if not texto or len(texto) < 800:
+        flags.append('curto')
+    if not parece_portugues(texto):
+        flags.append('nao_ptbr')
+
+    # sinais de fonte
+    tl = texto.lower()
+    if 'fonte:' in tl or 'source:' in tl or 'segundo ' in tl or 'de acordo com ' in tl or 'conforme ' in tl:
+        flags.append('menciona_fonte')
+
+    # markdown (o prompt pede HTML simples)
+    if any(x in texto for x in ['**', '__', '```']):
+        flags.append('markdown')
+
+    # título repetido no começo
+    t_norm = normalizar_titulo(titulo) if titulo else ''
+    inicio = normalizar_titulo(texto[:400])
+    if t_norm and t_norm in inicio:
+        flags.append('repete_titulo')
+
+    return flags
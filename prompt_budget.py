@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Orçamento de tokens para os prompts enviados à Groq.
+
+Em vez de cortar o texto-fonte em N caracteres (o que costuma manter menus e
+rodapés e perder o miolo da notícia), escolhemos as frases de maior valor até
+um orçamento de tokens e as devolvemos na ordem original:
+
+- frases do lead (início da matéria) pesam mais;
+- frases que citam nomes/números do título (entidades) pesam mais;
+- frases com cara de boilerplate (newsletter, "leia também", cookies) são descartadas.
+
+A contagem de tokens é uma estimativa local (sem tokenizer): ~3,5 caracteres
+por token em PT-BR para os modelos Llama.
+"""
+
+import math
+import re
+
+CHARS_POR_TOKEN = 3.5
+
+BOILERPLATE = re.compile(
+    r"(?i)\b(leia também|veja também|leia mais|saiba mais|clique aqui|newsletter|inscreva-?se|assine|"
+    r"publicidade|cookies|todos os direitos|compartilhe|siga o canal|click here|read more|sign up|subscribe)\b"
+)
+
+# palavras capitalizadas que não indicam entidade no título
+_NAO_ENTIDADES = {
+    "o", "a", "os", "as", "um", "uma", "de", "do", "da", "dos", "das", "em", "no", "na",
+    "e", "é", "que", "para", "por", "com", "como", "após", "veja", "entenda", "saiba",
+}
+
+
+def estimar_tokens(texto: str) -> int:
+    """Estimativa local do número de tokens de um texto."""
+    if not texto:
+        return 0
+    return math.ceil(len(texto) / CHARS_POR_TOKEN)
+
+
+def entidades_do_titulo(titulo: str) -> set[str]:
+    """Nomes próprios, siglas e números do título, em minúsculas."""
+    entidades: set[str] = set()
+    for palavra in re.findall(r"[\wÀ-ú'-]+", titulo or ""):
+        limpa = palavra.strip("'-")
+        if not limpa or limpa.lower() in _NAO_ENTIDADES:
+            continue
+        if limpa[0].isupper() or limpa.isdigit() or (len(limpa) > 1 and limpa.isupper()):
+            entidades.add(limpa.lower())
+    return entidades
+
+
+def dividir_frases(texto: str) -> list[str]:
+    partes = re.split(r"(?<=[.!?])\s+|\n+", texto or "")
+    return [re.sub(r"\s+", " ", p).strip() for p in partes if p and p.strip()]
+
+
+def pontuar_frase(frase: str, posicao: int, entidades: set[str]) -> float:
+    if BOILERPLATE.search(frase):
+        return -1.0
+    if len(frase) < 40:
+        return 0.0
+
+    score = 1.0
+    # lead: as primeiras frases resumem a notícia
+    if posicao < 3:
+        score += 3.0 - posicao
+    else:
+        score += 1.0 / (1 + 0.1 * posicao)
+
+    palavras = {p.lower() for p in re.findall(r"[\wÀ-ú'-]+", frase)}
+    score += 1.5 * len(entidades & palavras)
+    return score
+
+
+def selecionar_trechos(texto: str, titulo: str, max_tokens: int) -> str:
+    """Devolve as frases de maior valor de `texto` que cabem em `max_tokens`, na ordem original."""
+    if not texto:
+        return ""
+    if estimar_tokens(texto) <= max_tokens:
+        return texto
+
+    entidades = entidades_do_titulo(titulo)
+    frases = dividir_frases(texto)
+
+    candidatas: list[tuple[float, int, str]] = []
+    vistas: set[str] = set()
+    for i, frase in enumerate(frases):
+        chave = frase.lower()[:120]
+        if chave in vistas:
+            continue
+        vistas.add(chave)
+        score = pontuar_frase(frase, i, entidades)
+        if score > 0:
+            candidatas.append((score, i, frase))
+
+    escolhidas: list[tuple[int, str]] = []
+    usados = 0
+    for score, i, frase in sorted(candidatas, key=lambda c: (-c[0], c[1])):
+        custo = estimar_tokens(frase) + 1
+        if usados + custo > max_tokens:
+            continue
+        escolhidas.append((i, frase))
+        usados += custo
+
+    if not escolhidas:
+        # nada pontuou (texto todo de uma frase só, por exemplo): corte simples
+        return texto[: int(max_tokens * CHARS_POR_TOKEN)]
+
+    return " ".join(frase for _, frase in sorted(escolhidas))
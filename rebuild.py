@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Re-renderização completa dos posts a partir das fontes estruturadas.
+
+Uso:
+    python rebuild.py extrair [--workers N]   # uma vez: cria post_sources/ a partir do HTML publicado
+    python rebuild.py [--workers N]           # re-renderiza todos os posts com o template atual
+
+Os posts são distribuídos num pool de processos (um por núcleo por padrão).
+Cada arquivo é escrito via atomic_write (temporário + fsync + rename) e só
+quando o conteúdo muda.
+"""
+
+import argparse
+import os
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any
+
+import atomic_write
+import post_sources
+import post_store
+
+
+def log(msg: str) -> None:
+    print(msg, flush=True)
+
+
+def extrair_um(entrada: dict[str, Any]) -> str:
+    url = entrada.get("url")
+    if not url or not Path(url).exists():
+        return "sem_arquivo"
+    html = Path(url).read_text(encoding="utf-8", errors="ignore")
+    post_sources.salvar_fonte(post_sources.extrair_fonte_html(html, entrada))
+    return "extraido"
+
+
+def renderizar_um(entrada: dict[str, Any]) -> str:
+    url = entrada.get("url")
+    if not url or not Path(url).exists():
+        return "sem_arquivo"
+    fonte = post_sources.carregar_fonte(url)
+    if fonte is None:
+        return "sem_fonte"
+
+    html_path = Path(url)
+    status = "igual"
+    atual = html_path.read_text(encoding="utf-8", errors="ignore")
+    if fonte.get("html_sha256") and post_sources.hash_html(atual) != fonte["html_sha256"]:
+        # HTML mudou depois da extração (ex.: editor): a edição vale mais que a fonte antiga
+        fonte = post_sources.extrair_fonte_html(atual, entrada)
+        status = "reextraido"
+
+    # metadados do índice são a referência (o editor pode ter corrigido algo)
+    for campo in ("categoria", "subcategoria", "data"):
+        if entrada.get(campo):
+            fonte[campo] = entrada[campo]
+
+    novo = post_sources.renderizar_post(fonte)
+    if atomic_write.escrever_texto(html_path, novo):
+        status = "escrito"
+    sha = post_sources.hash_html(novo)
+    if fonte.get("html_sha256") != sha:
+        fonte["html_sha256"] = sha
+        post_sources.salvar_fonte(fonte)
+    return status
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Re-renderiza os posts a partir de post_sources/")
+    parser.add_argument("acao", nargs="?", choices=["render", "extrair"], default="render")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args(argv)
+
+    posts = post_store.abrir().todos()
+    post_sources.SOURCES_DIR.mkdir(exist_ok=True)
+    func = extrair_um if args.acao == "extrair" else renderizar_um
+
+    inicio = time.perf_counter()
+    if args.workers > 1:
+        with ProcessPoolExecutor(max_workers=args.workers) as pool:
+            resultados = Counter(pool.map(func, posts, chunksize=64))
+    else:
+        resultados = Counter(map(func, posts))
+    duracao = time.perf_counter() - inicio
+
+    resumo = ", ".join(f"{k}={v}" for k, v in sorted(resultados.items()))
+    log(f"✅ {args.acao}: {len(posts)} posts em {duracao:.1f}s com {args.workers} processo(s) | {resumo}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
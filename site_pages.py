@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Listagens do site: capa (index), páginas de categoria, arquivo paginado e feeds.
+
+Saiu do bot.py para que o editor (e quem mais precise regerar páginas) não
+tenha que importar o publicador: aqui não há rede, Groq nem efeitos
+colaterais no import, só o que as listagens precisam (templates, manifesto
+de build, índice de posts e miniaturas).
+
+Cada listagem é dividida em blocos fixos de POSTS_POR_PAGINA contados a partir
+do post mais antigo; a capa mostra o bloco mais novo e os arquivados viram
+page/k.html + shards JSON imutáveis (cards/<base>/k-<hash>.json) que a capa
+carrega ao rolar. O build_manifest.json evita reescrever páginas cujas
+entradas não mudaram.
+"""
+
+import json
+from pathlib import Path
+from typing import Any
+
+import atomic_write
+import build_manifest
+import feeds
+import post_index
+import site_templates
+from temas import TEMAS
+import thumbnails
+
+
+def log(msg):
+    print(msg, flush=True)
+
+
+# Incrementar sempre que o HTML de index/categorias mudar, para invalidar o build_manifest.json
+VERSAO_TEMPLATE = 4
+
+CAMPOS_CARD = ('titulo', 'url', 'imagem', 'categoria', 'subcategoria', 'data')
+
+# Tamanho fixo dos blocos de paginação (index e categorias)
+POSTS_POR_PAGINA = 60
+
+
+def entradas_cards(posts):
+    """Campos dos posts que aparecem nos cards (o que importa para o manifesto)"""
+    # + hash das miniaturas: o card muda quando a miniatura da imagem fica pronta
+    return [[p.get(c) for c in CAMPOS_CARD] + [thumbnails.chave(p.get('imagem'))] for p in posts]
+
+
+def paginar(posts):
+    """Divide posts (ordem cronológica) em blocos fixos contados a partir do mais antigo.
+
+    Retorna (posts_da_capa, blocos_arquivados). A capa mostra o bloco mais novo e,
+    se ele ainda não estiver cheio, também o anterior (nunca fica quase vazia).
+    Os blocos arquivados (page/1.html = mais antigo) só mudam quando um post
+    antigo é editado/removido, então um post novo não reescreve o arquivo inteiro.
+    """
+    blocos = [posts[i:i + POSTS_POR_PAGINA] for i in range(0, len(posts), POSTS_POR_PAGINA)]
+    if not blocos:
+        return [], []
+    na_capa = 2 if len(blocos) > 1 and len(blocos[-1]) < POSTS_POR_PAGINA else 1
+    capa = [p for bloco in blocos[-na_capa:] for p in bloco]
+    return capa, blocos[:-na_capa]
+
+
+def caminho_pagina_arquivo(base, k):
+    """Arquivo da k-ésima página de arquivo: page/k.html (home) ou categoria-x/page/k.html"""
+    return f"page/{k}.html" if base == 'index' else f"{base}/page/{k}.html"
+
+
+def renderizar_paginacao(link_recentes=None, link_antigas=None):
+    if not link_recentes and not link_antigas:
+        return ''
+    links = ''
+    if link_recentes:
+        links += f'<a class="paginacao-recentes" href="{link_recentes}">← Mais recentes</a>\n'
+    if link_antigas:
+        links += f'<a class="paginacao-antigas" href="{link_antigas}">Mais antigas →</a>\n'
+    return f'<nav class="paginacao">\n{links}</nav>'
+
+
+def caminho_shard(base, k, chave):
+    """cards/index/k-<hash>.json: o hash das entradas no nome deixa o shard imutável"""
+    return f"cards/{base}/{k}-{chave[:12]}.json"
+
+
+def gerar_shards(base, arquivados):
+    """Blocos arquivados como JSON (cards já renderizados) para a capa carregar ao rolar.
+
+    Um shard existente nunca é reescrito: se o bloco muda (post novo completando
+    o bloco, edição, remoção), ele ganha outro nome e o antigo é apagado.
+    Retorna (shards do mais novo ao mais antigo, quantos foram escritos).
+    """
+    shards = []
+    escritos = 0
+    for k, bloco in enumerate(arquivados, start=1):
+        cards_bloco = list(reversed(bloco))
+        caminho = caminho_shard(base, k, build_manifest.hash_entradas('shard', VERSAO_TEMPLATE, entradas_cards(cards_bloco)))
+        if not atomic_write.existe(caminho):
+            cards = [site_templates.CARD.formatar(site_templates.contexto_card(p)) for p in cards_bloco]
+            atomic_write.escrever_json(caminho, {'pagina': k, 'cards': cards}, ensure_ascii=False, separators=(',', ':'))
+            escritos += 1
+        shards.append(caminho)
+
+    pasta = Path('cards') / base
+    if pasta.exists():
+        atuais = set(shards)
+        for arquivo in pasta.glob('*.json'):
+            if arquivo.as_posix() not in atuais:
+                atomic_write.remover(arquivo)
+    return list(reversed(shards)), escritos
+
+
+def renderizar_carregador(shards):
+    """Âncora + script que anexam os shards à grade conforme o leitor rola (a paginação fica como fallback sem JS)"""
+    if not shards:
+        return ''
+    return (f'\n<div class="carregar-mais" data-shards=\'{json.dumps(shards)}\'></div>'
+            '\n<script src="cards.js" defer></script>')
+
+
+def gerar_listagem_paginada(base, visiveis, titulo, secao, manifesto, vazio=False):
+    """Gera a capa `base`.html, os shards JSON e as páginas de arquivo estáveis de uma listagem.
+
+    `visiveis` vem em ordem cronológica (mais antigo primeiro). Retorna quantas
+    páginas foram (re)escritas.
+    """
+    capa, arquivados = paginar(visiveis)
+    total = len(arquivados)
+    shards, _ = gerar_shards(base, arquivados)
+    geradas = 0
+
+    # Capa: mais recentes primeiro
+    fname = f"{base}.html"
+    link_antigas = caminho_pagina_arquivo(base, total) if total else None
+    cards_capa = list(reversed(capa))
+    chave = build_manifest.hash_entradas(fname, VERSAO_TEMPLATE, vazio, link_antigas, shards, entradas_cards(cards_capa))
+    if build_manifest.precisa_gerar(manifesto, fname, chave):
+        if vazio:
+            cards = '<p class="sem-artigos">Nenhuma notícia nesta categoria ainda.</p>'
+        else:
+            cards = site_templates.cards(cards_capa)
+        html = site_templates.LISTAGEM.render(titulo=titulo, raiz='', secao=secao, cards=cards,
+                                              paginacao=renderizar_paginacao(link_antigas=link_antigas),
+                                              carregador=renderizar_carregador(shards))
+        atomic_write.escrever_texto(fname, html)
+        build_manifest.registrar(manifesto, fname, chave, html)
+        geradas += 1
+
+    # Páginas de arquivo: page/1.html é o bloco mais antigo
+    raiz = '../' * (caminho_pagina_arquivo(base, 1).count('/'))
+    for k, bloco in enumerate(arquivados, start=1):
+        fname = caminho_pagina_arquivo(base, k)
+        link_recentes = f"{k + 1}.html" if k < total else f"{raiz}{base}.html"
+        link_antigas = f"{k - 1}.html" if k > 1 else None
+        cards_bloco = list(reversed(bloco))
+        chave = build_manifest.hash_entradas(fname, VERSAO_TEMPLATE, link_recentes, link_antigas, entradas_cards(cards_bloco))
+        if not build_manifest.precisa_gerar(manifesto, fname, chave):
+            continue
+        html = site_templates.LISTAGEM.render(titulo=f"{secao} - Página {k} - Vivimundo", raiz=raiz, secao=secao,
+                                              cards=site_templates.cards(cards_bloco, raiz),
+                                              paginacao=renderizar_paginacao(link_recentes, link_antigas),
+                                              carregador='')
+        atomic_write.escrever_texto(fname, html)
+        build_manifest.registrar(manifesto, fname, chave, html)
+        geradas += 1
+
+    # Remove páginas de arquivo que sobraram (ex.: posts removidos pelo editor)
+    pasta = Path(caminho_pagina_arquivo(base, 1)).parent
+    if pasta.exists():
+        for arquivo in pasta.glob('*.html'):
+            if arquivo.stem.isdigit() and int(arquivo.stem) > total:
+                atomic_write.remover(arquivo)
+                manifesto.pop(arquivo.as_posix(), None)
+
+    return geradas
+
+
+def atualizar_home(posts):
+    # Lista todas as matérias, paginadas; a capa traz as mais recentes
+    visiveis = []
+    for p in posts:
+        # Verifica se o arquivo HTML do post existe (índice em memória, sem stat por card)
+        if not post_index.existe(p['url']):
+            log(f"  ⚠️ Post {p['titulo'][:40]} não tem arquivo HTML, pulando")
+            continue
+        visiveis.append(p)
+
+    manifesto = build_manifest.carregar_manifesto()
+    geradas = gerar_listagem_paginada('index', visiveis, 'Vivimundo - Portal de Notícias', 'Últimas Notícias', manifesto)
+    build_manifest.salvar_manifesto(manifesto)
+    if geradas:
+        log(f"  📝 Index atualizado ({geradas} página(s))")
+    else:
+        log("  ⏭️ Index sem mudanças")
+
+
+def gerar_paginas_categorias(posts):
+    """Gera páginas (paginadas) para cada categoria com artigos filtrados"""
+    # Garante que todas as categorias do TEMAS tenham páginas (mesmo que vazias)
+    categorias = {tema['categoria']: [] for tema in TEMAS}
+    
+    # Preenche com posts existentes
+    for p in posts:
+        cat = p['categoria']
+        if cat in categorias:
+            categorias[cat].append(p)
+    
+    manifesto = build_manifest.carregar_manifesto()
+    for cat, artigos in categorias.items():
+        # Só as matérias que têm arquivo HTML
+        visiveis = [p for p in artigos if post_index.existe(p['url'])]
+        nome = cat.replace('-',' ').title()
+        geradas = gerar_listagem_paginada(f"categoria-{cat}", visiveis, f"{nome} - Vivimundo", nome, manifesto,
+                                          vazio=not artigos)
+        if geradas:
+            log(f"  📚 Categoria '{cat}' atualizada ({geradas} página(s))")
+    build_manifest.salvar_manifesto(manifesto)
+
+
+def atualizar_feeds(posts):
+    """Feeds Atom e sitemaps (só os arquivos cujas entradas mudaram)"""
+    gerados = feeds.atualizar_feeds(posts, dict.fromkeys(t['categoria'] for t in TEMAS))
+    if gerados:
+        log(f"  📡 Feeds/sitemaps atualizados ({gerados} arquivo(s))")
+
+
+def regerar(posts: list[dict[str, Any]]) -> None:
+    """Capa, categorias e feeds de uma vez (o que muda quando posts entram, mudam ou saem)."""
+    atualizar_home(posts)
+    gerar_paginas_categorias(posts)
+    atualizar_feeds(posts)
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Templates pré-compilados do site (post, listagens, cards) com parciais compartilhadas.
+
+Sintaxe mínima:
+- {{campo}}     -> valor do contexto (str) ou função que escreve no stream;
+- {{> parcial}} -> conteúdo de outra template, embutido na compilação.
+
+Cada template é compilada uma única vez (no import) numa função com uma
+f-string gerada. Campos que são funções (ex.: {{cards}}) escrevem direto no
+stream da página (arquivo ou io.StringIO), sem montar uma string gigante por
+concatenação; os cards de uma listagem são escritos um a um no mesmo stream.
+
+Header/nav e footer existem em um só lugar (CABECALHO e RODAPE); o prefixo
+{{raiz}} ajusta os links para páginas em subpastas (posts/, page/...).
+"""
+
+import io
+import re
+from functools import lru_cache
+from typing import Any, Callable, Iterable, TextIO
+
+import thumbnails
+
+_TOKEN = re.compile(r"\{\{\s*(>?)\s*([\w-]+)\s*\}\}")
+
+_LITERAL = 0
+_CAMPO = 1
+
+
+def _escapar_fstring(literal: str) -> str:
+    return (
+        literal.replace("\\", "\\\\")
+        .replace('"', '\\"')
+        .replace("\n", "\\n")
+        .replace("{", "{{")
+        .replace("}", "}}")
+    )
+
+
+class Template:
+    """Template compilada: sequência de (tipo, valor) com parciais já embutidas."""
+
+    def __init__(self, fonte: str, parciais: dict[str, "Template"] | None = None):
+        partes: list[tuple[int, str]] = []
+        pos = 0
+        for m in _TOKEN.finditer(fonte):
+            if m.start() > pos:
+                partes.append((_LITERAL, fonte[pos : m.start()]))
+            if m.group(1):
+                partes.extend((parciais or {})[m.group(2)].partes)
+            else:
+                partes.append((_CAMPO, m.group(2)))
+            pos = m.end()
+        if pos < len(fonte):
+            partes.append((_LITERAL, fonte[pos:]))
+
+        # junta literais vizinhos (parciais embutidas costumam gerar vários)
+        self.partes: list[tuple[int, str]] = []
+        for tipo, valor in partes:
+            if tipo == _LITERAL and self.partes and self.partes[-1][0] == _LITERAL:
+                self.partes[-1] = (_LITERAL, self.partes[-1][1] + valor)
+            else:
+                self.partes.append((tipo, valor))
+
+        # forma compilada para o caso comum (todos os campos são strings): uma f-string gerada
+        corpo = "".join(_escapar_fstring(valor) if tipo == _LITERAL else "{c[%r]}" % valor for tipo, valor in self.partes)
+        escopo: dict[str, Any] = {}
+        exec(compile(f'def _render(c):\n    return f"{corpo}"\n', "<template>", "exec"), escopo)
+        self.formatar: Callable[[dict[str, Any]], str] = escopo["_render"]
+        self._campos = [valor for tipo, valor in self.partes if tipo == _CAMPO]
+
+    def escrever(self, saida: TextIO, contexto: dict[str, Any]) -> None:
+        if not any(callable(contexto[c]) for c in self._campos):
+            saida.write(self.formatar(contexto))
+            return
+        for tipo, valor in self.partes:
+            if tipo == _LITERAL:
+                saida.write(valor)
+                continue
+            v = contexto[valor]
+            if callable(v):
+                v(saida)
+            else:
+                saida.write(str(v))
+
+    def render(self, **contexto: Any) -> str:
+        buf = io.StringIO()
+        self.escrever(buf, contexto)
+        return buf.getvalue()
+
+
+CABECALHO = Template(
+    """<header><div class="container"><h1 class="logo">VIVIMUNDO</h1>
+<nav>
+<a href="{{raiz}}index.html">Início</a>
+<a href="{{raiz}}categoria-esportes.html">Esportes</a>
+<a href="{{raiz}}categoria-entretenimento.html">Entretenimento</a>
+<a href="{{raiz}}categoria-tecnologia.html">Tecnologia</a>
+<a href="{{raiz}}categoria-videogames.html">Videogames</a>
+<a href="{{raiz}}categoria-politica-nacional.html">Política Nacional</a>
+<a href="{{raiz}}categoria-politica-internacional.html">Política Internacional</a>
+<a href="{{raiz}}categoria-rio-de-janeiro.html">Rio de Janeiro</a>
+<a href="{{raiz}}categoria-sao-paulo.html">São Paulo</a>
+<a href="{{raiz}}sobre.html">Sobre</a>
+</nav>
+</div></header>"""
+)
+
+RODAPE = Template(
+    """<footer><div class="container"><p>© 2026 Vivimundo</p><a href="https://x.com/Kevin_RSP0" target="_blank">Twitter</a></div></footer>"""
+)
+
+_PARCIAIS = {"cabecalho": CABECALHO, "rodape": RODAPE}
+
+POST = Template(
+    """<!DOCTYPE html>
+<html lang="pt-BR">
+<head>
+<meta charset="UTF-8">
+<meta name="viewport" content="width=device-width, initial-scale=1.0">
+<meta property="og:title" content="{{titulo}}">
+<meta property="og:image" content="{{imagem}}">
+<meta property="og:type" content="article">
+<title>{{titulo}} - Vivimundo</title>
+<link rel="stylesheet" href="{{raiz}}style.css">
+</head>
+<body>
+{{> cabecalho}}
+<main class="container">
+<article class="post-completo">
+<div class="post-header">
+<span class="post-categoria">{{categoria_nome}}</span>
+{{subcat_html}}
+<h1 class="post-titulo">{{titulo}}</h1>
+<div class="post-data">Por Kevin Ribeiro • {{data}}</div>
+</div>
+{{imagem_html}}
+<div class="post-conteudo">
+{{paragrafos}}
+</div>
+</article>
+</main>
+{{> rodape}}
+</body></html>""",
+    _PARCIAIS,
+)
+
+LISTAGEM = Template(
+    """<!DOCTYPE html>
+<html lang="pt-BR">
+<head><meta charset="UTF-8"><meta name="viewport" content="width=device-width, initial-scale=1.0">
+<title>{{titulo}}</title><link rel="stylesheet" href="{{raiz}}style.css">
+<link rel="alternate" type="application/atom+xml" title="Vivimundo" href="{{raiz}}feeds/atom.xml"></head>
+<body>
+{{> cabecalho}}
+<main class="container">
+<h2 class="secao-titulo">{{secao}}</h2>
+<div class="posts-grid">{{cards}}</div>
+{{paginacao}}{{carregador}}
+</main>
+{{> rodape}}
+</body></html>""",
+    _PARCIAIS,
+)
+
+CARD = Template(
+    """<article class="post-card">
+{{imagem_html}}
+<div class="post-info">
+<span class="categoria categoria-{{categoria}}">{{categoria_nome}}</span>
+{{subcat_html}}
+<h2><a href="{{raiz}}{{url}}">{{titulo}}</a></h2>
+<p class="meta">Por Kevin Ribeiro • {{data}}</p>
+</div>
+</article>"""
+)
+
+
+def imagem_card(imagem: str, titulo: str, raiz: str = "") -> str:
+    """<picture> com miniaturas quando existem; senão a imagem original, como sempre foi."""
+    return thumbnails.html_imagem(imagem, titulo, raiz) or f'<img src="{imagem}" alt="{titulo}">'
+
+
+def imagem_post(imagem: str, titulo: str, raiz: str = "../") -> str:
+    return thumbnails.html_imagem(
+        imagem, titulo, raiz, sizes=thumbnails.SIZES_POST, classe="post-principal-imagem", lazy=True
+    ) or f'<img src="{imagem}" class="post-principal-imagem" alt="{titulo}" loading="lazy">'
+
+
+@lru_cache(maxsize=None)
+def nome_exibicao(slug: str) -> str:
+    """'politica-nacional' -> 'Politica Nacional' (mesma regra usada desde o início)."""
+    return slug.replace("-", " ").title()
+
+
+def contexto_card(p: dict[str, Any], raiz: str = "") -> dict[str, Any]:
+    # Adiciona subcategoria se existir
+    subcat = p.get("subcategoria")
+    return {
+        "imagem_html": imagem_card(p["imagem"], p["titulo"], raiz),
+        "titulo": p["titulo"],
+        "categoria": p["categoria"],
+        "categoria_nome": nome_exibicao(p["categoria"]),
+        "subcat_html": f'<span class="subcategoria">{nome_exibicao(subcat)}</span>' if subcat else "",
+        "raiz": raiz,
+        "url": p["url"],
+        "data": p["data"],
+    }
+
+
+def cards(posts: Iterable[dict[str, Any]], raiz: str = "") -> Callable[[TextIO], None]:
+    """Campo {{cards}} que escreve os cards direto no stream da página."""
+
+    def escrever(saida: TextIO) -> None:
+        w = saida.write
+        for p in posts:
+            w(CARD.formatar(contexto_card(p, raiz)))
+
+    return escrever
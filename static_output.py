@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Estágio de saída estática: HTML/CSS minificados + irmãos .gz/.br em dist/.
+
+Uso:
+    python static_output.py            # atualiza dist/ e imprime o relatório de tamanhos
+    python static_output.py --relatorio  # só o relatório (não escreve nada)
+
+dist/ espelha o site (index, page/, categorias, posts/, sobre, style.css,
+cards.js + shards JSON, feeds/sitemaps e miniaturas) e é o que um host que
+serve arquivos pré-comprimidos deve publicar; os arquivos do
+repositório continuam como estão (o build manifest e as fontes dos posts
+dependem dos bytes originais).
+
+Incremental: dist/.manifest.json guarda, por arquivo, o stat e o sha256 da
+origem. Se o stat bate, nem lê o arquivo; se só o stat mudou (ex.: checkout
+novo) e o hash bate, nada é reescrito. As saídas passam por atomic_write.
+
+O .br só é gerado se o pacote `Brotli` estiver instalado (pip install Brotli).
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import re
+import sys
+from pathlib import Path
+from typing import Any
+
+import atomic_write
+
+try:
+    import brotli
+except ImportError:  # opcional
+    brotli = None
+
+
+def log(msg: str) -> None:
+    print(msg, flush=True)
+
+
+DIST_DIR = Path("dist")
+MANIFEST_DIST = DIST_DIR / ".manifest.json"
+RELATORIO_JSON = DIST_DIR / "tamanhos.json"
+
+# Incrementar quando o minificador mudar, para refazer tudo
+VERSAO_MINIFICADOR = 1
+
+PADROES_ORIGEM = (
+    "index.html", "page/*.html", "categoria-*.html", "categoria-*/page/*.html", "posts/*.html", "*.html",
+    "style.css", "cards.js", "cards/*/*.json", "sitemap.xml", "sitemaps/*.xml", "feeds/*.xml", "thumbs/*/*",
+)
+# já comprimidos: vão para dist/ como estão, sem .gz/.br
+SEM_COMPRESSAO = {".webp", ".jpg", ".jpeg", ".png"}
+
+# --- Minificação -------------------------------------------------------------
+
+_COMENTARIO_HTML = re.compile(r"<!--(?!\[if).*?-->", re.S)
+_PRESERVAR_HTML = re.compile(r"(<(pre|textarea|script|style)\b.*?</\2>)", re.S | re.I)
+_ESPACOS = re.compile(r"\s+")
+_TAGS_BLOCO = (
+    r"!DOCTYPE|html|head|body|meta|link|title|header|nav|main|article|section|aside|footer|div|p|"
+    r"h[1-6]|ul|ol|li|table|thead|tbody|tr|td|th|form|br|hr"
+)
+_ANTES_DE_BLOCO = re.compile(r"\s+(</?(?:%s)\b)" % _TAGS_BLOCO, re.I)
+_DEPOIS_DE_BLOCO = re.compile(r"(</?(?:%s)\b[^>]*>)\s+" % _TAGS_BLOCO, re.I)
+
+_COMENTARIO_CSS = re.compile(r"/\*.*?\*/", re.S)
+_CSS_PONTUACAO = re.compile(r"\s*([{};,>])\s*")
+_CSS_DOIS_PONTOS = re.compile(r":\s+")
+
+
+def minificar_html(html: str) -> str:
+    """Colapsa espaços e remove os que ficam entre tags de bloco (onde não aparecem na tela).
+
+    Espaço entre elementos inline (ex.: links do nav) vira um espaço só, nunca
+    some; <pre>, <textarea>, <script> e <style> passam intactos.
+    """
+    partes = _PRESERVAR_HTML.split(html)
+    saida: list[str] = []
+    # split com 2 grupos: [texto, bloco_preservado, nome_tag, texto, ...]
+    for i in range(0, len(partes), 3):
+        trecho = _COMENTARIO_HTML.sub("", partes[i])
+        trecho = _ESPACOS.sub(" ", trecho)
+        trecho = _ANTES_DE_BLOCO.sub(r"\1", trecho)
+        trecho = _DEPOIS_DE_BLOCO.sub(r"\1", trecho)
+        saida.append(trecho)
+        if i + 1 < len(partes):
+            saida.append(partes[i + 1])
+    return "".join(saida).strip()
+
+
+def minificar_css(css: str) -> str:
+    css = _COMENTARIO_CSS.sub("", css)
+    css = _ESPACOS.sub(" ", css)
+    css = _CSS_PONTUACAO.sub(r"\1", css)
+    # só depois do ':' — antes dele pode ser um seletor descendente (ex.: "a :hover")
+    css = _CSS_DOIS_PONTOS.sub(":", css)
+    return css.replace(";}", "}").strip()
+
+
+def minificar(caminho: Path, dados: bytes) -> bytes:
+    """HTML e CSS são minificados; o resto (JSON, XML, JS, imagens) passa como está."""
+    if caminho.suffix == ".css":
+        return minificar_css(dados.decode("utf-8")).encode("utf-8")
+    if caminho.suffix == ".html":
+        return minificar_html(dados.decode("utf-8")).encode("utf-8")
+    return dados
+
+
+# --- Compressão --------------------------------------------------------------
+
+
+def comprimir_gzip(dados: bytes) -> bytes:
+    # mtime=0: mesma entrada -> mesmos bytes (atomic_write não reescreve)
+    return gzip.compress(dados, compresslevel=9, mtime=0)
+
+
+def comprimir_brotli(dados: bytes) -> bytes | None:
+    if brotli is None:
+        return None
+    return brotli.compress(dados, quality=11)
+
+
+# --- Estágio incremental -----------------------------------------------------
+
+
+def tipo_pagina(rel: str) -> str:
+    """Agrupamento usado no relatório de tamanhos."""
+    if rel == "index.html" or rel.startswith("page/"):
+        return "index"
+    if rel.startswith("categoria-"):
+        return "categoria"
+    if rel.startswith("posts/"):
+        return "post"
+    if rel.startswith("cards/"):
+        return "shard"
+    if rel.startswith("thumbs/"):
+        return "imagem"
+    if rel.endswith(".xml"):
+        return "feed"
+    if rel.endswith(".css") or rel.endswith(".js"):
+        return rel.rsplit(".", 1)[1]
+    return "outra"
+
+
+def listar_origens() -> list[Path]:
+    vistos: dict[str, Path] = {}
+    for padrao in PADROES_ORIGEM:
+        for p in Path(".").glob(padrao):
+            if p.is_file():
+                vistos.setdefault(p.as_posix(), p)
+    return [vistos[k] for k in sorted(vistos)]
+
+
+def carregar_manifesto_dist() -> dict[str, Any]:
+    try:
+        data = json.loads(MANIFEST_DIST.read_text(encoding="utf-8"))
+        if isinstance(data, dict) and data.get("versao") == VERSAO_MINIFICADOR:
+            return data
+    except Exception:
+        pass
+    return {"versao": VERSAO_MINIFICADOR, "arquivos": {}}
+
+
+def _assinatura_stat(p: Path) -> list[int]:
+    st = p.stat()
+    return [st.st_mtime_ns, st.st_size]
+
+
+def processar_arquivo(origem: Path, registro: dict[str, Any] | None) -> tuple[dict[str, Any], bool]:
+    """Gera dist/<origem> (+ .gz/.br). Retorna (registro_novo, escreveu_algo)."""
+    stat = _assinatura_stat(origem)
+    comprimir = origem.suffix not in SEM_COMPRESSAO
+    tem_br = brotli is not None and comprimir
+    if registro and registro.get("stat") == stat and (registro.get("br") is not None or not tem_br):
+        return registro, False
+
+    dados = origem.read_bytes()
+    sha = hashlib.sha256(dados).hexdigest()
+    if registro and registro.get("sha256") == sha and (registro.get("br") is not None or not tem_br):
+        return {**registro, "stat": stat}, False
+
+    destino = DIST_DIR / origem
+    mini = minificar(origem, dados)
+    gz = comprimir_gzip(mini) if comprimir else None
+    br = comprimir_brotli(mini) if comprimir else None
+    escreveu = atomic_write.escrever_bytes(destino, mini)
+    if gz is not None:
+        escreveu |= atomic_write.escrever_bytes(destino.with_name(destino.name + ".gz"), gz)
+    if br is not None:
+        escreveu |= atomic_write.escrever_bytes(destino.with_name(destino.name + ".br"), br)
+    return {
+        "stat": stat,
+        "sha256": sha,
+        "original": len(dados),
+        "minificado": len(mini),
+        "gz": len(gz) if gz is not None else len(mini),
+        "br": len(br) if br is not None else None,
+    }, escreveu
+
+
+def remover_saidas(rel: str) -> None:
+    destino = DIST_DIR / rel
+    for p in (destino, destino.with_name(destino.name + ".gz"), destino.with_name(destino.name + ".br")):
+        atomic_write.remover(p)
+
+
+def relatorio_tamanhos(arquivos: dict[str, dict[str, Any]]) -> dict[str, dict[str, Any]]:
+    """Totais e média por tipo de página (bytes originais, minificados, gzip, brotli)."""
+    tipos: dict[str, dict[str, Any]] = {}
+    for rel, reg in arquivos.items():
+        t = tipos.setdefault(tipo_pagina(rel), {"paginas": 0, "original": 0, "minificado": 0, "gz": 0, "br": 0})
+        t["paginas"] += 1
+        for campo in ("original", "minificado", "gz", "br"):
+            t[campo] += reg.get(campo) or 0
+    for t in tipos.values():
+        for campo in ("original", "minificado", "gz", "br"):
+            t[f"media_{campo}"] = round(t[campo] / t["paginas"])
+    return dict(sorted(tipos.items()))
+
+
+def imprimir_relatorio(tipos: dict[str, dict[str, Any]]) -> None:
+    log(f"{'tipo':<10} {'págs':>6} {'original':>10} {'mínimo':>10} {'gzip':>10} {'brotli':>10}   (média por página, KB)")
+    for nome, t in tipos.items():
+        kb = lambda campo: f"{t[f'media_{campo}'] / 1024:10.1f}"  # noqa: E731
+        br = kb("br") if t["br"] else f"{'-':>10}"
+        log(f"{nome:<10} {t['paginas']:>6} {kb('original')} {kb('minificado')} {kb('gz')} {br}")
+    # visita típica: capa + style.css
+    if "index" in tipos and "css" in tipos:
+        original = tipos["index"]["media_original"] + tipos["css"]["media_original"]
+        gz = tipos["index"]["media_gz"] + tipos["css"]["media_gz"]
+        log(f"📦 Visita à capa (HTML + CSS): {original / 1024:.1f} KB -> {gz / 1024:.1f} KB com gzip")
+
+
+def gerar_saida() -> dict[str, Any]:
+    """Atualiza dist/ só para as origens novas/alteradas e remove saídas órfãs."""
+    manifesto = carregar_manifesto_dist()
+    anteriores: dict[str, Any] = manifesto["arquivos"]
+    atuais: dict[str, Any] = {}
+    escritos = 0
+    # sem lote: cada arquivo já é atômico e um run interrompido só refaz o que faltou
+    for origem in listar_origens():
+        rel = origem.as_posix()
+        registro, escreveu = processar_arquivo(origem, anteriores.get(rel))
+        atuais[rel] = registro
+        escritos += escreveu
+    for rel in set(anteriores) - set(atuais):
+        remover_saidas(rel)
+    manifesto["arquivos"] = atuais
+    tipos = relatorio_tamanhos(atuais)
+    atomic_write.escrever_json(MANIFEST_DIST, manifesto, separators=(",", ":"), sort_keys=True)
+    atomic_write.escrever_json(RELATORIO_JSON, tipos, indent=2, sort_keys=True)
+    log(f"  🗜️ dist/: {escritos} arquivo(s) atualizado(s), {len(atuais)} no total")
+    return tipos
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Minifica e pré-comprime o site em dist/")
+    parser.add_argument("--relatorio", action="store_true", help="só mostra o relatório do último build")
+    args = parser.parse_args(argv)
+    if args.relatorio:
+        tipos = relatorio_tamanhos(carregar_manifesto_dist()["arquivos"])
+    else:
+        tipos = gerar_saida()
+    imprimir_relatorio(tipos)
+    if brotli is None:
+        log("ℹ️ Brotli não instalado: .br não gerados (pip install Brotli)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
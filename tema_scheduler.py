@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Escolha do tema de cada execução do publicador pelo ganho esperado.
+
+Substitui a rotação fixa (tema_idx em bot_state.json), que dava a um tema
+parado (teatro, São Paulo num domingo) a mesma vez de um tema movimentado,
+e desperdiçava a execução quando não achava nada. tema_stats.json guarda,
+por tema:
+
+- rendimento: tentativas e publicações com decaimento (as mais recentes pesam
+  mais), o mesmo por portal, para tentar primeiro os que costumam render;
+- estoque: quantos links com cara de matéria nova sobraram na última página
+  lida (candidatos que ficaram para a próxima); candidatos já verificados na
+  fila do candidate_queue contam mais (publicar deles é quase certo);
+- a rodada da última tentativa (para o piso de justiça).
+
+O ganho de um tema é P(publicar) x (fome + estoque), onde a fome cresce com o
+tempo desde o último post da categoria (lido do próprio store, então remoções
+do editor contam) e desde a última tentativa, até FOME_MAX. Um tema que não foi tentado nas últimas
+PISO_RODADAS execuções é escolhido de qualquer jeito: toda categoria continua
+recebendo conteúdo, mesmo com rendimento baixo.
+"""
+
+import json
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Iterable
+
+import atomic_write
+import post_store
+
+STATS_JSON = "tema_stats.json"
+
+# Peso das contagens antigas a cada nova tentativa (~10 últimas tentativas contam)
+DECAIMENTO = 0.9
+# Intervalo "normal" entre posts de um mesmo tema (18 execuções/dia, 8 temas)
+HORAS_ALVO = 8.0
+FOME_MAX = 3.0
+# Depois de uma tentativa sem post, o tema volta a concorrer em poucas horas
+HORAS_RETENTATIVA = 2.0
+# Estoque: até ESTOQUE_MAX candidatos contam; perde metade do valor a cada MEIA_VIDA_ESTOQUE_H
+ESTOQUE_MAX = 10
+PESO_ESTOQUE = 0.5
+MEIA_VIDA_ESTOQUE_H = 3.0
+# P(publicar) de um tema com candidatos verificados na fila
+PROB_COM_FILA = 0.95
+# Cada tema é tentado pelo menos uma vez a cada PISO_RODADAS execuções
+PISO_RODADAS = 16
+
+
+def agora_utc() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def carregar(caminho: str = STATS_JSON) -> dict[str, Any]:
+    bruto = atomic_write.ler_texto(caminho)
+    estado: dict[str, Any] = {}
+    if bruto is not None:
+        try:
+            estado = json.loads(bruto)
+        except Exception:
+            estado = {}
+    if not isinstance(estado, dict):
+        estado = {}
+    estado.setdefault("rodada", 0)
+    estado.setdefault("temas", {})
+    return estado
+
+
+def salvar(estado: dict[str, Any], caminho: str = STATS_JSON) -> bool:
+    return atomic_write.escrever_json(caminho, estado, ensure_ascii=False, indent=1, sort_keys=True)
+
+
+def probabilidade(contagem: dict[str, Any] | None) -> float:
+    """P(sucesso) com prior uniforme: (sucessos + 1) / (tentativas + 2); 0,5 sem histórico."""
+    contagem = contagem or {}
+    return (contagem.get("sucessos", 0.0) + 1) / (contagem.get("tentativas", 0.0) + 2)
+
+
+def _contar(contagem: dict[str, Any], sucesso: bool) -> None:
+    contagem["tentativas"] = contagem.get("tentativas", 0.0) * DECAIMENTO + 1
+    contagem["sucessos"] = contagem.get("sucessos", 0.0) * DECAIMENTO + (1 if sucesso else 0)
+
+
+def ultimos_posts(posts: list[dict[str, Any]], categorias: Iterable[str]) -> dict[str, datetime]:
+    """Data do post mais recente de cada categoria (posts em ordem cronológica)."""
+    faltam = set(categorias)
+    ultimos: dict[str, datetime] = {}
+    for post in reversed(posts):
+        if not faltam:
+            break
+        cat = post.get("categoria")
+        if cat not in faltam:
+            continue
+        iso = post_store.timestamp(post)
+        if iso:
+            ultimos[cat] = datetime.strptime(iso, "%Y-%m-%dT%H:%M:%SZ")
+            faltam.discard(cat)
+    return ultimos
+
+
+def _horas(agora: datetime, antes: datetime) -> float:
+    return max(0.0, (agora - antes).total_seconds() / 3600)
+
+
+def ganho(stats: dict[str, Any] | None, ultimo_post: datetime | None, agora: datetime, na_fila: int = 0) -> float:
+    """Ganho esperado de tentar o tema agora (maior = melhor).
+
+    `na_fila`: candidatos já verificados na fila (candidate_queue) do tema.
+    """
+    stats = stats or {}
+    fome = FOME_MAX if ultimo_post is None else _horas(agora, ultimo_post) / HORAS_ALVO
+    estoque = 0.0
+    if stats.get("coletado_em"):
+        horas = _horas(agora, datetime.strptime(stats["coletado_em"], "%Y-%m-%dT%H:%M:%SZ"))
+        # tentativa recente que não rendeu: a fome volta a crescer, mais rápido que depois de um post
+        fome = min(fome, horas / HORAS_RETENTATIVA)
+        estoque = min(stats.get("estoque", 0), ESTOQUE_MAX) / ESTOQUE_MAX * 0.5 ** (horas / MEIA_VIDA_ESTOQUE_H)
+    p = probabilidade(stats)
+    if na_fila:
+        # candidato verificado esperando: publicar é quase certo, e sem baixar capas
+        p = max(p, PROB_COM_FILA)
+        estoque = max(estoque, min(na_fila, ESTOQUE_MAX) / ESTOQUE_MAX)
+    return p * (min(fome, FOME_MAX) + PESO_ESTOQUE * estoque)
+
+
+def escolher(
+    estado: dict[str, Any],
+    temas: list[dict[str, Any]],
+    posts: list[dict[str, Any]],
+    agora: datetime | None = None,
+    na_fila: dict[str, int] | None = None,
+) -> tuple[dict[str, Any], str]:
+    """(tema, motivo) da próxima execução. Empates ficam com a ordem de `temas`.
+
+    `na_fila`: candidatos verificados por tema (candidate_queue.tamanhos).
+    """
+    agora = agora or agora_utc()
+    rodada = estado.get("rodada", 0)
+    stats = estado.get("temas", {})
+
+    # piso de justiça: o tema há mais tempo sem tentativa, se passou do limite
+    # (tema nunca tentado conta como atrasado: sem histórico, a primeira volta é em rodízio)
+    atrasados = [
+        (rodada - stats.get(t["nome"], {}).get("rodada", -PISO_RODADAS), -i, t)
+        for i, t in enumerate(temas)
+    ]
+    espera, _, tema = max(atrasados, key=lambda item: item[:2])
+    if espera >= PISO_RODADAS:
+        if tema["nome"] not in stats:
+            return tema, "primeira tentativa"
+        return tema, f"piso de justiça ({espera} execuções sem tentar)"
+
+    ultimos = ultimos_posts(posts, (t["categoria"] for t in temas))
+    na_fila = na_fila or {}
+    pontos = [
+        (ganho(stats.get(t["nome"]), ultimos.get(t["categoria"]), agora, na_fila.get(t["nome"], 0)), -i, t)
+        for i, t in enumerate(temas)
+    ]
+    valor, _, tema = max(pontos, key=lambda item: item[:2])
+    return tema, f"ganho esperado {valor:.2f}"
+
+
+def ordenar_sites(estado: dict[str, Any], tema: dict[str, Any]) -> list[str]:
+    """Portais do tema, dos que mais rendem aos que menos (empate: ordem original)."""
+    sites = estado.get("temas", {}).get(tema["nome"], {}).get("sites", {})
+    return sorted(tema["sites"], key=lambda url: -probabilidade(sites.get(url)))
+
+
+@dataclass
+class Coleta:
+    """O que aconteceu numa busca: portais tentados (na ordem) e estoque da página que rendeu."""
+
+    tema: str
+    sites: list[str]
+    resultados: list[tuple[str, bool]] = field(default_factory=list)
+    estoque: int = 0
+
+    def site(self, url: str, encontrou: bool, estoque: int = 0) -> None:
+        self.resultados.append((url, encontrou))
+        if encontrou:
+            self.estoque = estoque
+
+
+def registrar(estado: dict[str, Any], coleta: Coleta, publicou: bool, agora: datetime | None = None) -> None:
+    """Conta a execução no tema e nos portais tentados; avança a rodada."""
+    agora = agora or agora_utc()
+    stats = estado.setdefault("temas", {}).setdefault(coleta.tema, {})
+    _contar(stats, publicou)
+    stats["rodada"] = estado.get("rodada", 0)
+    estado["rodada"] = stats["rodada"] + 1
+    stats["estoque"] = coleta.estoque
+    stats["coletado_em"] = agora.strftime("%Y-%m-%dT%H:%M:%SZ")
+    sites = stats.setdefault("sites", {})
+    for url, encontrou in coleta.resultados:
+        _contar(sites.setdefault(url, {}), encontrou)
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Temas do publicador: categoria do site e portais de onde vêm as matérias.
+
+Fica fora do bot.py para que geração de páginas, feeds e editor saibam quais
+categorias existem sem importar o publicador (requests, BeautifulSoup e a
+checagem de GROQ_API_KEY).
+"""
+
+TEMAS = [
+    {"nome": "Esportes", "categoria": "esportes", "sites": [
+        "https://ge.globo.com/", "https://www.espn.com.br/", "https://www.uol.com.br/esporte/",
+        "https://www.espn.com.br/futebol/", "https://www.grandepremio.com.br/",
+        "https://www.lance.com.br/", "https://www.gazetaesportiva.com/",
+    ]},
+    {"nome": "Entretenimento", "categoria": "entretenimento", "sites": [
+        "https://www.omelete.com.br/", "https://www.tecmundo.com.br/cultura",
+        "https://noticiasdocinema.com.br/", "https://www.adorocinema.com/",
+        "https://www.papelpop.com/", "https://rollingstone.com.br/",
+    ]},
+    {"nome": "Tecnologia", "categoria": "tecnologia", "sites": [
+        "https://www.tecmundo.com.br/", "https://olhardigital.com.br/",
+        "https://www.hardware.com.br/", "https://tecnoblog.net/",
+        "https://canaltech.com.br/", "https://www.tudocelular.com/",
+    ]},
+    {"nome": "Videogames", "categoria": "videogames", "sites": [
+        "https://www.gamerant.com/", "https://br.ign.com/",
+        "https://www.thegamer.com.br/", "https://www.tecmundo.com.br/voxel",
+        "https://www.theenemy.com.br/",
+    ]},
+    {"nome": "Política Nacional", "categoria": "politica-nacional", "sites": [
+        "https://g1.globo.com/politica/", "https://noticias.uol.com.br/politica/",
+        "https://www.poder360.com.br/", "https://www.cnnbrasil.com.br/politica/",
+        "https://www.cartacapital.com.br/politica/",
+    ]},
+    {"nome": "Política Internacional", "categoria": "politica-internacional", "sites": [
+        "https://g1.globo.com/mundo/", "https://www.bbc.com/portuguese/internacional",
+        "https://noticias.uol.com.br/internacional/", "https://hojenomundomilitar.com.br/",
+        "https://www.cnnbrasil.com.br/internacional/",
+    ]},
+    {"nome": "Rio de Janeiro", "categoria": "rio-de-janeiro", "sites": [
+        "https://g1.globo.com/rj/rio-de-janeiro/", "https://odia.ig.com.br/",
+        "https://diariodorio.com/", "https://www.band.uol.com.br/band-news-fm/rio",
+        "https://extra.globo.com/noticias/rio/",
+    ]},
+    {"nome": "São Paulo", "categoria": "sao-paulo", "sites": [
+        "https://g1.globo.com/sp/sao-paulo/", "https://www.band.uol.com.br/band-news-fm/sp",
+        "https://noticias.r7.com/sao-paulo/", "https://agora.folha.uol.com.br/sao-paulo/",
+    ]},
+]
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Testes para o atomic_write.py"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, '.')
+import atomic_write
+
+
+def test_escrita_e_lote():
+    """Pula conteúdo igual, não deixa temporários e aplica o lote só no fim do bloco"""
+    print('=== Teste atomic_write ===')
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            assert atomic_write.escrever_texto('sub/a.txt', 'um')
+            mtime = Path('sub/a.txt').stat().st_mtime_ns
+            assert not atomic_write.escrever_texto('sub/a.txt', 'um')
+            assert Path('sub/a.txt').stat().st_mtime_ns == mtime
+            assert 'sub/a.txt' in atomic_write.caminhos_alterados()
+
+            with atomic_write.lote():
+                assert atomic_write.escrever_json('b.json', {'x': 1})
+                assert atomic_write.escrever_texto('sub/a.txt', 'dois')
+                assert not Path('b.json').exists()
+                assert Path('sub/a.txt').read_text() == 'um'
+                assert atomic_write.ler_texto('b.json') == '{"x": 1}'
+            assert Path('b.json').read_text() == '{"x": 1}'
+            assert Path('sub/a.txt').read_text() == 'dois'
+
+            try:
+                with atomic_write.lote():
+                    atomic_write.escrever_texto('c.txt', 'nunca')
+                    raise RuntimeError('falhou no meio')
+            except RuntimeError:
+                pass
+            assert not Path('c.txt').exists()
+
+            assert not [p for p in Path('.').rglob('*.tmp')]
+        finally:
+            os.chdir(cwd)
+    print('  ✅ Escrita atômica, dedupe e lote corretos\n')
+    return True
+
+
+def test_remocoes_e_marcas():
+    """Remoções, movimentos e appends também contam como alteração; marca() separa o que veio depois; diário em arquivo"""
+    print('=== Teste alterações registradas ===')
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        os.environ[atomic_write.DIARIO_ENV] = os.path.join(tmp, 'diario.txt')
+        try:
+            atomic_write.escrever_texto('velho.txt', 'x')
+            marca = atomic_write.marca()
+            assert atomic_write.caminhos_alterados(marca) == []
+
+            assert atomic_write.remover('velho.txt') and not Path('velho.txt').exists()
+            assert not atomic_write.remover('velho.txt')
+            atomic_write.escrever_texto('post.html', 'y')
+            atomic_write.mover('post.html', 'quarentena/post.html')
+            assert atomic_write.caminhos_alterados(marca) == ['post.html', 'quarentena/post.html', 'velho.txt']
+            atomic_write.acrescentar('uso.jsonl', '{"a": 1}\n')
+            atomic_write.acrescentar('uso.jsonl', '{"a": 2}\n')
+            assert Path('uso.jsonl').read_text() == '{"a": 1}\n{"a": 2}\n'
+            assert 'uso.jsonl' in atomic_write.caminhos_alterados(marca)
+
+            diario = Path('diario.txt').read_text().splitlines()
+            assert diario[0] == os.path.abspath('velho.txt') and os.path.abspath('quarentena/post.html') in diario
+            assert os.path.abspath('uso.jsonl') in diario
+        finally:
+            del os.environ[atomic_write.DIARIO_ENV]
+            os.chdir(cwd)
+    print('  ✅ Alterações registradas\n')
+    return True
+
+
+def test_remocoes_em_lote():
+    """Dentro do lote, remoções, movimentos e appends só acontecem no fim do bloco (e somem se o bloco falha)"""
+    print('=== Teste remoções em lote ===')
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            atomic_write.escrever_texto('shard-1.json', 'a')
+            atomic_write.escrever_texto('post.html', 'p')
+            try:
+                with atomic_write.lote():
+                    assert atomic_write.remover('shard-1.json')
+                    atomic_write.mover('post.html', 'quarentena/post.html')
+                    assert Path('shard-1.json').exists() and Path('post.html').exists()
+                    assert not atomic_write.existe('shard-1.json') and atomic_write.ler_texto('shard-1.json') is None
+                    assert atomic_write.ler_texto('quarentena/post.html') == 'p'
+                    raise RuntimeError('falhou no meio')
+            except RuntimeError:
+                pass
+            assert Path('shard-1.json').read_text() == 'a' and Path('post.html').exists()
+            assert not Path('quarentena/post.html').exists()
+
+            # append em lote: pendente até o fim do bloco, visível via ler_texto
+            atomic_write.escrever_texto('uso.jsonl', '1\n')
+            with atomic_write.lote():
+                atomic_write.acrescentar('uso.jsonl', '2\n')
+                assert Path('uso.jsonl').read_text() == '1\n' and atomic_write.ler_texto('uso.jsonl') == '1\n2\n'
+            assert Path('uso.jsonl').read_text() == '1\n2\n'
+
+            marca = atomic_write.marca()
+            with atomic_write.lote():
+                assert atomic_write.remover('shard-1.json')
+                assert not atomic_write.remover('shard-1.json')
+                atomic_write.escrever_texto('shard-2.json', 'b')
+                atomic_write.mover('post.html', 'quarentena/post.html')
+            assert not Path('shard-1.json').exists() and not Path('post.html').exists()
+            assert Path('quarentena/post.html').read_text() == 'p'
+            assert atomic_write.caminhos_alterados(marca) == ['post.html', 'quarentena/post.html', 'shard-1.json', 'shard-2.json']
+        finally:
+            os.chdir(cwd)
+    print('  ✅ Remoções em lote\n')
+    return True
+
+
+if __name__ == '__main__':
+    resultados = [test_escrita_e_lote(), test_remocoes_e_marcas(), test_remocoes_em_lote()]
+    sys.exit(0 if all(resultados) else 1)
@@ -4,7 +4,9 @@
 
 import sys
 import os
+import json
 import re
+import tempfile
 from pathlib import Path
 from urllib.parse import urlparse, urlunparse, parse_qs, urlencode
 
@@ -20,8 +22,10 @@ from bot import (
     normalizar_titulo, 
     classificar_subcategoria,
     eh_titulo_valido,
-    TEMAS
 )
+from site_pages import atualizar_home, gerar_paginas_categorias, paginar
+from temas import TEMAS
+import site_pages
 
 def test_limpar_titulo():
     """Testa a função de limpeza de títulos"""
@@ -163,6 +167,88 @@ def test_temas():
     print('  ✅ Rio de Janeiro e São Paulo adicionados\n')
     return True
 
+def test_build_incremental():
+    """Segunda geração com os mesmos posts não reescreve index/categorias"""
+    print('=== Teste build incremental ===')
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            Path('posts').mkdir()
+            Path('posts/post-0001-teste.html').write_text('<html></html>', encoding='utf-8')
+            posts = [{'titulo': 'Flamengo vence no Maracanã', 'url': 'posts/post-0001-teste.html',
+                      'imagem': 'https://example.com/a.jpg', 'categoria': 'esportes', 'data': '01/01/2026 às 10:00'}]
+            atualizar_home(posts)
+            gerar_paginas_categorias(posts)
+            assert Path('build_manifest.json').exists()
+            mtimes = {f: os.stat(f).st_mtime_ns for f in ['index.html', 'categoria-esportes.html']}
+
+            atualizar_home(posts)
+            gerar_paginas_categorias(posts)
+            for f, mtime in mtimes.items():
+                assert os.stat(f).st_mtime_ns == mtime, f'{f} foi reescrito sem mudança'
+
+            posts[0]['titulo'] = 'Flamengo vence de novo no Maracanã'
+            atualizar_home(posts)
+            assert 'de novo' in Path('index.html').read_text(encoding='utf-8')
+        finally:
+            os.chdir(cwd)
+    print('  ✅ Páginas só são geradas quando as entradas mudam\n')
+    return True
+
+def test_paginacao_estavel():
+    """Páginas de arquivo não mudam quando entram posts novos"""
+    print('=== Teste paginar() ===')
+    tamanho_original = site_pages.POSTS_POR_PAGINA
+    site_pages.POSTS_POR_PAGINA = 3
+    try:
+        capa, arquivados = paginar(list(range(10)))
+        assert capa == [6, 7, 8, 9]          # bloco novo incompleto + anterior
+        assert arquivados == [[0, 1, 2], [3, 4, 5]]
+
+        capa, arquivados2 = paginar(list(range(11)))
+        assert arquivados2 == arquivados      # post novo só mexe na capa
+
+        capa, arquivados3 = paginar(list(range(12)))
+        assert capa == [9, 10, 11]
+        assert arquivados3[:2] == arquivados  # bloco cheio vira arquivo, os antigos ficam iguais
+        assert paginar([]) == ([], [])
+    finally:
+        site_pages.POSTS_POR_PAGINA = tamanho_original
+    print('  ✅ Blocos arquivados estáveis\n')
+    return True
+
+def test_shards_imutaveis():
+    """Shards JSON antigos não mudam; post novo só cria o shard do bloco que fechou"""
+    print('=== Teste gerar_shards() ===')
+    tamanho_original = site_pages.POSTS_POR_PAGINA
+    site_pages.POSTS_POR_PAGINA = 2
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            posts = [{'titulo': f'P{i}', 'url': f'posts/p{i}.html', 'imagem': 'x.jpg', 'categoria': 'esportes',
+                      'subcategoria': None, 'data': '01/03/2026 às 10:00'} for i in range(7)]
+            _, arquivados = paginar(posts)
+            shards, escritos = site_pages.gerar_shards('index', arquivados)
+            assert escritos == 2 and shards[0].startswith('cards/index/2-')
+            shard = json.loads(Path(shards[0]).read_text(encoding='utf-8'))
+            assert shard['pagina'] == 2 and '<a href="posts/p3.html">P3</a>' in shard['cards'][0]
+            mtimes = {s: Path(s).stat().st_mtime_ns for s in shards}
+
+            posts.append(dict(posts[0], titulo='P7', url='posts/p7.html'))
+            _, arquivados = paginar(posts)
+            shards2, escritos = site_pages.gerar_shards('index', arquivados)
+            assert escritos == 1 and shards2[1:] == shards
+            assert all(Path(s).stat().st_mtime_ns == m for s, m in mtimes.items())
+
+            assert 'data-shards' in site_pages.renderizar_carregador(shards2) and site_pages.renderizar_carregador([]) == ''
+        finally:
+            os.chdir(cwd)
+            site_pages.POSTS_POR_PAGINA = tamanho_original
+    print('  ✅ Shards imutáveis\n')
+    return True
+
 def main():
     """Executa todos os testes"""
     print('='*60)
@@ -177,6 +263,9 @@ def main():
     resultados.append(test_classificar_subcategoria())
     resultados.append(test_eh_titulo_valido())
     resultados.append(test_temas())
+    resultados.append(test_build_incremental())
+    resultados.append(test_paginacao_estavel())
+    resultados.append(test_shards_imutaveis())
     
     print('='*60)
     print('RESUMO DOS TESTES')
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Testes para o candidate_queue.py e o uso da fila pelo bot (sem rede)"""
+
+import os
+import sys
+import tempfile
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+# Configurar variável de ambiente antes de importar o bot
+os.environ['GROQ_API_KEY'] = 'test-key-for-validation-only'
+
+sys.path.insert(0, '.')
+import bot
+import candidate_queue
+import http_session
+import post_index
+
+TEXTO = ' '.join(['O governo anunciou nesta semana um novo pacote de medidas para a economia.'] * 12)
+
+
+def _noticia(i):
+    return {'title': f'Notícia número {i} sobre a economia', 'content': TEXTO, 'urlToImage': None, 'url': f'https://portal/{i}'}
+
+
+def test_fila():
+    """Retirada na ordem da capa, vagas por tema e validade (TTL)"""
+    print('=== Teste fila de candidatos ===')
+    agora = datetime(2026, 5, 1, 12, 0)
+    fila = {}
+    candidate_queue.acrescentar(fila, 'Tecnologia', _noticia(1), agora - timedelta(hours=candidate_queue.TTL_HORAS + 1))
+    candidate_queue.acrescentar(fila, 'Tecnologia', _noticia(2), agora - timedelta(hours=1))
+    candidate_queue.acrescentar(fila, 'Esportes', _noticia(3), agora - timedelta(hours=20))
+    assert candidate_queue.vagas(fila, 'Tecnologia') == candidate_queue.MAX_POR_TEMA - 2
+
+    assert candidate_queue.expirar(fila, agora) == 2
+    assert candidate_queue.tamanhos(fila) == {'Tecnologia': 1}
+    assert candidate_queue.retirar(fila, 'Tecnologia') == _noticia(2)
+    assert candidate_queue.retirar(fila, 'Tecnologia') is None and fila == {}
+    print('  ✅ Fila de candidatos\n')
+    return True
+
+
+def test_publicar_da_fila():
+    """Primeira execução abre a capa e abastece a fila; a seguinte publica da fila sem abrir capas"""
+    print('=== Teste bot + fila de candidatos ===')
+    cwd = os.getcwd()
+    originais = (bot.buscar_candidatos, bot.gerar_texto, bot.publicar, bot.classificar_subcategoria)
+    capas = []
+
+    def buscar_falso(tema, coleta=None):
+        capas.append(tema['nome'])
+        for i in range(10):
+            yield _noticia(i)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        bot.buscar_candidatos = buscar_falso
+        bot.gerar_texto = lambda noticia: f"{noticia['title']}\n\n{TEXTO}"
+        bot.publicar = lambda *args: None
+        bot.classificar_subcategoria = lambda titulo, categoria: None
+        try:
+            bot._cache_artigos = None
+            post_index.arquivos_existentes(recarregar=True)
+            tema = bot.TEMAS[2]
+            primeiro = bot.executar(tema=tema)
+            assert primeiro['titulo'] == _noticia(0)['title'] and capas == [tema['nome']]
+            # publicado_em em UTC, como o "agora" do agendador e do editor
+            publicado = datetime.strptime(primeiro['publicado_em'], '%Y-%m-%dT%H:%M:%SZ').replace(tzinfo=timezone.utc)
+            assert abs((datetime.now(timezone.utc) - publicado).total_seconds()) < 120
+            fila = candidate_queue.carregar()
+            assert [c['url'] for c in fila[tema['nome']]] == ['https://portal/1', 'https://portal/2', 'https://portal/3']
+            # publicado e enfileirados ficam marcados no articles_cache (gravados junto com o post/fila)
+            urls, _ = bot.carregar_cache_artigos()
+            assert {bot.normalizar_url(f'https://portal/{i}') for i in range(4)} <= urls
+
+            segundo = bot.executar(tema=tema)
+            assert segundo['titulo'] == _noticia(1)['title'] and capas == [tema['nome']]
+            assert len(candidate_queue.carregar()[tema['nome']]) == 2
+        finally:
+            bot.buscar_candidatos, bot.gerar_texto, bot.publicar, bot.classificar_subcategoria = originais
+            os.chdir(cwd)
+            post_index.arquivos_existentes(recarregar=True)
+            bot._cache_artigos = None
+    print('  ✅ Bot publica da fila\n')
+    return True
+
+
+def test_prazo_da_busca():
+    """A busca para no prazo mesmo sem achar matéria (checa a cada link e a cada portal)"""
+    print('=== Teste prazo da busca ===')
+    relogio = SimpleNamespace(t=0.0)
+    baixados = []
+    capa = '<html><body>' + ''.join(
+        f'<a href="/materia-{i}">Reportagem especial sobre o assunto de número {i} na cidade</a>' for i in range(80)
+    ) + '</body></html>'
+    # matéria com imagem, mas curta demais: rejeitada, e a busca segue
+    artigo = '<html><head><meta property="og:image" content="https://img.portal/foto.jpg"></head><body><p>Texto curto demais para virar matéria.</p></body></html>'
+
+    def baixar(url, **kwargs):
+        baixados.append(url)
+        relogio.t += 5
+        return SimpleNamespace(text=capa if url.endswith('/') else artigo, encoding=None, raise_for_status=lambda: None)
+
+    def dormir(segundos):
+        relogio.t += segundos
+
+    cwd = os.getcwd()
+    originais = (bot.time, http_session.cliente)
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        bot.time = SimpleNamespace(monotonic=lambda: relogio.t, sleep=dormir)
+        http_session.cliente = lambda: SimpleNamespace(get=baixar)
+        try:
+            bot._cache_artigos = None
+            tema = {'nome': 'Teste', 'categoria': 'teste', 'sites': ['https://a.portal/', 'https://b.portal/', 'https://c.portal/']}
+            assert list(bot.buscar_candidatos(tema, prazo=60)) == []
+            assert relogio.t < 60 + 20 and len(baixados) < 12, (relogio.t, baixados)
+            assert baixados[0] == 'https://a.portal/' and 'https://b.portal/' not in baixados
+        finally:
+            bot.time, http_session.cliente = originais
+            os.chdir(cwd)
+            bot._cache_artigos = None
+    print('  ✅ Prazo da busca\n')
+    return True
+
+
+if __name__ == '__main__':
+    resultados = [test_fila(), test_publicar_da_fila(), test_prazo_da_busca()]
+    sys.exit(0 if all(resultados) else 1)
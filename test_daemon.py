@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Testes para o daemon.py (agenda com relógio falso, sem rede nem git)"""
+
+import os
+import sys
+
+# Configurar variável de ambiente antes de importar o bot
+os.environ['GROQ_API_KEY'] = 'test-key-for-validation-only'
+
+sys.path.insert(0, '.')
+import bot
+import daemon
+
+
+class RelogioFalso:
+    def __init__(self):
+        self.agora = 0.0
+
+    def __call__(self):
+        return self.agora
+
+    def dormir(self, segundos):
+        self.agora += segundos
+
+
+def test_agenda():
+    """Cada tarefa no seu intervalo; falha não derruba a agenda"""
+    print('=== Teste agenda do daemon ===')
+    relogio = RelogioFalso()
+    agenda = daemon.Agenda(relogio, relogio.dormir)
+    execucoes = []
+
+    def tarefa(nome, falhar=False):
+        def rodar():
+            execucoes.append((nome, relogio.agora))
+            if falhar:
+                raise RuntimeError('portal fora do ar')
+        return rodar
+
+    agenda.agendar('coleta', 100, tarefa('coleta', falhar=True))
+    agenda.agendar('editor', 30, tarefa('editor'), atraso=15)
+    assert agenda.rodar(max_execucoes=6) == 6
+    assert execucoes == [('coleta', 0), ('editor', 15), ('editor', 45), ('editor', 75), ('coleta', 100), ('editor', 105)]
+
+    # tarefa que atrasa além do próximo horário não roda em rajada
+    agenda = daemon.Agenda(relogio, relogio.dormir)
+    execucoes.clear()
+    inicio = relogio.agora
+
+    def lenta():
+        execucoes.append(('lenta', relogio.agora - inicio))
+        relogio.agora += 250
+
+    agenda.agendar('lenta', 100, lenta)
+    agenda.rodar(max_execucoes=2)
+    assert execucoes == [('lenta', 0), ('lenta', 350)]
+
+    # parar: sai sem executar o que está agendado
+    assert agenda.rodar(parar=lambda: True) == 0
+    print('  ✅ Agenda\n')
+    return True
+
+
+def test_descarga():
+    """Descarga só commita quando alguma tarefa escreveu algo"""
+    print('=== Teste descarga do daemon ===')
+    original = bot.publicar
+    commits = []
+    bot.publicar = lambda *args, **kwargs: commits.append(1)
+    try:
+        d = daemon.Daemon()
+        d.descarregar()
+        assert commits == []
+        d.pendentes = 2
+        d.descarregar()
+        assert commits == [1] and d.pendentes == 0
+
+        # agenda completa: uma coleta por tema, editor e descarga
+        d.agendar_tarefas(coleta_s=800, escalonar=True)
+        nomes = [t.nome for t in sorted(d.agenda._heap)]
+        assert nomes[0] == f"coleta {bot.TEMAS[0]['nome']}" and len(nomes) == len(bot.TEMAS) + 2
+        # coletas a cada 100 s (800 / 8 temas), editor aos 150 s, descarga por último
+        assert nomes.index('editor') == 2 and nomes[-1] == 'descarga'
+    finally:
+        bot.publicar = original
+    print('  ✅ Descarga\n')
+    return True
+
+
+if __name__ == '__main__':
+    resultados = [test_agenda(), test_descarga()]
+    sys.exit(0 if all(resultados) else 1)
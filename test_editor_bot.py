@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Testes para o editor_bot.py"""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+# Configurar variável de ambiente antes de importar o editor
+os.environ['GROQ_API_KEY'] = 'test-key-for-validation-only'
+
+sys.path.insert(0, '.')
+import editor_bot
+import llm_router
+import post_index
+
+TEXTO_OK = ' '.join(['O governo anunciou nesta semana um novo pacote de medidas para a economia, que será votado no Congresso.'] * 10)
+
+
+def _html(titulo, paragrafos):
+    corpo = ''.join(f'<p>{p}</p>' for p in paragrafos)
+    return (f'<html><head><title>{titulo} - Vivimundo</title></head><body>'
+            f'<h1 class="post-titulo">{titulo}</h1><div class="post-conteudo">{corpo}</div></body></html>')
+
+
+def test_pool_triagem():
+    """Triagem no pool sai na ordem certa e bate com editar_um_post"""
+    print('=== Teste triagem paralela do editor ===')
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            Path('posts').mkdir()
+            posts = [
+                {'titulo': 'Pacote econômico', 'url': 'posts/ok.html'},
+                {'titulo': 'GovernoAnuncia pacote', 'url': 'posts/grudado.html'},
+                {'titulo': 'Post curto', 'url': 'posts/curto.html'},
+                {'titulo': 'Sem arquivo', 'url': 'posts/sumiu.html'},
+            ]
+            Path('posts/ok.html').write_text(_html('Pacote econômico', [TEXTO_OK]), encoding='utf-8')
+            Path('posts/grudado.html').write_text(_html('GovernoAnuncia pacote', [TEXTO_OK]), encoding='utf-8')
+            Path('posts/curto.html').write_text(_html('Post curto', ['Texto curto demais.']), encoding='utf-8')
+            post_index.arquivos_existentes(recarregar=True)
+
+            serial = list(editor_bot.mapear_posts(editor_bot.triar_post, posts, workers=1))
+            paralelo = list(editor_bot.mapear_posts(editor_bot.triar_post, posts, workers=2))
+            assert serial == paralelo
+            assert [bool(r.deleted or r.reasons or r.flags) for r in serial] == [False, True, True, True]
+            assert serial[1].reasons == ['titulo_corrigido'] and 'curto' in serial[2].flags and serial[3].deleted
+
+            # post limpo: editar_um_post também não muda nada (por isso o apply pode pular)
+            antes = Path('posts/ok.html').read_bytes()
+            res = editor_bot.editar_um_post(dict(posts[0]))
+            assert not res.changed and not res.deleted and res.flags == serial[0].flags
+            assert Path('posts/ok.html').read_bytes() == antes
+
+            auditoria = list(editor_bot.mapear_posts(editor_bot.auditar_post, posts, workers=2))
+            assert 'titulo_grudado' in auditoria[1].flags and auditoria[3].deleted
+        finally:
+            os.chdir(cwd)
+            post_index.arquivos_existentes(recarregar=True)
+    print('  ✅ Triagem paralela\n')
+    return True
+
+
+def test_sessao_edicao():
+    """Um parse por post; grava só se houve alteração"""
+    print('=== Teste SessaoEdicao ===')
+    with tempfile.TemporaryDirectory() as tmp:
+        caminho = Path(tmp) / 'post.html'
+        caminho.write_text(_html('Titulo velho', ['Primeiro.', 'Segundo.']), encoding='utf-8')
+
+        sessao = editor_bot.SessaoEdicao.abrir(caminho)
+        assert sessao.titulo == 'Titulo velho' and sessao.texto == 'Primeiro.\n\nSegundo.'
+        assert sessao.salvar() is False  # nada mudou: nem serializa
+
+        sessao.definir_titulo('Título novo')
+        # fragmento sem espaço entre as tags: nenhum parágrafo pode se perder
+        sessao.definir_conteudo('<p>Um</p><p>Dois</p><p>Três</p>')
+        assert sessao.salvar() is True
+        html = caminho.read_text(encoding='utf-8')
+        assert '<title>Título novo - Vivimundo</title>' in html and '<h1 class="post-titulo">Título novo</h1>' in html
+        assert '<div class="post-conteudo"><p>Um</p><p>Dois</p><p>Três</p></div>' in html
+    print('  ✅ SessaoEdicao\n')
+    return True
+
+
+def test_reescritas_concorrentes():
+    """Reescritas em paralelo com limite de chamadas simultâneas; resultado na ordem dos planos"""
+    print('=== Teste reescritas concorrentes ===')
+    cwd = os.getcwd()
+    original = editor_bot.chamar_groq_reescrita
+    em_andamento, pico = [0], [0]
+    trava = threading.Lock()
+
+    def groq_falso(titulo, texto, prazo=None):
+        with trava:
+            em_andamento[0] += 1
+            pico[0] = max(pico[0], em_andamento[0])
+        # os primeiros demoram mais: terminam fora de ordem
+        time.sleep(0.2 if titulo.endswith('0') else 0.05)
+        with trava:
+            em_andamento[0] -= 1
+        return f'{titulo}. ' + TEXTO_OK
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        editor_bot.chamar_groq_reescrita = groq_falso
+        try:
+            Path('posts').mkdir()
+            posts = [{'titulo': f'Matéria {i}', 'url': f'posts/p{i}.html'} for i in range(4)]
+            for p in posts:
+                Path(p['url']).write_text(_html(p['titulo'], ['Texto curto demais.']), encoding='utf-8')
+            post_index.arquivos_existentes(recarregar=True)
+
+            planos = [editor_bot.preparar_edicao(p) for p in posts]
+            assert all(p.precisa_groq for p in planos)
+            reescritas = editor_bot.reescrever_em_paralelo(planos, concorrencia=2)
+            assert [r.texto.split('.')[0] for r in reescritas] == [p['titulo'] for p in posts]
+            assert pico[0] == 2
+
+            res = editor_bot.concluir_edicao(planos[1], reescritas[1])
+            assert res.changed and res.reasons == ['reescrito_groq'] and res.groq_ms is not None
+            assert 'governo anunciou' in Path('posts/p1.html').read_text(encoding='utf-8')
+
+            # prazo esgotado: nenhuma chamada nova começa
+            adiadas = editor_bot.reescrever_em_paralelo(planos, concorrencia=2, prazo=time.monotonic() - 1)
+            assert all(r.adiada and r.texto is None for r in adiadas)
+        finally:
+            editor_bot.chamar_groq_reescrita = original
+            os.chdir(cwd)
+            post_index.arquivos_existentes(recarregar=True)
+    print('  ✅ Reescritas concorrentes\n')
+    return True
+
+
+def test_prazo_das_tentativas():
+    """Cada tentativa de reescrita respeita o prazo: timeout limitado e sem retry depois dele"""
+    print('=== Teste prazo das tentativas ===')
+    originais = (llm_router.chamar, llm_router.limitador)
+    timeouts = []
+
+    def chamar_429(tarefa, prompt, timeout, **kwargs):
+        timeouts.append(timeout)
+        # 429 com Retry-After de 60 s: a próxima tentativa já passaria do prazo
+        llm_router.limitador.pausar(60)
+        raise llm_router.LimiteExcedido(60)
+
+    llm_router.chamar = chamar_429
+    llm_router.limitador = llm_router.LimitadorTaxa()
+    try:
+        try:
+            editor_bot.chamar_groq_reescrita('Título', TEXTO_OK, prazo=time.monotonic() + 30)
+            assert False, 'deveria propagar o 429'
+        except llm_router.LimiteExcedido:
+            pass
+        assert len(timeouts) == 1 and timeouts[0] <= 30
+
+        # sem tempo nem para a primeira tentativa: reescrita adiada, nenhuma chamada
+        plano = editor_bot.PlanoEdicao({'url': 'posts/x.html'}, titulo='Título', texto=TEXTO_OK)
+        assert editor_bot.reescrever(plano, prazo=time.monotonic() + 5).adiada
+        assert len(timeouts) == 1
+    finally:
+        llm_router.chamar, llm_router.limitador = originais
+    print('  ✅ Prazo das tentativas\n')
+    return True
+
+
+def test_ondas_da_fila():
+    """Ondas respeitam as vagas reservadas e retomam de onde pararam"""
+    print('=== Teste montar_onda ===')
+    fila = [{'url': u} for u in ('rem1', 'ed1', 'ed2', 'rem2', 'ed3')]
+    ledger = {p['url']: {'flags': ['arquivo_ausente'] if p['url'].startswith('rem') else ['curto']} for p in fila}
+    onda, cursor = editor_bot.montar_onda(fila, 0, ledger, 0, 0, max_edits=2, max_deletes=1)
+    assert [p['url'] for p in onda] == ['rem1', 'ed1', 'ed2'] and cursor == 3
+    # rem1 removido, ed1 sem mudança: rem2 já não cabe, ed3 entra
+    onda, cursor = editor_bot.montar_onda(fila, cursor, ledger, 1, 1, max_edits=2, max_deletes=1)
+    assert [p['url'] for p in onda] == ['ed3'] and cursor == 5
+    assert editor_bot.montar_onda(fila, 0, ledger, 2, 1, max_edits=2, max_deletes=1) == ([], 5)
+    print('  ✅ Ondas da fila\n')
+    return True
+
+
+if __name__ == '__main__':
+    resultados = [test_pool_triagem(), test_sessao_edicao(), test_reescritas_concorrentes(), test_prazo_das_tentativas(),
+                  test_ondas_da_fila()]
+    sys.exit(0 if all(resultados) else 1)
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Testes para o editor_ledger.py"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, '.')
+import editor_ledger
+import post_index
+
+
+def test_selecao_incremental():
+    """Só posts novos/alterados + amostra rotativa são selecionados"""
+    print('=== Teste editor_ledger ===')
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            Path('posts').mkdir()
+            posts = []
+            for n in range(6):
+                url = f'posts/p{n}.html'
+                Path(url).write_text(f'<h1>Post {n}</h1>', encoding='utf-8')
+                posts.append({'titulo': f'Post {n}', 'url': url})
+            posts.append({'titulo': 'Sem arquivo', 'url': 'posts/sumiu.html'})
+            post_index.arquivos_existentes(recarregar=True)
+
+            # primeira execução: tudo é novo (mais novo primeiro)
+            ledger = editor_ledger.carregar()
+            candidatos, digitais = editor_ledger.selecionar(posts, ledger, amostra=2)
+            assert candidatos == [6, 5, 4, 3, 2, 1, 0]
+            assert digitais['posts/sumiu.html'] is None
+            for i in candidatos[1:]:
+                editor_ledger.registrar(ledger, posts[i], ['curto'] if i == 3 else [], digitais[posts[i]['url']])
+            ledger['posts/p0.html']['verificado_em'] = '2000-01-01T00:00:00Z'
+            ledger['posts/p1.html']['verificado_em'] = '2000-01-02T00:00:00Z'
+            editor_ledger.salvar(ledger)
+
+            # segunda: arquivo ausente, o post alterado e os 2 verificados há mais tempo
+            Path('posts/p4.html').write_text('<h1>Post 4 editado</h1>', encoding='utf-8')
+            posts[5]['titulo'] = 'Post 5 corrigido'
+            ledger = editor_ledger.carregar()
+            candidatos, _ = editor_ledger.selecionar(posts, ledger, amostra=2)
+            assert candidatos == [6, 5, 4, 1, 0]
+            assert editor_ledger.resumo_flags(ledger) == {'curto': 1}
+
+            # post removido sai do ledger; regras novas reverificam tudo
+            editor_ledger.selecionar(posts[:3], ledger, amostra=0)
+            assert sorted(ledger) == ['posts/p0.html', 'posts/p1.html', 'posts/p2.html']
+            ledger['posts/p2.html']['regras'] = editor_ledger.VERSAO_REGRAS - 1
+            assert editor_ledger.selecionar(posts[:3], ledger, amostra=0)[0] == [2]
+        finally:
+            os.chdir(cwd)
+            post_index.arquivos_existentes(recarregar=True)
+    print('  ✅ Seleção incremental\n')
+    return True
+
+
+def test_fila_prioridade():
+    """Fila ordenada por severidade x recência / custo; sai quando limpa ou após MAX_TENTATIVAS"""
+    print('=== Teste fila de correções ===')
+    posts = [
+        {'url': 'posts/antigo-ingles.html', 'publicado_em': '2025-01-01T00:00:00Z'},
+        {'url': 'posts/antigo-grudado.html', 'publicado_em': '2025-01-01T00:00:00Z'},
+        {'url': 'posts/novo-fonte.html', 'publicado_em': editor_ledger.agora_iso()},
+        {'url': 'posts/sumiu.html', 'publicado_em': '2025-01-01T00:00:00Z'},
+        {'url': 'posts/limpo.html', 'publicado_em': editor_ledger.agora_iso()},
+    ]
+    ledger = {}
+    for post, flags, acoes in zip(posts, [['nao_ptbr'], [], ['menciona_fonte'], ['arquivo_ausente'], []], [[], ['titulo_corrigido'], [], [], []]):
+        editor_ledger.registrar(ledger, post, flags, digital='x', acoes=acoes)
+    groq = ('nao_ptbr', 'menciona_fonte')
+
+    fila = [p['url'] for p in editor_ledger.fila(ledger, posts, groq)]
+    # arquivo ausente e título grudado não gastam Groq; a fonte citada num post novo passa na frente do inglês antigo
+    assert fila == ['posts/sumiu.html', 'posts/antigo-grudado.html', 'posts/novo-fonte.html', 'posts/antigo-ingles.html']
+
+    # verificado limpo: sai; correção que não resolve: desce e sai após MAX_TENTATIVAS
+    editor_ledger.registrar(ledger, posts[1], [], digital='y')
+    editor_ledger.registrar(ledger, posts[2], ['menciona_fonte'], digital='z', tentativas=editor_ledger.MAX_TENTATIVAS)
+    assert [p['url'] for p in editor_ledger.fila(ledger, posts, groq)] == ['posts/sumiu.html', 'posts/antigo-ingles.html']
+    # mesma impressão digital: tentativas preservadas na reverificação da amostra
+    editor_ledger.registrar(ledger, posts[2], ['menciona_fonte'], digital='z')
+    assert ledger['posts/novo-fonte.html']['tentativas'] == editor_ledger.MAX_TENTATIVAS
+    print('  ✅ Fila de correções\n')
+    return True
+
+
+if __name__ == '__main__':
+    sys.exit(0 if test_selecao_incremental() and test_fila_prioridade() else 1)
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Testes para o editor_report.py"""
+
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, '.')
+import editor_report
+
+
+def _execucao(flags_em_aberto, eventos):
+    execucao = editor_report.Execucao('apply', 25, 10, 20, 2)
+    for acao, url, extra in eventos:
+        execucao.post(acao, {'url': url, 'titulo': f'Título {url}'}, **extra)
+    return execucao.finalizar(posts_total=100, verificados=len(eventos), edits=1, deletes=0, fila=5,
+                              flags_em_aberto=flags_em_aberto,
+                              reconciliacao={'orfaos': 0, 'pendentes': 0, 'exemplos_orfaos': []})
+
+
+def test_historico_resumo_markdown():
+    """JSONL por execução (append; aparado só acima do limite), deltas desde a anterior e markdown"""
+    print('=== Teste editor_report ===')
+    cwd = os.getcwd()
+    detalhadas, limite = editor_report.EXECUCOES_DETALHADAS, editor_report.RUNS_MAX_BYTES
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        editor_report.EXECUCOES_DETALHADAS = 1
+        try:
+            editor_report.salvar(_execucao({'curto': 3, 'menciona_fonte': 2}, [
+                ('edit', 'posts/a.html', {'acoes': ['reescrito_groq'], 'ms': 900.0, 'groq_ms': 850.0}),
+            ]))
+            primeira = Path('editor_runs.jsonl').read_text(encoding='utf-8')
+            assert 'posts/a.html' in primeira
+            # abaixo do limite, a execução seguinte só acrescenta a linha
+            editor_report.salvar(_execucao({'curto': 3, 'menciona_fonte': 2}, []))
+            assert Path('editor_runs.jsonl').read_text(encoding='utf-8').startswith(primeira)
+
+            # acima do limite: histórico aparado (antigas sem posts, mais antigas descartadas)
+            editor_report.RUNS_MAX_BYTES = len(primeira.encode('utf-8')) * 2 + 10
+            resumo = editor_report.salvar(_execucao({'curto': 1, 'markdown': 1, 'menciona_fonte': 2}, [
+                ('edit', 'posts/b.html', {'acoes': ['titulo_corrigido'], 'ms': 12.0}),
+                ('quarentena', 'posts/c.html', {'acoes': ['quarentena_sem_groq'], 'destino': 'posts/_quarantine/c.html'}),
+            ]))
+
+            linhas = [json.loads(l) for l in Path('editor_runs.jsonl').read_text(encoding='utf-8').splitlines()]
+            assert len(linhas) == 1 and [p['acao'] for p in linhas[0]['posts']] == ['edit', 'quarentena']
+            assert len(Path('editor_runs.jsonl').read_bytes()) <= editor_report.RUNS_MAX_BYTES
+            # com folga, o aparo só tira os posts das execuções antigas (a última guarda os posts)
+            editor_report.RUNS_MAX_BYTES = limite
+            aparado = [json.loads(l) for l in editor_report.aparar([json.loads(primeira)] + linhas).splitlines()]
+            assert 'posts' not in aparado[0] and aparado[0]['groq']['chamadas'] == 1 and 'posts' in aparado[1]
+
+            assert resumo['desde_anterior']['flags_em_aberto'] == {'curto': -2, 'markdown': 1}
+            assert resumo['janela_24h']['execucoes'] == 3 and resumo['janela_24h']['groq_chamadas'] == 1
+            assert json.loads(Path('editor_resumo.json').read_text(encoding='utf-8')) == resumo
+
+            md = Path('EDITOR_REPORT.md').read_text(encoding='utf-8')
+            assert "- ✏️ EDIT: **Título posts/b.html** (posts/b.html) | ações=['titulo_corrigido']" in md
+            assert '-> `posts/_quarantine/c.html`' in md
+            assert '- Flags em aberto: curto -2, markdown +1' in md
+        finally:
+            editor_report.EXECUCOES_DETALHADAS, editor_report.RUNS_MAX_BYTES = detalhadas, limite
+            os.chdir(cwd)
+    print('  ✅ Histórico, resumo e markdown\n')
+    return True
+
+
+if __name__ == '__main__':
+    sys.exit(0 if test_historico_resumo_markdown() else 1)
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Testes para o feeds.py"""
+
+import os
+import sys
+import tempfile
+import xml.dom.minidom
+from pathlib import Path
+
+sys.path.insert(0, '.')
+import feeds
+import post_index
+import post_sources
+
+
+def _post(n, data, categoria='esportes'):
+    return {'titulo': f'Post "{n}" & cia', 'url': f'posts/post-{n:04d}-x"{n}.html', 'imagem': '',
+            'categoria': categoria, 'subcategoria': None, 'data': data}
+
+
+def test_data_iso():
+    """Datas do posts.json viram ISO 8601"""
+    print('=== Teste data_iso ===')
+    assert feeds.data_iso('12/04/2026 às 14:55') == '2026-04-12T14:55:00Z'
+    assert feeds.data_iso('03/02/2026') == '2026-02-03T00:00:00Z'
+    assert feeds.data_iso('ontem') is None
+    print('  ✅ Datas convertidas\n')
+    return True
+
+
+def test_feeds_e_sitemaps_incrementais():
+    """XML válido; post novo só mexe no shard do mês dele, nos feeds e no índice"""
+    print('=== Teste feeds/sitemaps ===')
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            Path('posts').mkdir()
+            posts = [_post(1, '28/02/2026 às 10:00'), _post(2, '01/03/2026 às 09:00', 'tecnologia')]
+            for p in posts:
+                Path(p['url']).write_text('<html></html>', encoding='utf-8')
+            post_index.arquivos_existentes(recarregar=True)
+
+            assert feeds.atualizar_feeds(posts, ['esportes', 'tecnologia']) > 0
+            for f in ['sitemap.xml', 'feeds/atom.xml', 'feeds/categoria-esportes.xml', 'sitemaps/posts-2026-02.xml',
+                      'sitemaps/posts-2026-03.xml', 'sitemaps/paginas.xml']:
+                xml.dom.minidom.parse(f)
+            assert '%22' in Path('sitemaps/posts-2026-02.xml').read_text(encoding='utf-8')
+            assert feeds.atualizar_feeds(posts, ['esportes', 'tecnologia']) == 0
+
+            fevereiro = Path('sitemaps/posts-2026-02.xml').stat().st_mtime_ns
+            novo = _post(3, '02/03/2026 às 08:00', 'tecnologia')
+            Path(novo['url']).write_text('<html></html>', encoding='utf-8')
+            post_index.registrar_arquivo(novo['url'])
+            posts.append(novo)
+            # shard de março, atom.xml, categoria-tecnologia, paginas.xml e sitemap.xml
+            assert feeds.atualizar_feeds(posts, ['esportes', 'tecnologia']) == 5
+            assert Path('sitemaps/posts-2026-02.xml').stat().st_mtime_ns == fevereiro
+            assert 'post-0003' in Path('feeds/atom.xml').read_text(encoding='utf-8').split('<entry>')[1]
+        finally:
+            os.chdir(cwd)
+    print('  ✅ Feeds e sitemaps incrementais\n')
+    return True
+
+
+def test_feed_acompanha_data_e_resumo():
+    """publicado_em e o resumo (post_sources) entram na chave do feed"""
+    print('=== Teste chave do feed ===')
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            Path('posts').mkdir()
+            post = _post(1, '28/02/2026 às 10:00')
+            Path(post['url']).write_text('<html></html>', encoding='utf-8')
+            post_index.arquivos_existentes(recarregar=True)
+            feeds.atualizar_feeds([post], ['esportes'])
+            assert feeds.atualizar_feeds([post], ['esportes']) == 0
+
+            post['publicado_em'] = '2026-02-28T13:00:00Z'
+            assert feeds.atualizar_feeds([post], ['esportes']) > 0
+            assert '<updated>2026-02-28T13:00:00Z</updated>' in Path('feeds/atom.xml').read_text(encoding='utf-8')
+
+            post_sources.salvar_fonte(post_sources.montar_fonte(post['url'], post['titulo'], ['<p>Resumo reescrito</p>'],
+                                                                '', 'esportes', post['data']))
+            # atom.xml e categoria-esportes.xml
+            assert feeds.atualizar_feeds([post], ['esportes']) == 2
+            assert '<summary>Resumo reescrito</summary>' in Path('feeds/categoria-esportes.xml').read_text(encoding='utf-8')
+        finally:
+            os.chdir(cwd)
+    print('  ✅ Feed regerado quando data ou resumo mudam\n')
+    return True
+
+
+if __name__ == '__main__':
+    ok = test_data_iso() and test_feeds_e_sitemaps_incrementais() and test_feed_acompanha_data_e_resumo()
+    sys.exit(0 if ok else 1)
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Testes para o git_publish.py (repositório git temporário)"""
+
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, '.')
+import atomic_write
+import git_publish
+
+
+def _git(*args):
+    return subprocess.run(['git', *args], capture_output=True, text=True, check=True).stdout
+
+
+def test_commit_escopado():
+    """Commita só o que foi escrito/apagado pelo atomic_write (e pelo diário), ignorando o resto"""
+    print('=== Teste git_publish ===')
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            _git('init', '-q')
+            _git('config', 'user.name', 'Teste')
+            _git('config', 'user.email', 'teste@vivimundo.com')
+            Path('.gitignore').write_text('dist/\n')
+            Path('posts').mkdir()
+            Path('posts/antigo.html').write_text('antigo')
+            _git('add', '.')
+            _git('commit', '-q', '-m', 'inicial')
+
+            Path('solto.txt').write_text('ninguém pediu para publicar')
+            git_publish._publicado_ate = atomic_write.marca()
+            atomic_write.escrever_texto('posts/novo.html', 'novo')
+            atomic_write.escrever_texto('dist/index.html', 'minificado')
+            # slugs com acento: o git citaria o caminho sem -z e o ignorado vazaria para o commit
+            atomic_write.escrever_texto('posts/post-ação.html', 'acentuado')
+            atomic_write.escrever_texto('dist/post-ação.html', 'minificado')
+            atomic_write.escrever_texto('dist/post-ação.html.gz', 'comprimido')
+            atomic_write.remover('posts/antigo.html')
+            assert git_publish.publicar('Nova matéria')
+
+            assert _git('log', '-1', '--format=%s').strip() == 'Nova matéria'
+            alterados = _git('-c', 'core.quotePath=false', 'show', '--name-status', '--format=', 'HEAD').split('\n')
+            assert sorted(filter(None, alterados)) == ['A\tposts/novo.html', 'A\tposts/post-ação.html',
+                                                       'D\tposts/antigo.html']
+            assert '?? solto.txt' in _git('status', '--porcelain')
+
+            # nada novo desde o último commit
+            assert not git_publish.publicar('Vazio')
+
+            # outro processo: caminhos vindos do diário
+            diario = Path(tmp) / 'diario.txt'
+            Path('posts/outro.html').write_text('outro')
+            diario.write_text(os.path.abspath('posts/outro.html') + '\n')
+            os.environ[atomic_write.DIARIO_ENV] = str(diario)
+            try:
+                assert git_publish.main(['--mensagem', 'Do diário']) == 0
+            finally:
+                del os.environ[atomic_write.DIARIO_ENV]
+            assert _git('show', '--name-only', '--format=', 'HEAD').split() == ['posts/outro.html']
+            assert not diario.exists()
+        finally:
+            os.chdir(cwd)
+    print('  ✅ Commit só dos caminhos alterados\n')
+    return True
+
+
+if __name__ == '__main__':
+    sys.exit(0 if test_commit_escopado() else 1)
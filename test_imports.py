@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Testes de import: pontos de entrada sem efeitos colaterais, módulos leves sem dependências pesadas"""
+
+import os
+import subprocess
+import sys
+
+sys.path.insert(0, '.')
+
+
+def _rodar(codigo):
+    env = {k: v for k, v in os.environ.items() if k != 'GROQ_API_KEY'}
+    return subprocess.run([sys.executable, '-c', codigo], capture_output=True, text=True, env=env)
+
+
+def test_import_sem_efeitos():
+    """bot, editor_bot e daemon importam sem GROQ_API_KEY, sem sair e sem imprimir nada"""
+    print('=== Teste import sem efeitos colaterais ===')
+    proc = _rodar('import bot, editor_bot, daemon; print(len(bot.TEMAS))')
+    assert proc.returncode == 0, proc.stderr
+    assert proc.stdout.strip() == '8'
+    print('  ✅ Import não depende de GROQ_API_KEY\n')
+    return True
+
+
+def test_modulos_leves():
+    """Listagens, texto e temas não carregam requests/bs4/llm_router no import"""
+    print('=== Teste módulos leves ===')
+    proc = _rodar('import sys, site_pages, post_text, temas; '
+                  'print(sorted(m for m in ("requests", "bs4", "llm_router", "bot") if m in sys.modules))')
+    assert proc.returncode == 0, proc.stderr
+    assert proc.stdout.strip() == '[]', proc.stdout
+    print('  ✅ Nenhuma dependência pesada no import\n')
+    return True
+
+
+if __name__ == '__main__':
+    resultados = [test_import_sem_efeitos(), test_modulos_leves()]
+    sys.exit(0 if all(resultados) else 1)
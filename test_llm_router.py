@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Testes para o llm_router.py (sem rede: requests.post é substituído)"""
+
+import sys
+import json
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, '.')
+import llm_router
+
+
+class RespostaFalsa:
+    def __init__(self, conteudo, uso, status_code=200, headers=None):
+        self._data = {'choices': [{'message': {'content': conteudo}}], 'usage': uso}
+        self.status_code = status_code
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self._data
+
+
+def _com_respostas(respostas, func):
+    """Executa func com requests.post devolvendo `respostas` por modelo e métricas em arquivo temporário"""
+    chamadas = []
+
+    def post_falso(url, headers=None, json=None, timeout=None):
+        chamadas.append(json['model'])
+        resposta = respostas[json['model']]
+        if isinstance(resposta, RespostaFalsa):
+            return resposta
+        return RespostaFalsa(resposta, {'prompt_tokens': 100, 'completion_tokens': 10})
+
+    post_original = llm_router.requests.post
+    metrics_original = llm_router.METRICS_JSON
+    usage_original = llm_router.USAGE_JSONL
+    with tempfile.TemporaryDirectory() as tmp:
+        llm_router.requests.post = post_falso
+        llm_router.METRICS_JSON = Path(tmp) / 'llm_metrics.json'
+        llm_router.USAGE_JSONL = Path(tmp) / 'llm_usage.jsonl'
+        try:
+            resultado = func()
+            metricas = json.loads(llm_router.METRICS_JSON.read_text(encoding='utf-8'))
+            uso = llm_router.USAGE_JSONL.read_text(encoding='utf-8') if llm_router.USAGE_JSONL.exists() else ''
+            metricas['_uso'] = [json.loads(l) for l in uso.splitlines()]
+        finally:
+            llm_router.requests.post = post_original
+            llm_router.METRICS_JSON = metrics_original
+            llm_router.USAGE_JSONL = usage_original
+    return resultado, chamadas, metricas
+
+
+def test_rota_pequena_sem_fallback():
+    """Classificação confiável fica no modelo pequeno"""
+    print('=== Teste rota classificar ===')
+    respostas = {llm_router.MODELO_PEQUENO: 'futebol', llm_router.MODELO_GRANDE: 'basquete'}
+    resultado, chamadas, metricas = _com_respostas(
+        respostas, lambda: llm_router.chamar('classificar', 'x', validar=lambda r: r == 'futebol'))
+    assert resultado == 'futebol'
+    assert chamadas == [llm_router.MODELO_PEQUENO]
+    rota = metricas['rotas']['classificar'][llm_router.MODELO_PEQUENO]
+    assert rota['chamadas'] == 1 and rota['tokens_prompt'] == 100
+    assert len(metricas['_uso']) == 1 and metricas['_uso'][0]['tokens_resposta'] == 10
+    print('  ✅ Modelo pequeno respondeu e métricas foram registradas\n')
+    return True
+
+
+def test_fallback_baixa_confianca():
+    """Resposta inválida do modelo pequeno é refeita no modelo grande"""
+    print('=== Teste fallback para modelo grande ===')
+    respostas = {llm_router.MODELO_PEQUENO: 'não sei', llm_router.MODELO_GRANDE: 'futebol'}
+    resultado, chamadas, metricas = _com_respostas(
+        respostas, lambda: llm_router.chamar('classificar', 'x', validar=lambda r: r == 'futebol'))
+    assert resultado == 'futebol'
+    assert chamadas == [llm_router.MODELO_PEQUENO, llm_router.MODELO_GRANDE]
+    assert metricas['rotas']['classificar'][llm_router.MODELO_GRANDE]['fallbacks'] == 1
+    print('  ✅ Fallback acionado e contabilizado\n')
+    return True
+
+
+def test_limite_taxa():
+    """429 pausa todas as chamadas pelo Retry-After; o limitador espaça as requisições"""
+    print('=== Teste limite de taxa ===')
+    limitador_original = llm_router.limitador
+    llm_router.limitador = llm_router.LimitadorTaxa()
+    try:
+        respostas = {llm_router.MODELO_GRANDE: RespostaFalsa('', None, status_code=429, headers={'retry-after': '0.2'})}
+
+        def chamar_429():
+            try:
+                llm_router.chamar('reescrita', 'x')
+            except llm_router.LimiteExcedido as e:
+                return e.espera
+            return None
+
+        espera, _, metricas = _com_respostas(respostas, chamar_429)
+        assert espera == 0.2
+        assert metricas['rotas']['reescrita'][llm_router.MODELO_GRANDE]['erros'] == 1
+        assert llm_router.limitador.aguardar() > 0.1   # próxima requisição espera a pausa
+        assert llm_router.espera_retry_after(None) == llm_router.ESPERA_429_PADRAO_S
+        assert llm_router.espera_retry_after('9999') == llm_router.ESPERA_429_MAX_S
+    finally:
+        llm_router.limitador = limitador_original
+
+    limitador = llm_router.LimitadorTaxa(por_minuto=600)   # 1 requisição a cada 0,1 s
+    esperas = [limitador.aguardar() for _ in range(3)]
+    assert esperas[0] == 0 and all(e > 0.05 for e in esperas[1:])
+    print('  ✅ Retry-After respeitado e requisições espaçadas\n')
+    return True
+
+
+def main():
+    resultados = [test_rota_pequena_sem_fallback(), test_fallback_baixa_confianca(), test_limite_taxa()]
+    return 0 if all(resultados) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Testes para o post_index.py"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, '.')
+import post_index
+
+
+def test_indice_e_reconciliacao():
+    """Um scan só, atualizado por registrar/remover, e reconciliação com posts.json"""
+    print('=== Teste post_index ===')
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            Path('posts/_quarantine').mkdir(parents=True)
+            Path('posts/post-0001-a.html').write_text('a', encoding='utf-8')
+            Path('posts/post-0002-orfao.html').write_text('b', encoding='utf-8')
+            posts = [{'url': 'posts/post-0001-a.html'}, {'url': 'posts/post-0003-sumiu.html'}]
+
+            assert post_index.existe('posts/post-0001-a.html')
+            assert not post_index.existe('posts/_quarantine')  # diretórios não contam
+            rel = post_index.reconciliar(posts)
+            assert rel['orfaos'] == ['posts/post-0002-orfao.html']
+            assert rel['pendentes'] == ['posts/post-0003-sumiu.html']
+
+            post_index.registrar_arquivo('posts/post-0003-sumiu.html')
+            post_index.remover_arquivo('posts/post-0001-a.html')
+            assert post_index.existe('posts/post-0003-sumiu.html')
+            assert not post_index.existe('posts/post-0001-a.html')
+        finally:
+            os.chdir(cwd)
+    print('  ✅ Índice e reconciliação corretos\n')
+    return True
+
+
+if __name__ == '__main__':
+    sys.exit(0 if test_indice_e_reconciliacao() else 1)
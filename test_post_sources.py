@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Testes para o post_sources.py"""
+
+import sys
+
+sys.path.insert(0, '.')
+from post_sources import montar_fonte, renderizar_post, extrair_fonte_html
+
+
+def test_ida_e_volta():
+    """HTML renderizado -> fonte extraída -> mesmo HTML"""
+    print('=== Teste fonte estruturada (ida e volta) ===')
+    fonte = montar_fonte('posts/post-0001-teste.html', 'Flamengo vence no Maracanã',
+                         ['Primeiro parágrafo com <strong>destaque</strong>.', 'Segundo parágrafo.'],
+                         'https://example.com/a.jpg', 'esportes', '01/01/2026 às 10:00', 'futebol')
+    html = renderizar_post(fonte)
+    assert '<span class="post-subcategoria">Futebol</span>' in html
+
+    entrada = {'url': fonte['url'], 'categoria': 'esportes', 'subcategoria': 'futebol'}
+    extraida = extrair_fonte_html(html, entrada)
+    assert extraida['titulo'] == fonte['titulo']
+    assert extraida['paragrafos'] == fonte['paragrafos']
+    assert extraida['data'] == '01/01/2026 às 10:00'
+    assert renderizar_post(extraida) == html
+    print('  ✅ Fonte extraída gera o mesmo HTML\n')
+    return True
+
+
+if __name__ == '__main__':
+    sys.exit(0 if test_ida_e_volta() else 1)
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Testes para o post_store.py"""
+
+import json
+import os
+import sys
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, '.')
+import post_store
+
+
+def _post(n, data, categoria='esportes', subcategoria=None):
+    return {'titulo': f'Post {n}', 'url': f'posts/post-{n:04d}.html', 'imagem': '', 'categoria': categoria,
+            'subcategoria': subcategoria, 'data': data}
+
+
+def test_store_crud_e_consultas():
+    """Migra do posts.json, grava só o mês alterado, consulta por índice e exporta igual"""
+    print('=== Teste post_store ===')
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            posts = [_post(1, '28/02/2026 às 10:00'), _post(2, '01/03/2026 às 09:00', 'tecnologia', 'ia'),
+                     _post(3, '15/03/2026 às 12:00', 'esportes', 'futebol')]
+            original = json.dumps(posts, ensure_ascii=False, indent=2)
+            Path('posts.json').write_text(original, encoding='utf-8')
+
+            store = post_store.abrir()
+            assert not Path('post_store').exists()  # migração só em memória até salvar()
+            assert store.salvar() == ['2026-02', '2026-03']
+            assert store.exportar_json() is True  # backfill do publicado_em
+            exportados = json.loads(Path('posts.json').read_text(encoding='utf-8'))
+            assert [p['publicado_em'] for p in exportados] == ['2026-02-28T10:00:00Z', '2026-03-01T09:00:00Z', '2026-03-15T12:00:00Z']
+            assert [{k: v for k, v in p.items() if k != 'publicado_em'} for p in exportados] == posts
+
+            store = post_store.abrir()
+            assert [p['url'] for p in store.todos()] == [p['url'] for p in posts]
+            assert [p['titulo'] for p in store.consultar(categoria='esportes')] == ['Post 1', 'Post 3']
+            assert [p['titulo'] for p in store.consultar(subcategoria='ia')] == ['Post 2']
+            assert [p['titulo'] for p in store.consultar(desde='2026-03-10', ate='2026-03-31')] == ['Post 3']
+
+            fevereiro = Path('post_store/2026-02.jsonl').stat().st_mtime_ns
+            store.adicionar(_post(4, '16/03/2026 às 08:00'))
+            store.atualizar('posts/post-0003.html', titulo='Post 3 corrigido')
+            store.remover('posts/post-0002.html')
+            assert store.salvar() == ['2026-03']
+            assert Path('post_store/2026-02.jsonl').stat().st_mtime_ns == fevereiro
+
+            store = post_store.abrir()
+            assert [p['titulo'] for p in store.todos()] == ['Post 1', 'Post 3 corrigido', 'Post 4']
+            # posts fora de ordem entram no lugar certo da cronologia
+            store.adicionar(_post(5, '10/03/2026 às 08:00'))
+            assert [p['titulo'] for p in store.todos()] == ['Post 1', 'Post 5', 'Post 3 corrigido', 'Post 4']
+            assert [p['titulo'] for p in store.cronologicos(desde='2026-03', ate='2026-03-15')] == ['Post 5', 'Post 3 corrigido']
+            assert [p['titulo'] for p in store.cronologicos(recentes_primeiro=True, limite=2)] == ['Post 4', 'Post 3 corrigido']
+            store.atualizar('posts/post-0005.html', data='01/04/2026 às 08:00')
+            assert store.obter('posts/post-0005.html')['publicado_em'] == '2026-04-01T08:00:00Z'
+            assert store.todos()[-1]['titulo'] == 'Post 5' and store.meses() == ['2026-02', '2026-03', '2026-04']
+            store.remover('posts/post-0005.html')
+            assert store.salvar() == ['2026-03', '2026-04']
+            assert store.consultar(subcategoria='ia') == []
+            store.exportar_json()
+            assert [p['url'] for p in json.loads(Path('posts.json').read_text(encoding='utf-8'))][-1] == 'posts/post-0004.html'
+            # exportação automática só depois do intervalo
+            exportado = datetime.strptime(store.indice['exportado_em'], '%Y-%m-%dT%H:%M:%SZ')
+            store.adicionar(_post(6, '17/03/2026 às 08:00'))
+            assert not store.exportar_vencido(agora=exportado + timedelta(hours=1))
+            assert 'posts/post-0006.html' not in Path('posts.json').read_text(encoding='utf-8')
+            assert store.exportar_vencido(agora=exportado + timedelta(hours=post_store.EXPORTAR_A_CADA_H + 1))
+            assert 'posts/post-0006.html' in Path('posts.json').read_text(encoding='utf-8')
+            try:
+                store.adicionar(_post(4, '16/03/2026 às 08:00'))
+                assert False, 'url duplicada deveria falhar'
+            except ValueError:
+                pass
+        finally:
+            os.chdir(cwd)
+    print('  ✅ Store, consultas e export compatível\n')
+    return True
+
+
+def test_backfill_store_v1():
+    """Store da versão 1 (sem publicado_em nem cronologia) é migrado ao abrir"""
+    print('=== Teste backfill de timestamps ===')
+    with tempfile.TemporaryDirectory() as tmp:
+        pasta = Path(tmp) / 'post_store'
+        pasta.mkdir()
+        posts = [_post(1, '03/02/2026 às 03:04'), _post(2, '01/02/2026 às 09:00')]
+        (pasta / '2026-02.jsonl').write_text(''.join(json.dumps(p) + '\n' for p in posts), encoding='utf-8')
+        (pasta / 'indice.json').write_text(json.dumps({
+            'versao': 1, 'proximo_seq': 2, 'urls': {p['url']: ['2026-02', i] for i, p in enumerate(posts)},
+            'meses': {'2026-02': {'posts': 2, 'categorias': {'esportes': 2}, 'subcategorias': {}}},
+        }), encoding='utf-8')
+
+        store = post_store.abrir(pasta)
+        assert [p['publicado_em'] for p in store.todos()] == ['2026-02-01T09:00:00Z', '2026-02-03T03:04:00Z']
+        store.salvar()
+        indice = json.loads((pasta / 'indice.json').read_text(encoding='utf-8'))
+        assert indice['versao'] == post_store.VERSAO_STORE
+        assert indice['cronologia'] == ['posts/post-0002.html', 'posts/post-0001.html']
+        assert all('publicado_em' in json.loads(l) for l in (pasta / '2026-02.jsonl').read_text(encoding='utf-8').splitlines())
+    print('  ✅ Backfill e cronologia\n')
+    return True
+
+
+if __name__ == '__main__':
+    sys.exit(0 if test_store_crud_e_consultas() and test_backfill_store_v1() else 1)
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Testes para o prompt_budget.py"""
+
+import sys
+
+sys.path.insert(0, '.')
+from prompt_budget import estimar_tokens, entidades_do_titulo, selecionar_trechos
+
+
+def test_entidades_do_titulo():
+    """Extrai nomes próprios e números do título"""
+    print('=== Teste entidades_do_titulo() ===')
+    entidades = entidades_do_titulo('Flamengo vence Palmeiras por 3 a 1 no Maracanã')
+    assert {'flamengo', 'palmeiras', '3', 'maracanã'} <= entidades
+    assert 'vence' not in entidades
+    print(f'  ✅ {sorted(entidades)}\n')
+    return True
+
+
+def test_selecionar_trechos():
+    """Respeita o orçamento, mantém o lead e descarta boilerplate"""
+    print('=== Teste selecionar_trechos() ===')
+    lead = 'O Flamengo venceu o Palmeiras por 3 a 1 neste domingo no Maracanã lotado.'
+    enchimento = ' '.join(f'Frase genérica número {i} sobre assuntos diversos da rodada.' for i in range(60))
+    relevante = 'Depois do jogo, o técnico do Palmeiras reclamou da arbitragem no Maracanã.'
+    lixo = 'Assine nossa newsletter e receba as principais notícias do dia.'
+    texto = f'{lead} {lixo} {enchimento} {relevante}'
+
+    resultado = selecionar_trechos(texto, 'Flamengo vence Palmeiras no Maracanã', 120)
+    assert estimar_tokens(resultado) <= 130
+    assert resultado.startswith(lead)
+    assert relevante in resultado
+    assert 'newsletter' not in resultado
+    assert selecionar_trechos('texto curto', 'Título', 120) == 'texto curto'
+    print(f'  ✅ {estimar_tokens(texto)} -> {estimar_tokens(resultado)} tokens\n')
+    return True
+
+
+def main():
+    resultados = [test_entidades_do_titulo(), test_selecionar_trechos()]
+    return 0 if all(resultados) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
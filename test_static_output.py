@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Testes para o static_output.py"""
+
+import gzip
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, '.')
+import static_output
+
+
+def test_minificacao():
+    """Remove espaço entre blocos, mantém um espaço entre inline e preserva <pre>"""
+    print('=== Teste minificação ===')
+    html = '<!DOCTYPE html>\n<html>\n<body>\n  <nav>\n<a href="a">A</a>\n<a href="b">B</a>\n</nav>\n<!-- x -->\n<pre>  1\n  2</pre>\n</body></html>'
+    assert static_output.minificar_html(html) == (
+        '<!DOCTYPE html><html><body><nav><a href="a">A</a> <a href="b">B</a></nav><pre>  1\n  2</pre></body></html>'
+    )
+    css = '/* c */\na:hover , b > i {\n  color: red;\n  margin: 0 auto;\n}\n'
+    assert static_output.minificar_css(css) == 'a:hover,b>i{color:red;margin:0 auto}'
+    print('  ✅ HTML e CSS minificados\n')
+    return True
+
+
+def test_saida_incremental():
+    """Gera dist/ com .gz, não reescreve nada no segundo run e remove saídas órfãs"""
+    print('=== Teste dist/ incremental ===')
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            Path('posts').mkdir()
+            Path('index.html').write_text('<html>\n<body>\n<p>oi</p>\n</body></html>', encoding='utf-8')
+            Path('posts/post-0001-a.html').write_text('<p>\n post </p>', encoding='utf-8')
+            Path('style.css').write_text('a {\n color: red;\n}\n', encoding='utf-8')
+
+            tipos = static_output.gerar_saida()
+            assert Path('dist/index.html').read_text(encoding='utf-8') == '<html><body><p>oi</p></body></html>'
+            assert gzip.decompress(Path('dist/style.css.gz').read_bytes()) == b'a{color:red}'
+            assert tipos['post']['paginas'] == 1 and tipos['index']['original'] > tipos['index']['minificado']
+
+            mtime = Path('dist/index.html.gz').stat().st_mtime_ns
+            Path('index.html').touch()  # só o stat muda
+            static_output.gerar_saida()
+            assert Path('dist/index.html.gz').stat().st_mtime_ns == mtime
+
+            Path('posts/post-0001-a.html').unlink()
+            static_output.gerar_saida()
+            assert not Path('dist/posts/post-0001-a.html').exists()
+            assert not Path('dist/posts/post-0001-a.html.gz').exists()
+        finally:
+            os.chdir(cwd)
+    print('  ✅ Só o que mudou é reescrito\n')
+    return True
+
+
+if __name__ == '__main__':
+    ok = test_minificacao() and test_saida_incremental()
+    sys.exit(0 if ok else 1)
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Testes para o tema_scheduler.py (simulação com relógio e portais falsos)"""
+
+import random
+import sys
+from datetime import datetime, timedelta
+
+sys.path.insert(0, '.')
+import tema_scheduler
+
+TEMAS = [{'nome': f'Tema {i}', 'categoria': f'cat-{i}', 'sites': [f'https://t{i}-a/', f'https://t{i}-b/']} for i in range(8)]
+# chance de achar matéria por execução: tema 0 movimentado, tema 7 parado
+RENDIMENTO = [0.9, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.1]
+
+
+def _simular(execucoes):
+    sorteio = random.Random(1)
+    estado = tema_scheduler.carregar('/nao/existe.json')
+    posts = []
+    agora = datetime(2026, 5, 1, 6, 0)
+    escolhas = []
+    for _ in range(execucoes):
+        tema, motivo = tema_scheduler.escolher(estado, TEMAS, posts, agora)
+        i = TEMAS.index(tema)
+        escolhas.append(i)
+        coleta = tema_scheduler.Coleta(tema['nome'], tema_scheduler.ordenar_sites(estado, tema))
+        publicou = sorteio.random() < RENDIMENTO[i]
+        # só o portal "b" rende
+        coleta.site(tema['sites'][0], False)
+        if publicou:
+            coleta.site(tema['sites'][1], True, estoque=3)
+            posts.append({'categoria': tema['categoria'], 'publicado_em': agora.strftime('%Y-%m-%dT%H:%M:%SZ')})
+        tema_scheduler.registrar(estado, coleta, publicou, agora)
+        agora += timedelta(hours=1)
+    return estado, escolhas, posts
+
+
+def test_escolha_por_ganho():
+    """Sem histórico: uma volta em rodízio; depois, mais vezes para quem rende"""
+    print('=== Teste escolha de tema ===')
+    estado, escolhas, posts = _simular(200)
+    assert escolhas[:8] == list(range(8))
+    por_tema = [escolhas.count(i) for i in range(8)]
+    assert por_tema[0] > por_tema[7], por_tema
+    # piso de justiça: nenhum tema fica mais de PISO_RODADAS execuções sem tentativa
+    for i in range(8):
+        rodadas = [n for n, e in enumerate(escolhas) if e == i]
+        assert max(b - a for a, b in zip(rodadas, rodadas[1:])) <= tema_scheduler.PISO_RODADAS, (i, rodadas)
+    # e toda categoria recebeu conteúdo
+    assert {p['categoria'] for p in posts} == {t['categoria'] for t in TEMAS}
+
+    # portal que rende vai para a frente
+    assert tema_scheduler.ordenar_sites(estado, TEMAS[0]) == ['https://t0-b/', 'https://t0-a/']
+    print('  ✅ Escolha de tema\n')
+    return True
+
+
+def test_ganho():
+    """Post recente ou tentativa frustrada recente derrubam o ganho; estoque soma"""
+    print('=== Teste ganho esperado ===')
+    agora = datetime(2026, 5, 1, 12, 0)
+    iso = lambda d: d.strftime('%Y-%m-%dT%H:%M:%SZ')
+    faminto = tema_scheduler.ganho({}, agora - timedelta(hours=16), agora)
+    assert abs(faminto - 0.5 * 2) < 1e-9
+    assert tema_scheduler.ganho({}, agora - timedelta(hours=1), agora) < faminto
+    frustrado = {'tentativas': 1.0, 'sucessos': 0.0, 'coletado_em': iso(agora - timedelta(minutes=30))}
+    assert tema_scheduler.ganho(frustrado, agora - timedelta(hours=16), agora) < 0.1
+    com_estoque = dict(frustrado, estoque=10, coletado_em=iso(agora - timedelta(hours=4)))
+    sem_estoque = dict(frustrado, estoque=0, coletado_em=iso(agora - timedelta(hours=4)))
+    assert tema_scheduler.ganho(com_estoque, None, agora) > tema_scheduler.ganho(sem_estoque, None, agora)
+    print('  ✅ Ganho esperado\n')
+    return True
+
+
+if __name__ == '__main__':
+    resultados = [test_escolha_por_ganho(), test_ganho()]
+    sys.exit(0 if all(resultados) else 1)
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Testes para o thumbnails.py (offline: o download é trocado por leitura das imagens de fixture)"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, '.')
+import site_templates
+import thumbnails
+
+
+def test_miniaturas_e_fila():
+    """Gera WebP/JPEG por hash, monta <picture> com srcset e põe falhas na fila"""
+    print('=== Teste miniaturas ===')
+    if not thumbnails.pillow_disponivel():
+        print('  ⏭️ Pillow não instalado, pulando\n')
+        return True
+    from PIL import Image
+
+    # produção só baixa http(s); aqui a "URL" é o nome do arquivo de fixture
+    for url in ('foto.jpg', 'file:///etc/passwd'):
+        try:
+            thumbnails.baixar(url)
+            assert False, f'{url} deveria ser recusada'
+        except ValueError:
+            pass
+
+    cwd = os.getcwd()
+    original = thumbnails.baixar
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        thumbnails.baixar = lambda url: Path(url).read_bytes()
+        try:
+            Image.new('RGB', (1280, 720), (200, 30, 30)).save('foto.jpg')
+            res = thumbnails.processar(['foto.jpg', 'sumiu.jpg'])
+            assert res == {'ok': 1, 'falhas': 1}
+
+            reg = thumbnails.registro('foto.jpg')
+            assert reg['larguras'] == [320, 640, 960] and (reg['largura'], reg['altura']) == (1280, 720)
+            for w in reg['larguras']:
+                for ext in ('webp', 'jpg'):
+                    assert Path(thumbnails.caminho_thumb(reg['hash'], w, ext)).exists()
+
+            card = site_templates.imagem_card('foto.jpg', 'Título')
+            assert card.startswith('<picture><source type="image/webp"')
+            assert f'thumbs/{reg["hash"][:2]}/{reg["hash"]}-320.webp 320w' in card
+            assert 'width="640" height="360"' in card and 'sizes="' in card
+            assert site_templates.imagem_card('outra.jpg', 'T') == '<img src="outra.jpg" alt="T">'
+
+            # falha vai para a fila e só volta depois do prazo
+            fila = thumbnails._ler_json(thumbnails.FILA_JSON)
+            assert fila['sumiu.jpg']['tentativas'] == 1
+            assert thumbnails.processar_fila() == {'ok': 0, 'falhas': 0}
+            Image.new('RGB', (200, 100)).save('sumiu.jpg')
+            fila['sumiu.jpg']['proxima'] = 0
+            thumbnails.atomic_write.escrever_json(thumbnails.FILA_JSON, fila)
+            assert thumbnails.processar_fila() == {'ok': 1, 'falhas': 0}
+            assert thumbnails.registro('sumiu.jpg')['larguras'] == [200]  # nunca amplia
+            assert thumbnails._ler_json(thumbnails.FILA_JSON) == {}
+        finally:
+            thumbnails.baixar = original
+            thumbnails.indice(recarregar=True)
+            os.chdir(cwd)
+    print('  ✅ Miniaturas, srcset e fila de retentativas\n')
+    return True
+
+
+if __name__ == '__main__':
+    sys.exit(0 if test_miniaturas_e_fila() else 1)
@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Miniaturas das imagens dos posts (WebP + JPEG em algumas larguras).
+
+Uso:
+    python thumbnails.py [--workers N] [--limite N]   # backfill de todos os posts + fila de retentativas
+
+Cada imagem é baixada uma vez; as miniaturas ficam em
+thumbs/<hh>/<sha256-16>-<largura>.<webp|jpg>, endereçadas pelo hash do
+arquivo original (a mesma foto em dois posts vira um único conjunto).
+thumbs/indice.json mapeia URL original -> hash e dimensões; os cards e a
+página do post usam isso para montar <picture> com srcset/sizes e
+width/height explícitos. Sem miniatura, o HTML continua apontando para a
+imagem original, igual a antes.
+
+Downloads que falham entram em thumbs/fila.json e são tentados de novo com
+espera exponencial (1h, 2h, 4h...) até MAX_TENTATIVAS.
+
+Depende do Pillow (opcional: sem ele nada é gerado e o site segue com as
+imagens originais). Só URLs http(s) são baixadas: as URLs vêm de páginas
+raspadas, e um caminho local ou file:// nunca é lido do disco.
+"""
+
+import argparse
+import hashlib
+import io
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Iterable
+
+import atomic_write
+import post_store
+
+
+def log(msg: str) -> None:
+    print(msg, flush=True)
+
+
+THUMBS_DIR = Path("thumbs")
+INDICE_JSON = THUMBS_DIR / "indice.json"
+FILA_JSON = THUMBS_DIR / "fila.json"
+
+LARGURAS = (320, 640, 960)
+# largura usada no src/width/height do <img> (fallback sem srcset)
+LARGURA_PADRAO = 640
+# (extensão, formato do Pillow, MIME)
+FORMATOS = (("webp", "WEBP", "image/webp"), ("jpg", "JPEG", "image/jpeg"))
+QUALIDADE = 75
+
+MAX_TENTATIVAS = 5
+ESPERA_BASE_S = 3600
+TIMEOUT_DOWNLOAD = 20
+MAX_BYTES_DOWNLOAD = 25 * 1024 * 1024
+
+SIZES_CARD = "(max-width: 768px) 100vw, 340px"
+SIZES_POST = "(max-width: 800px) 100vw, 800px"
+
+_cache: tuple[str, dict[str, Any]] | None = None
+
+
+def pillow_disponivel() -> bool:
+    try:
+        import PIL  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+# --- Índice -------------------------------------------------------------------
+
+
+def _ler_json(caminho: Path) -> dict[str, Any]:
+    bruto = atomic_write.ler_texto(caminho)
+    if bruto is None:
+        return {}
+    try:
+        data = json.loads(bruto)
+        return data if isinstance(data, dict) else {}
+    except Exception:
+        return {}
+
+
+def indice(recarregar: bool = False) -> dict[str, Any]:
+    """URL original -> registro das miniaturas (carregado uma vez por diretório de trabalho)."""
+    global _cache
+    cwd = os.getcwd()
+    if recarregar or _cache is None or _cache[0] != cwd:
+        _cache = (cwd, _ler_json(INDICE_JSON))
+    return _cache[1]
+
+
+def registro(url: str | None) -> dict[str, Any] | None:
+    if not url:
+        return None
+    return indice().get(url)
+
+
+def chave(url: str | None) -> str | None:
+    """Hash das miniaturas da imagem (entra no build manifest dos cards)."""
+    reg = registro(url)
+    return reg["hash"] if reg else None
+
+
+def caminho_thumb(hash_: str, largura: int, ext: str) -> str:
+    return f"{THUMBS_DIR.as_posix()}/{hash_[:2]}/{hash_}-{largura}.{ext}"
+
+
+# --- Renderização -------------------------------------------------------------
+
+
+def html_imagem(
+    url: str | None,
+    alt: str,
+    raiz: str = "",
+    sizes: str = SIZES_CARD,
+    classe: str | None = None,
+    lazy: bool = False,
+) -> str | None:
+    """<picture> com srcset WebP/JPEG para `url`, ou None se ainda não há miniaturas."""
+    reg = registro(url)
+    if not reg:
+        return None
+    h = reg["hash"]
+    larguras = reg["larguras"]
+    srcsets = {
+        ext: ", ".join(f"{raiz}{caminho_thumb(h, w, ext)} {w}w" for w in larguras) for ext, _, _ in FORMATOS
+    }
+    padrao = max([w for w in larguras if w <= LARGURA_PADRAO] or [larguras[0]])
+    altura = round(reg["altura"] * padrao / reg["largura"])
+    fontes = "".join(
+        f'<source type="{mime}" srcset="{srcsets[ext]}" sizes="{sizes}">' for ext, _, mime in FORMATOS[:-1]
+    )
+    ext_img = FORMATOS[-1][0]
+    extra = (f' class="{classe}"' if classe else "") + (' loading="lazy"' if lazy else "")
+    return (
+        f"<picture>{fontes}"
+        f'<img src="{raiz}{caminho_thumb(h, padrao, ext_img)}" srcset="{srcsets[ext_img]}" sizes="{sizes}" '
+        f'width="{padrao}" height="{altura}" alt="{alt}"{extra}></picture>'
+    )
+
+
+# --- Download e geração -------------------------------------------------------
+
+
+def baixar(url: str) -> bytes:
+    # URLs vêm de páginas raspadas e do posts.json: nada de ler arquivo local (file://, caminhos)
+    if not url.lower().startswith(("http://", "https://")):
+        raise ValueError(f"URL de imagem não suportada: {url[:60]}")
+    import http_session  # só quem baixa paga o import de requests (as listagens só leem o índice)
+
+    with http_session.cliente().get(
+        url,
+        timeout=TIMEOUT_DOWNLOAD,
+        headers={"User-Agent": "Mozilla/5.0 (compatible; VivimundoBot/1.0)"},
+        stream=True,
+    ) as resp:
+        # `with`: a conexão volta ao pool mesmo sem ler o corpo inteiro
+        resp.raise_for_status()
+        dados = resp.raw.read(MAX_BYTES_DOWNLOAD + 1, decode_content=True)
+    if len(dados) > MAX_BYTES_DOWNLOAD:
+        raise ValueError("imagem grande demais")
+    return dados
+
+
+def gerar_thumbs(dados: bytes) -> dict[str, Any]:
+    """Escreve as miniaturas de `dados` e retorna o registro do índice."""
+    from PIL import Image, ImageOps
+
+    h = hashlib.sha256(dados).hexdigest()[:16]
+    with Image.open(io.BytesIO(dados)) as original:
+        img = ImageOps.exif_transpose(original)
+        img = img.convert("RGB")
+    largura, altura = img.size
+    # nunca amplia: larguras maiores que o original são descartadas
+    larguras = [w for w in LARGURAS if w < largura] or [largura]
+    for w in larguras:
+        redim = img.resize((w, max(1, round(altura * w / largura))), Image.LANCZOS)
+        for ext, formato, _ in FORMATOS:
+            caminho = Path(caminho_thumb(h, w, ext))
+            if caminho.exists():
+                continue
+            buf = io.BytesIO()
+            redim.save(buf, formato, quality=QUALIDADE, optimize=True)
+            atomic_write.escrever_bytes(caminho, buf.getvalue())
+    return {"hash": h, "largura": largura, "altura": altura, "larguras": larguras}
+
+
+def processar_um(url: str) -> tuple[str, dict[str, Any] | None, str | None]:
+    """Baixa e gera as miniaturas de uma URL (roda no pool). Nunca levanta exceção."""
+    try:
+        return url, gerar_thumbs(baixar(url)), None
+    except Exception as e:
+        return url, None, f"{type(e).__name__}: {str(e)[:120]}"
+
+
+def pendente(url: str, fila: dict[str, Any], agora: float) -> bool:
+    if not url or url in indice():
+        return False
+    item = fila.get(url)
+    if item is None:
+        return True
+    return item["tentativas"] < MAX_TENTATIVAS and item["proxima"] <= agora
+
+
+def processar(urls: Iterable[str | None], workers: int = 1) -> dict[str, int]:
+    """Gera miniaturas para as URLs ainda sem registro (respeitando a fila de retentativas)."""
+    if not pillow_disponivel():
+        log("  ℹ️ Pillow não instalado: miniaturas não geradas")
+        return {"ok": 0, "falhas": 0}
+
+    fila = _ler_json(FILA_JSON)
+    agora = time.time()
+    alvo = [u for u in dict.fromkeys(urls) if u and pendente(u, fila, agora)]
+    if not alvo:
+        return {"ok": 0, "falhas": 0}
+
+    if workers > 1 and len(alvo) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            resultados = list(pool.map(processar_um, alvo, chunksize=8))
+    else:
+        resultados = [processar_um(u) for u in alvo]
+
+    # índice e fila só são alterados aqui, no processo principal
+    idx = indice()
+    ok = falhas = 0
+    for url, reg, erro in resultados:
+        if reg:
+            idx[url] = reg
+            fila.pop(url, None)
+            ok += 1
+        else:
+            item = fila.setdefault(url, {"tentativas": 0, "proxima": 0, "erro": ""})
+            item["tentativas"] += 1
+            item["proxima"] = int(agora + ESPERA_BASE_S * 2 ** (item["tentativas"] - 1))
+            item["erro"] = erro
+            falhas += 1
+    atomic_write.escrever_json(INDICE_JSON, idx, ensure_ascii=False, indent=1, sort_keys=True)
+    atomic_write.escrever_json(FILA_JSON, fila, ensure_ascii=False, indent=1, sort_keys=True)
+    return {"ok": ok, "falhas": falhas}
+
+
+def garantir(url: str | None) -> bool:
+    """Miniaturas da imagem de um post novo (sem pool). True se existem ao final."""
+    if url:
+        processar([url])
+    return registro(url) is not None
+
+
+def processar_fila(limite: int = 20) -> dict[str, int]:
+    """Retenta as URLs da fila cujo prazo já venceu."""
+    fila = _ler_json(FILA_JSON)
+    agora = time.time()
+    vencidas = [u for u in sorted(fila, key=lambda u: fila[u]["proxima"]) if pendente(u, fila, agora)]
+    return processar(vencidas[:limite])
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Gera miniaturas das imagens dos posts")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--limite", type=int, default=0, help="máximo de imagens nesta execução (0 = todas)")
+    args = parser.parse_args(argv)
+
+    posts = post_store.abrir().todos()
+    fila = _ler_json(FILA_JSON)
+    agora = time.time()
+    urls = [u for u in dict.fromkeys(p.get("imagem") for p in reversed(posts)) if u and pendente(u, fila, agora)]
+    if args.limite:
+        urls = urls[: args.limite]
+
+    inicio = time.perf_counter()
+    res = processar(urls, workers=args.workers)
+    log(f"✅ Miniaturas: {res['ok']} geradas, {res['falhas']} falhas em {time.perf_counter() - inicio:.1f}s "
+        f"({args.workers} processo(s)) | fila: {len(_ler_json(FILA_JSON))}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())